@@ -0,0 +1,9 @@
+"""Benchmarks for nothing-cli.
+
+The suite, over a synthetic catalog of whichever size:
+
+    python -m benchmarks [--size small|medium|large] [--output results.json]
+                         [--baseline baseline.json]
+
+The older one-off scripts still run on their own, see fast_loader.py and
+compiled_cache.py."""
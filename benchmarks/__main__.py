@@ -0,0 +1,6 @@
+"""python -m benchmarks"""
+import sys
+
+from .suite import main
+
+sys.exit(main())
@@ -0,0 +1,121 @@
+"""Cold vs warm `not do` startup on a 500-step Procedure.
+
+Cold means no compiled Procedure exists yet, so the file goes through ruamel and
+pydantic. Warm means the compiled cache is hit.
+
+    python benchmarks/compiled_cache.py [--steps 500] [--rounds 20]
+"""
+import argparse
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+from statistics import median
+from time import perf_counter
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO_ROOT))
+
+# pylint: disable=wrong-import-position
+from nothing_cli.compiled import load_procedure  # noqa: E402
+from nothing_cli.constants import CACHE_DIRECTORY_NAME  # noqa: E402
+
+# the `do` subcommand, minus the part where a human presses enter
+DO_UNTIL_FIRST_PROMPT = """
+from nothing_cli.main import app
+try:
+    app(["do", "big"])
+except BaseException:
+    pass
+"""
+
+
+def write_big_procedure(dot_nothing: Path, steps: int) -> Path:
+    """A Procedure with `steps` steps, a little context and a few knowns"""
+
+    body = "\n\n".join(
+        f"  Step number {i} of the rollout, for {{service}} in {{region}}.\n"
+        f"  kubectl rollout status deploy/{{service}}-{i}"
+        for i in range(steps)
+    )
+    path = dot_nothing / "big.yml"
+    path.write_text(
+        "title: A very big Procedure\n"
+        "description: Benchmark fodder\n"
+        "knowns:\n  - region: us-east-1\n"
+        "context:\n  - __service: Which service?\n"
+        f"steps: |-\n{body}\n"
+    )
+
+    return path
+
+
+def time_in_process(path: Path, rounds: int, cold: bool) -> float:
+    """Median seconds for load_procedure()"""
+
+    timings = []
+    for _ in range(rounds):
+        if cold:
+            shutil.rmtree(str(path.parent / CACHE_DIRECTORY_NAME), ignore_errors=True)
+        start = perf_counter()
+        load_procedure(path)
+        timings.append(perf_counter() - start)
+
+    return median(timings)
+
+
+def time_subprocess(home: Path, rounds: int, cold: bool) -> float:
+    """Median seconds for a whole `not do big` up to its first prompt"""
+
+    env = {**os.environ, "HOME": str(home), "PYTHONPATH": str(REPO_ROOT)}
+    timings = []
+    for _ in range(rounds):
+        if cold:
+            shutil.rmtree(
+                str(home / ".nothing" / CACHE_DIRECTORY_NAME), ignore_errors=True
+            )
+        start = perf_counter()
+        subprocess.run(
+            [sys.executable, "-c", DO_UNTIL_FIRST_PROMPT],
+            cwd=str(home),
+            env=env,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            check=False,
+        )
+        timings.append(perf_counter() - start)
+
+    return median(timings)
+
+
+def main():
+    """Print a little table of results"""
+
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--steps", type=int, default=500)
+    parser.add_argument("--rounds", type=int, default=20)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        home = Path(tmp)
+        dot_nothing = home / ".nothing"
+        dot_nothing.mkdir()
+        path = write_big_procedure(dot_nothing, args.steps)
+
+        results = {
+            "load_procedure, cold": time_in_process(path, args.rounds, cold=True),
+            "load_procedure, warm": time_in_process(path, args.rounds, cold=False),
+            "`not do`, cold": time_subprocess(home, args.rounds, cold=True),
+            "`not do`, warm": time_subprocess(home, args.rounds, cold=False),
+        }
+
+    width = max(map(len, results))
+    for label, seconds in results.items():
+        print(f"{label.ljust(width)}  {seconds * 1000:8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""Synthetic catalogs of Procedures, shaped like the ones people actually write.
+
+Most Procedures are a handful of steps with a little context. Every so often there's
+a monster runbook with thousands of them. The catalog is split between a cwd and a
+home .nothing directory, with some names in both so that shadowing gets exercised.
+The same size and seed always make the same catalog."""
+import random
+from pathlib import Path
+from typing import Dict, NamedTuple
+
+# how many Procedures each size of catalog has
+SIZES: Dict[str, int] = {"small": 10, "medium": 1_000, "large": 100_000}
+MOST_STEPS = 10_000
+# one in this many Procedures is a monster, with MOST_STEPS steps
+MONSTER_EVERY = 1_000
+# and the rest have at most this many, spread log-uniformly
+TYPICAL_MOST_STEPS = 100
+# the share of Procedures that go in home, and that share a name with one in cwd
+HOME_SHARE = 0.2
+SHADOWED_SHARE = 0.05
+
+
+class Corpus(NamedTuple):
+    cwd: Path  # the .nothing dir in cwd
+    home: Path  # the .nothing dir in home
+    biggest: Path  # the Procedure with the most steps
+    procedures: int
+
+
+def step_count(rng: random.Random, n: int) -> int:
+    """Steps for the `n`th Procedure. The first one is always a monster, so every
+    size of catalog has one to measure"""
+
+    if n % MONSTER_EVERY == 0:
+        return MOST_STEPS
+
+    return int(TYPICAL_MOST_STEPS ** rng.random())
+
+
+def procedure_text(rng: random.Random, n: int, steps: int) -> str:
+    """A YAML Procedure, with anywhere from no context or knowns to a few of each"""
+
+    context = [f"  - var_{n}_{i}" for i in range(rng.randint(0, 2))] + [
+        f"  - __lazy_{n}_{i}: What is lazy thing {i}?" for i in range(rng.randint(0, 2))
+    ]
+    knowns = [f"  - known_{n}_{i}: value {i}" for i in range(rng.randint(0, 3))]
+    names = [line.strip(" -").split(":")[0] for line in context + knowns]
+
+    body = "\n\n".join(
+        f"  Step {i} of procedure {n}"
+        + (f", using {{{names[i % len(names)]}}}" if names else "")
+        + f".\n  echo {i}"
+        for i in range(steps)
+    )
+
+    return (
+        f"title: Procedure number {n}\n"
+        f"description: {rng.choice(['', 'Benchmark fodder', 'A runbook'])}\n"
+        + (f"context:\n{chr(10).join(context)}\n" if context else "")
+        + (f"knowns:\n{chr(10).join(knowns)}\n" if knowns else "")
+        + f"steps: |-\n{body}\n"
+    )
+
+
+def generate(root: Path, size: str, seed: int = 0) -> Corpus:
+    """Write a catalog under `root`, or reuse the one that's already there"""
+
+    procedures = SIZES[size]
+    cwd = root / "cwd" / ".nothing"
+    home = root / "home" / ".nothing"
+    biggest = cwd / "procedure-0.yml"
+    done = root / f".{size}-{seed}"
+
+    if done.exists():
+        return Corpus(cwd, home, biggest, procedures)
+
+    cwd.mkdir(parents=True, exist_ok=True)
+    home.mkdir(parents=True, exist_ok=True)
+    rng = random.Random(seed)
+
+    for n in range(procedures):
+        text = procedure_text(rng, n, step_count(rng, n))
+        where = rng.random()
+
+        if n and where < SHADOWED_SHARE:
+            (home / f"procedure-{n}.yml").write_text(text)
+            (cwd / f"procedure-{n}.yml").write_text(text)
+        elif n and where < HOME_SHARE:
+            (home / f"procedure-{n}.yml").write_text(text)
+        else:
+            (cwd / f"procedure-{n}.yml").write_text(text)
+
+    done.touch()
+
+    return Corpus(cwd, home, biggest, procedures)
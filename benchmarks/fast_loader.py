@@ -0,0 +1,94 @@
+"""ruamel vs the fast loader, over every file in a large catalog.
+
+Both load the raw fields of each Procedure; the last row is the whole
+deserialize_procedure_file(), which picks the fast loader when it can.
+
+    python benchmarks/fast_loader.py [--procedures 2000] [--steps 20] [--rounds 5]
+"""
+import argparse
+import sys
+import tempfile
+from pathlib import Path
+from statistics import median
+from time import perf_counter
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO_ROOT))
+
+# pylint: disable=wrong-import-position
+from nothing_cli import fastload  # noqa: E402
+from nothing_cli.filesystem import deserialize_procedure_file, yml  # noqa: E402
+
+
+def write_catalog(dot_nothing: Path, procedures: int, steps: int):
+    """`procedures` Procedure files shaped like the ones `not new` writes"""
+
+    body = "\n\n".join(
+        f"  Step {i}, for {{service}} in {{region}}.\n  kubectl get pods -n {{region}}"
+        for i in range(steps)
+    )
+    for n in range(procedures):
+        (dot_nothing / f"procedure-{n}.yml").write_text(
+            f"title: Procedure number {n}\n"
+            f"steps: |-\n{body}\n"
+            "description: Benchmark fodder\n"
+            "context:\n  - service\n  - region: Which region?\n"
+            "knowns:\n  - cluster: prod\n"
+        )
+
+
+def time_loading(paths, load, rounds: int) -> float:
+    """Median seconds to run `load` over every path"""
+
+    contents = [path.read_bytes() for path in paths]
+    timings = []
+    for _ in range(rounds):
+        start = perf_counter()
+        for content in contents:
+            load(content)
+        timings.append(perf_counter() - start)
+
+    return median(timings)
+
+
+def time_deserializing(paths, rounds: int) -> float:
+    """Median seconds to deserialize every path into a Procedure"""
+
+    timings = []
+    for _ in range(rounds):
+        start = perf_counter()
+        for path in paths:
+            deserialize_procedure_file(path)
+        timings.append(perf_counter() - start)
+
+    return median(timings)
+
+
+def main():
+    """Print a little table of results"""
+
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--procedures", type=int, default=2000)
+    parser.add_argument("--steps", type=int, default=20)
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        dot_nothing = Path(tmp)
+        write_catalog(dot_nothing, args.procedures, args.steps)
+        paths = sorted(dot_nothing.glob("*.yml"))
+
+        results = {
+            "ruamel": time_loading(paths, yml().load, args.rounds),
+            "fastload": time_loading(paths, fastload.load, args.rounds),
+            "deserialize_procedure_file": time_deserializing(paths, args.rounds),
+        }
+
+    width = max(map(len, results))
+    for label, seconds in results.items():
+        print(f"{label.ljust(width)}  {seconds * 1000:9.2f} ms")
+    print(f"{'speedup'.ljust(width)}  {results['ruamel'] / results['fastload']:9.1f} x")
+
+
+if __name__ == "__main__":
+    main()
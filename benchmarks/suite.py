@@ -0,0 +1,346 @@
+"""Timings for the parts of `not` that people wait on, over a synthetic catalog.
+
+Each benchmark runs `--rounds` times and reports the median and the fastest round.
+Results can be written out as JSON and compared against a saved run: anything
+that got slower than the baseline by more than `--tolerance` is flagged, and the
+exit status is 1 if anything was.
+
+    python -m benchmarks --size medium --output before.json
+    python -m benchmarks --size medium --baseline before.json
+
+The catalog is kept in `--corpus` between runs, since the large one takes a
+while to write out (and about half a gigabyte of disk)."""
+import argparse
+import io
+import json
+import os
+import platform
+import shutil
+import subprocess
+import sys
+import tempfile
+from contextlib import contextmanager, redirect_stdout
+from pathlib import Path
+from statistics import median
+from time import perf_counter
+from typing import Callable, Dict, Iterator, List, Optional
+
+from .corpus import SIZES, Corpus, generate
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO_ROOT))
+
+# pylint: disable=wrong-import-position,import-outside-toplevel
+from nothing_cli import completion, filesystem  # noqa: E402
+from nothing_cli import main as not_main  # noqa: E402
+from nothing_cli.constants import CACHE_DIRECTORY_NAME  # noqa: E402
+
+# how many typical Procedures deserialize_procedure_file is timed over
+SAMPLE = 200
+# how many rows of answers render_rows is timed over
+ROWS = 1_000
+
+IMPORT_MAIN = """
+from time import perf_counter
+start = perf_counter()
+import nothing_cli.main
+print(perf_counter() - start)
+"""
+
+Benchmark = Callable[[Corpus, int], List[float]]
+BENCHMARKS: Dict[str, Benchmark] = {}
+
+
+def benchmark(name: str) -> Callable[[Benchmark], Benchmark]:
+    """Add a function to the suite. It returns the seconds each round took"""
+
+    def register(func: Benchmark) -> Benchmark:
+        BENCHMARKS[name] = func
+        return func
+
+    return register
+
+
+def rounds_of(
+    func: Callable[[], object], rounds: int, setup: Optional[Callable] = None
+) -> List[float]:
+    """Seconds for each call of `func`, not counting `setup` before each one"""
+
+    timings = []
+    for _ in range(rounds):
+        if setup is not None:
+            setup()
+        start = perf_counter()
+        func()
+        timings.append(perf_counter() - start)
+
+    return timings
+
+
+@contextmanager
+def pointed_at(corpus: Corpus) -> Iterator[None]:
+    """`not`, in this process, looking at the corpus instead of the real cwd and home"""
+
+    patched = [
+        (module, name, getattr(module, name))
+        for module in (filesystem, not_main, completion)
+        for name in ("CWD_DOT_NOTHING_DIR", "HOME_DOT_NOTHING_DIR")
+    ]
+    state = filesystem.state
+
+    for module, name, _ in patched:
+        setattr(module, name, corpus.cwd if name.startswith("CWD") else corpus.home)
+    filesystem.state = filesystem.initstate()
+
+    try:
+        yield
+    finally:
+        for module, name, value in patched:
+            setattr(module, name, value)
+        filesystem.state = state
+
+
+def clear_caches(corpus: Corpus) -> None:
+    """Forget every index, completion file and compiled Procedure"""
+
+    for dot_nothing in (corpus.cwd, corpus.home):
+        shutil.rmtree(str(dot_nothing / CACHE_DIRECTORY_NAME), ignore_errors=True)
+
+
+@benchmark("import nothing_cli.main")
+def import_main(corpus: Corpus, rounds: int) -> List[float]:
+    env = {
+        **os.environ,
+        "HOME": str(corpus.home.parent),
+        "PYTHONPATH": str(REPO_ROOT),
+    }
+
+    return [
+        float(
+            subprocess.run(
+                [sys.executable, "-c", IMPORT_MAIN],
+                cwd=str(corpus.cwd.parent),
+                env=env,
+                stdout=subprocess.PIPE,
+                check=True,
+            ).stdout
+        )
+        for _ in range(rounds)
+    ]
+
+
+@benchmark("initstate")
+def initstate(corpus: Corpus, rounds: int) -> List[float]:
+    return rounds_of(filesystem.initstate, rounds)
+
+
+def typical(corpus: Corpus) -> Path:
+    """The first Procedure that isn't the monster, the same for a given corpus"""
+
+    return sorted(corpus.cwd.glob("*.yml"))[1]
+
+
+@benchmark("deserialize_procedure_file, typical")
+def deserialize_typical(corpus: Corpus, rounds: int) -> List[float]:
+    paths = sorted(corpus.cwd.glob("*.yml"))[1 : SAMPLE + 1]  # noqa: E203
+
+    def deserialize_sample():
+        for path in paths:
+            filesystem.deserialize_procedure_file(path)
+
+    # per Procedure, so catalogs of any size compare
+    return [
+        seconds / max(len(paths), 1)
+        for seconds in rounds_of(deserialize_sample, rounds)
+    ]
+
+
+@benchmark("deserialize_procedure_file, biggest")
+def deserialize_biggest(corpus: Corpus, rounds: int) -> List[float]:
+    return rounds_of(
+        lambda: filesystem.deserialize_procedure_file(corpus.biggest), rounds
+    )
+
+
+def complete_everything():
+    from nothing_cli.subcommand_shared import procedure_name_completions
+
+    list(procedure_name_completions(""))
+
+
+@benchmark("procedure_name_completions, cold index")
+def completions_cold(corpus: Corpus, rounds: int) -> List[float]:
+    return rounds_of(complete_everything, rounds, setup=lambda: clear_caches(corpus))
+
+
+@benchmark("procedure_name_completions, warm index")
+def completions_warm(corpus: Corpus, rounds: int) -> List[float]:
+    complete_everything()
+
+    return rounds_of(complete_everything, rounds)
+
+
+@benchmark("show_fancy_list")
+def fancy_list(corpus: Corpus, rounds: int) -> List[float]:
+    from nothing_cli.theatrics import show_fancy_list
+
+    def show_quietly():
+        with redirect_stdout(io.StringIO()):
+            show_fancy_list()
+
+    show_quietly()  # warm the index, `not ls` times the listing not the parsing
+
+    return rounds_of(show_quietly, rounds)
+
+
+@benchmark("show_dossier, typical")
+def dossier(corpus: Corpus, rounds: int) -> List[float]:
+    from nothing_cli.theatrics import show_dossier
+
+    name = typical(corpus).stem
+
+    def show_quietly():
+        with redirect_stdout(io.StringIO()):
+            show_dossier(name)
+
+    show_quietly()  # warm the index, as for `not ls`
+
+    return rounds_of(show_quietly, rounds)
+
+
+@benchmark("render_rows, typical")
+def render(corpus: Corpus, rounds: int) -> List[float]:
+    from nothing_cli import batch
+
+    procedure = filesystem.deserialize_procedure_file(typical(corpus))
+    answers = dict.fromkeys(batch.BatchRenderer(procedure).required, "an answer")
+
+    # per row, compiling the Procedure again each round like a fresh `not render`
+    return [
+        seconds / ROWS
+        for seconds in rounds_of(
+            lambda: list(batch.render_rows(procedure, [answers] * ROWS)),
+            rounds,
+            setup=batch._renderers.clear,  # pylint: disable=protected-access
+        )
+    ]
+
+
+@benchmark("InterpolationStore, biggest")
+def interpolation_store(corpus: Corpus, rounds: int) -> List[float]:
+    from nothing_cli import theatrics
+
+    procedure = filesystem.deserialize_procedure_file(corpus.biggest)
+    ask = theatrics.ask
+    theatrics.ask = lambda question, **kwargs: "an answer"
+
+    def walk_through():
+        store = theatrics.InterpolationStore(procedure)
+        for i in range(len(procedure.steps)):
+            store.render(i)
+
+    try:
+        return rounds_of(walk_through, rounds)
+    finally:
+        theatrics.ask = ask
+
+
+@benchmark("writer.write, biggest")
+def write(corpus: Corpus, rounds: int) -> List[float]:
+    from nothing_cli import writer
+
+    procedure = filesystem.deserialize_procedure_file(corpus.biggest)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        procedure.path = Path(tmp) / corpus.biggest.name
+        return rounds_of(lambda: writer.write(procedure, force=True), rounds)
+
+
+def run(corpus: Corpus, rounds: int, only: Optional[List[str]] = None) -> Dict:
+    """Every benchmark, or just the ones named in `only`"""
+
+    results = {}
+
+    with pointed_at(corpus):
+        for name, func in BENCHMARKS.items():
+            if only and name not in only:
+                continue
+            timings = func(corpus, rounds)
+            results[name] = {
+                "median": median(timings),
+                "min": min(timings),
+                "rounds": len(timings),
+            }
+
+    return results
+
+
+def compare(results: Dict, baseline: Dict) -> Dict[str, float]:
+    """How many times slower each benchmark got, for those in both runs"""
+
+    return {
+        name: result["median"] / baseline[name]["median"]
+        for name, result in results.items()
+        if name in baseline and baseline[name]["median"]
+    }
+
+
+def report(results: Dict, ratios: Dict[str, float], tolerance: float) -> bool:
+    """Print a table of results. True if anything got too much slower"""
+
+    width = max(map(len, results))
+    regressed = False
+
+    for name, result in results.items():
+        line = f"{name.ljust(width)}  {result['median'] * 1000:10.3f} ms"
+        if name in ratios:
+            slower = ratios[name] > 1 + tolerance
+            regressed = regressed or slower
+            line += f"  {ratios[name]:6.2f}x" + ("  SLOWER" if slower else "")
+        print(line)
+
+    return regressed
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Run the suite, print a table, maybe write and compare JSON"""
+
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--size", choices=list(SIZES), default="small")
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--corpus", type=Path, help="keep the catalog here")
+    parser.add_argument("--only", action="append", choices=list(BENCHMARKS))
+    parser.add_argument("--output", type=Path, help="write results as JSON")
+    parser.add_argument("--baseline", type=Path, help="JSON from an earlier run")
+    parser.add_argument("--tolerance", type=float, default=0.25)
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = args.corpus or Path(tmp)
+        corpus = generate(root / f"{args.size}-{args.seed}", args.size, args.seed)
+        results = run(corpus, args.rounds, args.only)
+
+    output = {
+        "meta": {
+            "size": args.size,
+            "procedures": corpus.procedures,
+            "seed": args.seed,
+            "rounds": args.rounds,
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+        },
+        "results": results,
+    }
+
+    if args.output:
+        args.output.write_text(json.dumps(output, indent=2) + "\n")
+
+    ratios = {}
+    if args.baseline:
+        baseline = json.loads(args.baseline.read_text())
+        if baseline["meta"]["size"] != args.size:
+            print(f"the baseline is for a {baseline['meta']['size']} catalog")
+        ratios = compare(results, baseline["results"])
+
+    return 1 if report(results, ratios, args.tolerance) else 0
@@ -0,0 +1,121 @@
+"""Serialization backends: how a Procedure file with a given extension is read and
+written.
+
+Every backend deals in the raw fields of a Procedure, the same dict a YAML file
+loads into, `steps` being one block of text. Nothing in here imports more than
+the standard library until a backend is actually used, since discovery and
+completion need the extensions and nothing else."""
+
+import io
+import json
+from functools import lru_cache
+from pathlib import Path
+from typing import TYPE_CHECKING, Callable, Dict, NamedTuple, Tuple
+
+if TYPE_CHECKING:  # pragma: no cover
+    from ruamel.yaml import YAML
+
+# what every .notb file starts with. the last byte is the version of the format:
+# 1 was marshal, which no other Python could read; 2 is compact UTF-8 JSON
+BINARY_MAGIC = b"NOTB\x02"
+
+
+class Backend(NamedTuple):
+    name: str
+    extensions: Tuple[str, ...]  # the first one is used for new files
+    load: Callable[[bytes], Dict]
+    dump: Callable[[Dict], bytes]
+    editable: bool = True  # whether it makes sense to open in $EDITOR
+
+
+BACKENDS: Dict[str, Backend] = {}
+
+
+def register(backend: Backend) -> Backend:
+    """Make files with the backend's extensions count as Procedures"""
+
+    BACKENDS[backend.name] = backend
+
+    return backend
+
+
+def extensions() -> Tuple[str, ...]:
+    """Every extension a Procedure file can have"""
+
+    return tuple(ext for backend in BACKENDS.values() for ext in backend.extensions)
+
+
+def for_path(path: Path) -> Backend:
+    """The backend for a Procedure file, by its extension"""
+
+    for backend in BACKENDS.values():
+        if path.suffix in backend.extensions:
+            return backend
+
+    raise ValueError(f"No backend for {path.suffix} files")
+
+
+# pylint: disable=import-outside-toplevel
+def _load_yaml(content: bytes) -> Dict:
+    from .filesystem import load_fields
+
+    return load_fields(content)
+
+
+@lru_cache(maxsize=None)
+def _yaml_dumper() -> "YAML":
+    from ruamel.yaml import YAML
+
+    dumper = YAML()
+    dumper.indent(mapping=2, sequence=4, offset=2)
+
+    return dumper
+
+
+def _dump_yaml(fields: Dict) -> bytes:
+    from ruamel.yaml.scalarstring import LiteralScalarString
+
+    if "steps" in fields:
+        fields = {**fields, "steps": LiteralScalarString(fields["steps"])}
+
+    stream = io.StringIO()
+    _yaml_dumper().dump(fields, stream)
+
+    return stream.getvalue().encode("utf-8")
+
+
+def _load_json(content: bytes) -> Dict:
+    return json.loads(content.decode("utf-8"))
+
+
+def _dump_json(fields: Dict) -> bytes:
+    return (json.dumps(fields, indent=2, ensure_ascii=False) + "\n").encode("utf-8")
+
+
+def _load_binary(content: bytes) -> Dict:
+    if content[: len(BINARY_MAGIC) - 1] != BINARY_MAGIC[:-1]:
+        raise ValueError("Not a .notb file")
+    if content[: len(BINARY_MAGIC)] != BINARY_MAGIC:
+        raise ValueError(
+            f".notb format {content[len(BINARY_MAGIC) - 1]} isn't "
+            f"{BINARY_MAGIC[-1]}, convert the original Procedure again"
+        )
+
+    fields = json.loads(content[len(BINARY_MAGIC) :].decode("utf-8"))  # noqa: E203
+    if not isinstance(fields, dict):
+        raise ValueError("A .notb file holds the fields of one Procedure")
+
+    return fields
+
+
+def _dump_binary(fields: Dict) -> bytes:
+    return BINARY_MAGIC + json.dumps(
+        fields, ensure_ascii=False, separators=(",", ":")
+    ).encode("utf-8")
+
+
+YAML_BACKEND = register(Backend("yaml", (".yml", ".yaml"), _load_yaml, _dump_yaml))
+JSON_BACKEND = register(Backend("json", (".json",), _load_json, _dump_json))
+BINARY_BACKEND = register(
+    Backend("binary", (".notb",), _load_binary, _dump_binary, editable=False)
+)
@@ -0,0 +1,264 @@
+"""Headless `not do`: every variable answered up front, every step rendered at once.
+
+Answers come from `--set name=value` flags, an answers file (JSON or YAML), or
+stdin. Stdin can also hold JSON lines, one set of answers per line, which renders
+the Procedure once per line without paying for a new process each time.
+
+`not render` takes that further: rows of answers from a CSV or JSON lines file,
+rendered a chunk at a time, optionally across a pool of processes."""
+import csv
+import json
+from collections import deque
+from itertools import count, islice
+from pathlib import Path
+from typing import (
+    TYPE_CHECKING,
+    Deque,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    TextIO,
+    Tuple,
+)
+
+from .constants import STEP_SEPARATOR
+from .templates import compile_steps
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .models import Procedure
+
+Answers = Dict[str, object]
+
+
+class MissingVariables(Exception):
+    """Some step needs a variable that no answer, and no known, has a value for"""
+
+    def __init__(self, names: Iterable[str], row: Optional[int] = None):
+        self.names: List[str] = sorted(names)
+        self.row: Optional[int] = row  # for `not render`, which row it was
+        super().__init__(", ".join(self.names))
+
+    def __reduce__(self):
+        # so it makes it back from a worker process in one piece
+        return MissingVariables, (self.names, self.row)
+
+
+class BadAnswers(ValueError):
+    """Answers that aren't a mapping of names to values"""
+
+
+def parse_assignments(assignments: Iterable[str]) -> Answers:
+    """`name=value` pairs, as given to --set"""
+
+    answers: Answers = {}
+
+    for assignment in assignments:
+        name, equals, value = assignment.partition("=")
+        if not equals or not name:
+            raise BadAnswers(assignment)
+        answers[name] = value
+
+    return answers
+
+
+def _mapping(parsed) -> Answers:
+    if not isinstance(parsed, dict):
+        raise BadAnswers(f"expected a mapping of names to values, not {parsed!r}")
+
+    return dict(parsed)
+
+
+def parse_answers(text: str) -> List[Answers]:
+    """Sets of answers from a stream: a single JSON or YAML mapping,
+    or JSON lines with one mapping per line"""
+
+    # pylint: disable=import-outside-toplevel
+    from ruamel.yaml import YAMLError
+
+    from .filesystem import load_fields
+
+    lines = [line for line in text.splitlines() if line.strip()]
+
+    if len(lines) > 1 and all(line.lstrip().startswith("{") for line in lines):
+        try:
+            return [_mapping(json.loads(line)) for line in lines]
+        except ValueError as err:
+            raise BadAnswers(str(err))
+
+    if not lines:
+        return [{}]
+
+    try:
+        return [_mapping(load_fields(text))]
+    except YAMLError as err:
+        raise BadAnswers(str(err))
+
+
+def read_answers(path: Path) -> Answers:
+    """The answers in a JSON or YAML file"""
+
+    answers = parse_answers(path.read_text())
+
+    if len(answers) != 1:
+        raise BadAnswers(f"{path} holds more than one set of answers")
+
+    return answers[0]
+
+
+class BatchRenderer:
+    """A Procedure's steps, compiled once and rendered for any number of answers"""
+
+    def __init__(self, procedure: "Procedure"):
+        self.templates = compile_steps(procedure)
+        self.knowns: Answers = {
+            name: value for known in procedure.knowns for name, value in known.items()
+        }
+        self.required: Set[str] = set().union(*(t.names for t in self.templates))
+
+    def check(self, answers: Answers) -> None:
+        """Raise MissingVariables unless every step could be rendered"""
+
+        missing = self.required.difference(self.knowns, answers)
+
+        if missing:
+            raise MissingVariables(missing)
+
+    def render(self, answers: Answers) -> str:
+        """Every step, filled in and separated the way they are in a Procedure file"""
+
+        self.check(answers)
+        values = {**self.knowns, **answers}
+
+        return STEP_SEPARATOR.join(t.render(values) for t in self.templates) + "\n"
+
+
+# renderers by the Procedure they were compiled from, which they keep alive so its
+# id can't be reused. a Procedure that stays loaded (see compiled.keep_loaded) is
+# only ever compiled once
+_renderers: Dict[int, Tuple["Procedure", BatchRenderer]] = {}
+RENDERERS_KEPT = 64
+
+
+def renderer_for(procedure: "Procedure") -> BatchRenderer:
+    """The BatchRenderer for a Procedure, compiled the first time it's asked for"""
+
+    kept = _renderers.get(id(procedure))
+
+    if kept is None or kept[0] is not procedure:
+        if len(_renderers) >= RENDERERS_KEPT:
+            _renderers.clear()
+        kept = _renderers[id(procedure)] = (procedure, BatchRenderer(procedure))
+
+    return kept[1]
+
+
+def render_all(
+    procedure: "Procedure",
+    answer_sets: List[Answers],
+    overrides: Optional[Answers] = None,
+) -> str:
+    """The rendered steps for every set of answers, with `overrides` (--set) taking
+    precedence. Nothing is rendered unless every set of answers is complete."""
+
+    renderer = renderer_for(procedure)
+    answer_sets = [{**answers, **(overrides or {})} for answers in answer_sets]
+
+    for answers in answer_sets:
+        renderer.check(answers)
+
+    return "\n".join(renderer.render(answers) for answers in answer_sets)
+
+
+ROWS_PER_CHUNK = 64
+CHUNKS_IN_FLIGHT_PER_JOB = 2
+
+
+def read_rows(
+    stream: TextIO, kind: str
+) -> Tuple[Optional[List[str]], Iterator[Answers]]:
+    """The column names, if `kind` is "csv", and the rows of answers as they're read"""
+
+    if kind == "csv":
+        reader = csv.DictReader(stream)
+        return list(reader.fieldnames or []), iter(reader)
+
+    def json_rows() -> Iterator[Answers]:
+        for number, line in enumerate(iter(stream.readline, ""), 1):
+            if line.strip():
+                try:
+                    yield _mapping(json.loads(line))
+                except ValueError as err:
+                    raise BadAnswers(f"line {number}: {err}")
+
+    return None, json_rows()
+
+
+def render_chunk(
+    renderer: BatchRenderer, first_row: int, rows: List[Answers]
+) -> List[str]:
+    """One document per row. Rows are numbered from `first_row`"""
+
+    rendered = []
+
+    for row, answers in zip(count(first_row), rows):
+        try:
+            rendered.append(renderer.render(answers))
+        except MissingVariables as err:
+            raise MissingVariables(err.names, row=row)
+
+    return rendered
+
+
+_worker_renderer: Optional[BatchRenderer] = None
+
+
+def _start_worker(procedure: "Procedure") -> None:
+    global _worker_renderer  # pylint: disable=global-statement
+    _worker_renderer = BatchRenderer(procedure)
+
+
+def _render_chunk_in_worker(first_row: int, rows: List[Answers]) -> List[str]:
+    return render_chunk(_worker_renderer, first_row, rows)
+
+
+def render_rows(
+    procedure: "Procedure",
+    rows: Iterable[Answers],
+    jobs: int = 1,
+    rows_per_chunk: int = ROWS_PER_CHUNK,
+) -> Iterator[Tuple[Answers, str]]:
+    """Each row, with its rendered document, in the order of the rows.
+
+    With more than one job, chunks of rows are handed to a pool of processes, each
+    of which compiles the Procedure once. Rows are read as they're needed and only
+    a couple of chunks per process are ever pending, so any number of rows fits."""
+
+    rows = iter(rows)
+    chunks = zip(
+        count(1, rows_per_chunk), iter(lambda: list(islice(rows, rows_per_chunk)), [])
+    )
+
+    if jobs <= 1:
+        renderer = renderer_for(procedure)
+        for first_row, chunk in chunks:
+            yield from zip(chunk, render_chunk(renderer, first_row, chunk))
+        return
+
+    from multiprocessing import Pool  # pylint: disable=import-outside-toplevel
+
+    with Pool(jobs, initializer=_start_worker, initargs=(procedure,)) as pool:
+        pending: Deque = deque()
+
+        for first_row, chunk in chunks:
+            rendering = pool.apply_async(_render_chunk_in_worker, (first_row, chunk))
+            pending.append((chunk, rendering))
+            if len(pending) >= jobs * CHUNKS_IN_FLIGHT_PER_JOB:
+                chunk, rendering = pending.popleft()
+                yield from zip(chunk, rendering.get())
+
+        while pending:
+            chunk, rendering = pending.popleft()
+            yield from zip(chunk, rendering.get())
@@ -0,0 +1,245 @@
+"""A catalog of Procedures that keeps itself up to date.
+
+ProcedureState is a snapshot: good for the one command a run of `not` carries
+out, stale as soon as anything is written. A Catalog starts out the same way, but
+a process that sticks around (a daemon, an editor integration, a TUI) can have it
+watch its .nothing dirs (see watch.py) and call refresh() before it answers
+anything. Only what changed is dealt with: a file that appeared is added, one
+that's gone is removed and one that was written is re-summarized in the catalog
+index. Nothing else is listed, stat'ed or parsed again.
+
+Commands that change files themselves tell the catalog with add(), remove(),
+rename() or invalidate(), so whatever they do next in the same process sees the
+change without a rescan. Only the changed file is stat'ed and summarized. The
+catalog index on disk hears about changes when they're saved, once per command
+or when the catalog is closed, with one write per directory however many files
+changed. That goes for files outside the catalog's directories too."""
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from . import backends, index
+from .discovery import ProcedureState, procedure_files
+
+
+class Catalog(ProcedureState):
+    """The Procedure files in some directories, earlier directories shadowing later
+    ones, along with their catalog index entries once they're asked for"""
+
+    # pylint: disable=super-init-not-called
+    def __init__(self, directories: Iterable[Path]):
+        self.watched: Tuple[Path, ...] = tuple(directories)
+        self.watcher = None
+        self._files: Dict[Path, Dict[str, Path]] = {}  # directory: filename: path
+        self._by_name: Dict[str, List[Path]] = {}  # winner first, then the shadowed
+        self._paths: Optional[Tuple[Path, ...]] = None
+        self._summaries: Optional[Dict[Path, Dict]] = None
+        # directory: files added, changed or removed there since the last save
+        self._unsaved: Dict[Path, Set[Path]] = {}
+
+        self.rescan()
+
+    def __enter__(self) -> "Catalog":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    @property
+    def paths(self) -> Tuple[Path, ...]:  # type: ignore
+        if self._paths is None:
+            self._paths = tuple(
+                path for files in self._files.values() for path in files.values()
+            )
+
+        return self._paths
+
+    @property
+    def directories(self) -> Tuple[Path, ...]:  # type: ignore
+        return tuple(directory for directory in self.watched if directory.is_dir())
+
+    def location(self, name: str) -> Optional[Path]:
+        """Where the Procedure called `name` lives"""
+
+        paths = self._by_name.get(name)
+
+        return paths[0] if paths else None
+
+    def shadowed(self, name: str) -> List[Path]:
+        """Other files named `name` that lose out to location(name)"""
+
+        return self._by_name.get(name, [])[1:]
+
+    def summaries(self) -> Dict[Path, Dict]:
+        """Catalog index entries for every Procedure, in the same order as `paths`"""
+
+        if self._summaries is None:
+            self._summaries = index.summaries(self.paths, directories=self.directories)
+
+        return {
+            path: self._summaries[path]
+            for path in self.paths
+            if path in self._summaries
+        }
+
+    def summary(self, path: Path) -> Dict:
+        """The catalog index entry for one Procedure file, from memory once
+        summaries() has been asked for"""
+
+        if self._summaries is not None and path in self._summaries:
+            return self._summaries[path]
+
+        return index.summary(path)
+
+    def rescan(self) -> None:
+        """Forget everything and look at every directory again"""
+
+        self._files = {
+            directory: {
+                path.name: path
+                for path in (procedure_files(directory) if directory.is_dir() else ())
+            }
+            for directory in self.watched
+        }
+        self._paths = None
+        self._summaries = None
+        self._by_name = {}
+        for path in self.paths:
+            self._by_name.setdefault(path.stem, []).append(path)
+
+    def watch(self, polling: Optional[bool] = None) -> "Catalog":
+        """Start following changes to the directories, see watch.watcher_for"""
+
+        from .watch import watcher_for  # pylint: disable=import-outside-toplevel
+
+        if self.watcher is None:
+            self.watcher = watcher_for(self.watched, polling)
+
+        return self
+
+    def refresh(self, timeout: float = 0.0) -> Set[Path]:
+        """Apply whatever changed since the last refresh, waiting up to `timeout`
+        seconds for something to. The Procedure files that changed come back"""
+
+        if self.watcher is None:
+            return set()
+
+        changes = self.watcher.changes(timeout)
+
+        if changes.rescan:
+            before = set(self.paths)
+            self.rescan()
+            return before.symmetric_difference(self.paths)
+
+        return {path for path in changes.paths if self.invalidate(path)}
+
+    def invalidate(self, path: Path) -> bool:
+        """Bring the catalog in line with whatever `path` is now, returning whether
+        it's a Procedure file that was or is in one of the directories"""
+
+        if path.suffix not in backends.extensions():
+            return False
+
+        if path.is_file():
+            self.add(path)
+            return path.parent in self._files
+
+        return self.remove(path)
+
+    def add(self, path: Path) -> None:
+        """A Procedure file was written: new, or over an old one"""
+
+        files = self._files.get(path.parent)
+
+        if files is not None and path.name not in files:
+            files[path.name] = path
+            self._named(path)
+            self._paths = None
+
+        if files is not None and self._summaries is not None:
+            self._summaries[path] = index.entry(path)
+
+        self._unsaved.setdefault(path.parent, set()).add(path)
+
+    def remove(self, path: Path) -> bool:
+        """A Procedure file was deleted. Returns whether it was in the catalog"""
+
+        self._unsaved.setdefault(path.parent, set()).add(path)
+
+        files = self._files.get(path.parent)
+        if files is None or path.name not in files:
+            return False
+
+        del files[path.name]
+        self._by_name[path.stem].remove(path)
+        self._paths = None
+        if self._summaries is not None:
+            self._summaries.pop(path, None)
+
+        return True
+
+    def rename(self, old: Path, new: Path) -> None:
+        """A Procedure file was moved from `old` to `new`"""
+
+        self.remove(old)
+        self.add(new)
+
+    def save(self) -> None:
+        """Bring the catalog index on disk in line with every add, remove and
+        rename since the last save"""
+
+        for directory, changed in self._unsaved.items():
+            if not directory.is_dir():
+                continue
+
+            files = self._files.get(directory)
+            names = (
+                set(files)
+                if files is not None
+                else {path.name for path in procedure_files(directory)}
+            )
+
+            catalog_index = index.CatalogIndex(directory)
+            catalog_index.prune(names)
+            for path in changed:
+                if path.name in names:
+                    self._save_entry(catalog_index, path)
+            catalog_index.save()
+
+        self._unsaved = {}
+
+    def _save_entry(self, catalog_index: index.CatalogIndex, path: Path) -> None:
+        entry = (self._summaries or {}).get(path)
+
+        if entry is not None:
+            catalog_index.update(path, entry["stat"], entry)
+            return
+
+        try:
+            catalog_index.summary(path)
+        except OSError:  # gone again, behind our back
+            catalog_index.forget(path.name)
+
+    def _named(self, path: Path) -> None:
+        """File a new path under its name, behind any in the same or an earlier
+        directory, ahead of any in a later one"""
+
+        rank = self.watched.index(path.parent)
+        paths = self._by_name.setdefault(path.stem, [])
+        position = next(
+            (
+                i
+                for i, other in enumerate(paths)
+                if self.watched.index(other.parent) > rank
+            ),
+            len(paths),
+        )
+        paths.insert(position, path)
+
+    def close(self) -> None:
+        """Save, and stop watching"""
+
+        self.save()
+
+        if self.watcher is not None:
+            self.watcher.close()
+            self.watcher = None
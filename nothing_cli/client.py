@@ -0,0 +1,219 @@
+"""The `not` entry point: hands the command to `not serve` if it's running, runs it
+right here if not.
+
+Nothing but the standard library in here. When a daemon is serving the current
+directory and the command is one it answers (see server.py), this is all of `not`
+that gets imported. The arguments go over the daemon's Unix socket as a line of
+JSON, and what comes back is what the command would have printed and its exit
+code. Otherwise, including when the daemon can't be reached for any reason, serves
+some other directory, or takes too long to answer, the command runs in this
+process like it always has.
+
+Sockets live in a directory only their owner can get into, and the client won't
+talk to a socket (or in a directory) belonging to anybody else. Otherwise another
+user could get there first and be handed every command and piped-in answer."""
+import io
+import json
+import os
+import socket
+import sys
+import tempfile
+from hashlib import sha1
+from pathlib import Path
+from stat import S_ISDIR
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from .constants import SOCKET_VAR
+
+# what the daemon answers. anything that might prompt stays in process
+SERVED_COMMANDS = ("ls", "info", "stats", "render")
+# `do` doesn't prompt with any of these
+BATCH_OPTIONS = ("--batch", "--set", "--answers")
+# the short options of `do`, and which of them take a value
+DO_SHORT_OPTIONS = {
+    "b": "--batch",
+    "s": "--set",
+    "a": "--answers",
+    "r": "--run",
+    "t": "--timeout",
+    "j": "--jobs",
+}
+DO_VALUE_OPTIONS = ("--set", "--answers", "--timeout", "--jobs")
+
+CONNECT_TIMEOUT = 1.0  # seconds
+# a daemon that's taken longer than this is taken to be stuck
+ANSWER_TIMEOUT = 60.0  # seconds
+READ_SIZE = 64 * 1024
+
+
+def socket_directory() -> Path:
+    """Where this user's daemons keep their sockets"""
+
+    directory = os.environ.get("XDG_RUNTIME_DIR") or tempfile.gettempdir()
+
+    return Path(directory) / f"not-{os.getuid()}"
+
+
+def socket_path(cwd: Optional[str] = None) -> Path:
+    """Where the daemon for `cwd` listens: one per directory, and per user"""
+
+    if os.environ.get(SOCKET_VAR):
+        return Path(os.environ[SOCKET_VAR])
+
+    digest = sha1(os.fsencode(cwd or os.getcwd())).hexdigest()[:16]
+
+    return socket_directory() / f"{digest}.sock"
+
+
+def private(path: Path) -> bool:
+    """Whether `path` belongs to this user, and, for a directory, whether nobody
+    else can get into it. A missing path isn't private"""
+
+    try:
+        status = os.lstat(str(path))
+    except OSError:
+        return False
+
+    if status.st_uid != os.getuid():
+        return False
+
+    return not (S_ISDIR(status.st_mode) and status.st_mode & 0o077)
+
+
+def do_options(options: List[str]) -> Iterator[Tuple[str, Optional[str]]]:
+    """The options given to `do`, however they're spelled, as (long name, value)"""
+
+    remaining = iter(options)
+
+    for option in remaining:
+        if option == "--":
+            return
+
+        if option.startswith("--"):
+            name, equals, value = option.partition("=")
+            if name not in DO_VALUE_OPTIONS:
+                yield name, None
+            else:
+                yield name, value if equals else next(remaining, None)
+            continue
+
+        if not option.startswith("-") or option == "-":
+            continue
+
+        # bundled short options, like -ba- for --batch --answers -
+        for position, letter in enumerate(option[1:], 2):
+            name = DO_SHORT_OPTIONS.get(letter, f"-{letter}")
+            if name in DO_VALUE_OPTIONS:
+                yield name, option[position:] or next(remaining, None)
+                break
+            yield name, None
+
+
+def served(argv: List[str]) -> bool:
+    """Whether the daemon answers this command"""
+
+    if not argv:
+        return False
+
+    command, options = argv[0], argv[1:]
+
+    if command == "do":
+        return any(name in BATCH_OPTIONS for name, _ in do_options(options))
+
+    return command in SERVED_COMMANDS
+
+
+def reads_stdin(argv: List[str]) -> bool:
+    """Whether a served command reads stdin: the answers of `do --answers -`,
+    or the rows of `render <name> -`"""
+
+    command, options = argv[0], argv[1:]
+
+    if command == "do":
+        return ("--answers", "-") in do_options(options)
+
+    return command == "render" and "-" in options
+
+
+def request(message: Dict) -> Optional[Dict]:
+    """Send one request to the daemon and wait for the answer, or None if there's
+    no daemon, it didn't answer, or it's serving another directory"""
+
+    location = socket_path()
+
+    # no socket is the common case, and cheaper to find out than connecting
+    if not private(location) or (
+        not os.environ.get(SOCKET_VAR) and not private(location.parent)
+    ):
+        return None
+
+    try:
+        message = {**message, "cwd": os.getcwd()}
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as connection:
+            connection.settimeout(CONNECT_TIMEOUT)
+            connection.connect(str(location))
+            connection.settimeout(ANSWER_TIMEOUT)
+            connection.sendall(json.dumps(message).encode() + b"\n")
+            connection.shutdown(socket.SHUT_WR)
+
+            chunks = []
+            for chunk in iter(lambda: connection.recv(READ_SIZE), b""):
+                chunks.append(chunk)
+
+        response = json.loads(b"".join(chunks))
+    except (OSError, ValueError):
+        return None
+
+    return None if "refused" in response else response
+
+
+def locate(name: str) -> Optional[str]:
+    """Where the Procedure called `name` lives, asking the daemon if there is one.
+    For editor integrations and the like, which want an answer fast"""
+
+    response = request({"locate": name})
+
+    if response is not None:
+        return response["stdout"] or None
+
+    # pylint: disable=import-outside-toplevel
+    from .filesystem import procedure_location
+
+    location = procedure_location(name)
+
+    return None if location is None else str(location)
+
+
+def _respond(response: Dict) -> None:
+    sys.stdout.write(response["stdout"])
+    sys.stderr.write(response["stderr"])
+    sys.stdout.flush()
+    sys.exit(response["code"])
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """`not`, by way of the daemon when there is one"""
+
+    args = sys.argv[1:] if argv is None else argv
+
+    if served(args):
+        stdin = None
+        if reads_stdin(args) and not sys.stdin.isatty():
+            stdin = sys.stdin.read()
+
+        response = request(
+            {
+                "argv": args,
+                "stdin": stdin,
+                "color": sys.stdout.isatty(),
+                "plain": bool(os.environ.get("NO_COLOR")),
+            }
+        )
+        if response is not None:
+            _respond(response)
+        if stdin is not None:  # read already, but the command still needs it
+            sys.stdin = io.StringIO(stdin)
+
+    from .main import app  # pylint: disable=import-outside-toplevel
+
+    app(args)
@@ -0,0 +1,123 @@
+"""Compiled Procedures: already-validated Procedure fields, cached next to the
+files they came from. Think __pycache__, but for .nothing dirs.
+
+The cache is keyed by a hash of the file's content, so an edit is noticed no matter
+what happened to its mtime. A hit builds the Procedure without going through ruamel
+or pydantic validation at all; a miss does the full parse and refreshes the cache.
+
+Only read-only paths (`do`, mostly) should go through here,
+anything that writes Procedures still wants the round-trip loader."""
+
+import marshal
+from hashlib import sha1
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, Optional
+
+from .constants import CACHE_DIRECTORY_NAME, COMPILED_DIRECTORY_NAME
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .models import Procedure
+
+COMPILED_EXT = ".marshal"
+
+# Procedures already loaded, by path. Only kept by processes that hear about
+# changes to files themselves (see server.py), which can then skip even reading them
+_loaded: Optional[Dict[Path, "Procedure"]] = None
+
+
+def compiled_location(procedure_path: Path, digest: str) -> Path:
+    """Where the compiled form of this exact content of this file lives"""
+
+    return (
+        procedure_path.parent
+        / CACHE_DIRECTORY_NAME
+        / COMPILED_DIRECTORY_NAME
+        / f"{procedure_path.name}.{digest}{COMPILED_EXT}"
+    )
+
+
+def _filename_of(location: Path) -> str:
+    """The filename of the Procedure a compiled file belongs to"""
+
+    return location.name[: -len(COMPILED_EXT)].rsplit(".", 1)[0]
+
+
+def read_compiled(location: Path) -> Optional[Dict]:
+    """The cached fields, if there are any usable ones"""
+
+    try:
+        fields = marshal.loads(location.read_bytes())
+    except (OSError, EOFError, ValueError, TypeError):
+        return None
+
+    return fields if isinstance(fields, dict) else None
+
+
+def write_compiled(location: Path, fields: Dict) -> None:
+    """Cache the fields, replacing whatever was cached for older versions of the file.
+    Fields that marshal can't handle (ruamel's fancy scalar types, mostly) just
+    don't get cached, and neither does anything in a directory we can't write to."""
+
+    try:
+        blob = marshal.dumps(fields)
+    except ValueError:
+        return
+
+    filename = _filename_of(location)
+
+    try:
+        location.parent.mkdir(parents=True, exist_ok=True)
+        for outdated in location.parent.iterdir():
+            if _filename_of(outdated) == filename:
+                outdated.unlink()
+        location.write_bytes(blob)
+    except OSError:
+        pass
+
+
+def keep_loaded() -> None:
+    """Hold on to every Procedure loaded from here on, until it's forgotten"""
+
+    global _loaded  # pylint: disable=global-statement
+
+    if _loaded is None:
+        _loaded = {}
+
+
+def forget(procedure_path: Path) -> None:
+    """The file changed, load it again next time"""
+
+    if _loaded is not None:
+        _loaded.pop(procedure_path, None)
+
+
+def load_procedure(procedure_path: Path) -> "Procedure":
+    """Drop-in for filesystem.deserialize_procedure_file() that skips parsing and
+    validation whenever the file hasn't changed since it was last compiled"""
+
+    if _loaded is None:
+        return _load_procedure(procedure_path)
+
+    procedure = _loaded.get(procedure_path)
+    if procedure is None:
+        procedure = _loaded[procedure_path] = _load_procedure(procedure_path)
+
+    return procedure
+
+
+# pylint: disable=import-outside-toplevel
+def _load_procedure(procedure_path: Path) -> "Procedure":
+    from .filesystem import deserialize_procedure
+    from .models import Procedure
+
+    content = procedure_path.read_bytes()
+    location = compiled_location(procedure_path, sha1(content).hexdigest())
+    fields = read_compiled(location)
+
+    if fields is not None:
+        return Procedure.construct(path=procedure_path, **fields)
+
+    procedure = deserialize_procedure(content, procedure_path)
+    write_compiled(location, procedure.dict(exclude={"path"}))
+
+    return procedure
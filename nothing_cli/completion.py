@@ -0,0 +1,223 @@
+"""Completion of Procedure names, fed by the catalog index rather than by YAML.
+
+Prefix lookups go through a sorted array of names, which is exactly the leaf order
+of a prefix trie: every prefix maps to one contiguous run, found with two bisects.
+That gives trie lookups without having to build (or load) a trie's worth of
+nodes on every [TAB], which would cost more than the lookup saves.
+
+Substring lookups, over both names and titles, can use a trigram index.
+Building one only pays off for a completer that answers many queries, like a
+long-lived process, so it's opt-in. Otherwise it's a plain scan, which for
+10k Procedures is still a few milliseconds.
+
+Fastest of all is not starting Python. Every .nothing dir keeps a plain text
+completion file, one `name<TAB>description` per line, which the shell
+completion functions in shell/ read directly. Python only gets involved when
+that file is missing or older than its directory. Even then it goes through
+main() below, the `not-complete` entry point, which only imports the discovery
+code and the index. All of `not` (typer, theatrics, pydantic...) never loads.
+"""
+
+import os
+import sys
+from bisect import bisect_left
+from collections import defaultdict
+from pathlib import Path
+from typing import Dict, Iterable, List, NamedTuple, Optional, Set, Tuple
+
+from .constants import (
+    CACHE_DIRECTORY_NAME,
+    COMPLETIONS_FILENAME,
+    CWD_DOT_NOTHING_DIR,
+    HOME_DOT_NOTHING_DIR,
+    MISSING_INFO_PALCEHOLDER,
+)
+
+NGRAM_SIZE = 3
+
+
+class Completable(NamedTuple):
+    name: str
+    title: str
+    description: str
+
+
+def ngrams(text: str) -> Set[str]:
+    """Every run of NGRAM_SIZE characters in text"""
+
+    return {"".join(chars) for chars in zip(*(text[i:] for i in range(NGRAM_SIZE)))}
+
+
+class CompletionIndex:
+    """Answers "which Procedures could the user mean by this" for [TAB] [TAB].
+
+    Names that show up more than once (a local Procedure shadowing a global one)
+    are only completed once, for the first one given."""
+
+    def __init__(self, completables: Iterable[Completable], use_ngrams=False):
+        unique: Dict[str, Completable] = {}
+        for completable in completables:
+            unique.setdefault(completable.name, completable)
+
+        self.completables: List[Completable] = sorted(
+            unique.values(), key=lambda c: c.name.lower()
+        )
+        self.folded_names: List[str] = [c.name.lower() for c in self.completables]
+        self.folded_titles: List[str] = [c.title.lower() for c in self.completables]
+        self._postings: Optional[Dict[str, Set[int]]] = None
+
+        if use_ngrams:
+            self._build_postings()
+
+    def _build_postings(self) -> None:
+        postings: Dict[str, Set[int]] = defaultdict(set)
+
+        for i, texts in enumerate(zip(self.folded_names, self.folded_titles)):
+            for gram in ngrams(texts[0]) | ngrams(texts[1]):
+                postings[gram].add(i)
+
+        self._postings = dict(postings)
+
+    def prefixed(self, prefix: str) -> range:
+        """Positions of every name starting with `prefix`"""
+
+        prefix = prefix.lower()
+        start = bisect_left(self.folded_names, prefix)
+        stop = bisect_left(self.folded_names, prefix + "\U0010ffff", lo=start)
+
+        return range(start, stop)
+
+    def containing(self, fragment: str) -> List[int]:
+        """Positions of every Procedure whose name or title contains `fragment`"""
+
+        fragment = fragment.lower()
+        candidates: Iterable[int] = range(len(self.completables))
+
+        if self._postings is not None and len(fragment) >= NGRAM_SIZE:
+            grams = ngrams(fragment)
+            candidates = sorted(
+                set.intersection(*(self._postings.get(gram, set()) for gram in grams))
+            )
+
+        return [
+            i
+            for i in candidates
+            if fragment in self.folded_names[i] or fragment in self.folded_titles[i]
+        ]
+
+    def complete(self, incomplete: str) -> List[Tuple[str, str]]:
+        """(name, 'description') pairs for every match,
+        prefix matches first and then anything else containing `incomplete`"""
+
+        by_prefix = self.prefixed(incomplete)
+        by_substring = (i for i in self.containing(incomplete) if i not in by_prefix)
+
+        return [
+            (
+                self.completables[i].name,
+                f"'{self.completables[i].description or MISSING_INFO_PALCEHOLDER}'",
+            )
+            for matches in (by_prefix, by_substring)
+            for i in matches
+        ]
+
+
+def completables_from_entries(entries: Iterable[Dict]) -> List[Completable]:
+    """Catalog index entries, boiled down further"""
+
+    return [
+        Completable(
+            entry["name"], entry.get("title") or "", entry.get("description") or ""
+        )
+        for entry in entries
+    ]
+
+
+def completion_file_location(directory: Path) -> Path:
+    """Where the shell looks for the completions of the Procedures in `directory`"""
+
+    return directory / CACHE_DIRECTORY_NAME / COMPLETIONS_FILENAME
+
+
+def completion_file_is_stale(directory: Path) -> bool:
+    """The same check the shell does: a missing file, or one older than the
+    directory. Adding, removing or renaming a Procedure bumps the directory's mtime."""
+
+    try:
+        written = os.stat(str(completion_file_location(directory))).st_mtime_ns
+    except OSError:
+        return True
+
+    return os.stat(str(directory)).st_mtime_ns > written
+
+
+def completion_lines(completions: Iterable[Tuple[str, str]]) -> str:
+    """The completion file format. Descriptions are squashed onto one line."""
+
+    return "".join(
+        f"{name}\t{' '.join(description.split())}\n"
+        for name, description in completions
+    )
+
+
+def write_completion_file(directory: Path, completables: Iterable[Completable]):
+    """(Re)write the completion file for `directory`. Quietly gives up on
+    directories we can't write to, the shell will fall back to asking Python."""
+
+    location = completion_file_location(directory)
+    temporary = location.with_name(f".{COMPLETIONS_FILENAME}.{os.getpid()}")
+    contents = completion_lines(CompletionIndex(completables).complete(""))
+
+    try:
+        location.parent.mkdir(exist_ok=True)
+        temporary.write_text(contents)
+        os.replace(str(temporary), str(location))
+    except OSError:
+        pass
+
+
+SHELLS = ("bash", "zsh", "fish")
+
+
+def shell_script(shell: str, commands: List[str], procedure_commands: List[str]):
+    """The completion script for `shell`, with the subcommands of `not` filled in.
+    `procedure_commands` are the ones that take a Procedure name."""
+
+    template_location = Path(__file__).resolve().parent / "shell" / f"not.{shell}"
+    template = template_location.read_text()
+
+    return (
+        template.replace("@COMMANDS@", " ".join(commands))
+        .replace("@PROCEDURE_COMMANDS@", " ".join(procedure_commands))
+        .replace("@PROCEDURE_COMMAND_PATTERN@", "|".join(procedure_commands))
+    )
+
+
+# pylint: disable=import-outside-toplevel
+def main(argv: Optional[List[str]] = None) -> None:
+    """`not-complete [INCOMPLETE]`: print what the completion file would hold,
+    narrowed down to `INCOMPLETE`. What the shell falls back on when a completion
+    file is missing or stale. `not serve` answers if it's running, otherwise only
+    a Procedure that changed gets parsed."""
+
+    from .client import request
+    from .discovery import discover
+    from .index import summaries
+
+    args = sys.argv[1:] if argv is None else argv
+    incomplete = args[0] if args else ""
+
+    response = request({"complete": incomplete})
+    if response is not None:
+        sys.stdout.write(response["stdout"])
+        return
+
+    state = discover(CWD_DOT_NOTHING_DIR, HOME_DOT_NOTHING_DIR)
+    entries = summaries(state.paths, directories=state.directories).values()
+    completions = CompletionIndex(completables_from_entries(entries))
+
+    sys.stdout.write(completion_lines(completions.complete(incomplete)))
+
+
+if __name__ == "__main__":
+    main()
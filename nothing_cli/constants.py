@@ -4,8 +4,8 @@
 from pathlib import Path
 
 STEP_SEPARATOR: str = "\n\n"
+# the extension of new Procedures. see backends.py for every other one
 PROCEDURE_EXT: str = ".yml"
-PROCEDURE_EXT_GLOB: str = r".y[am]l"  # allow 'yaml' for that 1 roll-your-own weirdo
 LAZY_CONTEXT_PREFIX: str = "__"
 MISSING_INFO_PALCEHOLDER = "-"
 
@@ -15,3 +15,21 @@ HOME: Path = Path.home()
 DOT_NOTHING_DIRECTORY_NAME: str = ".nothing"
 CWD_DOT_NOTHING_DIR: Path = CWD / DOT_NOTHING_DIRECTORY_NAME
 HOME_DOT_NOTHING_DIR: Path = HOME / DOT_NOTHING_DIRECTORY_NAME
+
+# like __pycache__, but for .nothing dirs. holds derived data that's safe to delete
+CACHE_DIRECTORY_NAME: str = "__notcache__"
+INDEX_FILENAME: str = "index.json"
+COMPILED_DIRECTORY_NAME: str = "compiled"
+COMPLETIONS_FILENAME: str = "completions"  # read straight from the shell, see shell/
+RUNS_DIRECTORY_NAME: str = "runs"  # journals of `not do`, see journal.py
+HISTORY_FILENAME: str = "history.sqlite3"  # dwell times for `not stats`
+
+# how many files it takes before they're loaded with a pool of workers, see loader.py
+PARALLEL_LOADING_THRESHOLD: int = 64
+PARALLEL_LOADING_THRESHOLD_VAR: str = "NOT_PARALLEL_THRESHOLD"
+
+# set it to watch .nothing dirs by polling even where inotify works, see watch.py
+WATCH_POLLING_VAR: str = "NOT_WATCH_POLLING"
+
+# where `not serve` listens, instead of a socket named after the cwd, see client.py
+SOCKET_VAR: str = "NOT_SOCKET"
@@ -0,0 +1,86 @@
+"""Finding Procedure files, and resolving Procedure names to them.
+
+Nothing but the standard library in here, so that code paths which only need to
+know what Procedures exist (shell completion, mostly) stay cheap to import."""
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple, Union
+
+from . import backends
+
+
+class ProcedureState:
+    """The Procedure files found in cwd and home, in that order, plus a name index
+    over them that gets built the first time anybody looks something up.
+
+    Call it to get the paths, for backwards compatibility with the plain
+    closure it used to be."""
+
+    def __init__(self, paths: Tuple[Path, ...], directories: Tuple[Path, ...] = ()):
+        self.paths: Tuple[Path, ...] = paths
+        self.directories: Tuple[Path, ...] = directories
+        self._locations: Optional[Dict[str, Path]] = None
+        self._shadowed: Dict[str, List[Path]] = {}
+
+    def __call__(self, iterator=False) -> Union[Iterator[Path], Tuple[Path, ...]]:
+        return iter(self.paths) if iterator else self.paths
+
+    def _index(self) -> Dict[str, Path]:
+        """Name -> path. The first path with a given name wins, and since cwd is
+        globbed before home, local Procedures shadow global ones."""
+
+        if self._locations is None:
+            self._locations = {}
+
+            for path in self.paths:
+                winner = self._locations.setdefault(path.stem, path)
+
+                if winner != path:
+                    self._shadowed.setdefault(path.stem, []).append(path)
+
+        return self._locations
+
+    def location(self, name: str) -> Optional[Path]:
+        """Where the Procedure called `name` lives"""
+
+        return self._index().get(name)
+
+    def shadowed(self, name: str) -> List[Path]:
+        """Other files named `name` that lose out to location(name)"""
+
+        self._index()
+
+        return self._shadowed.get(name, [])
+
+
+def procedure_files(directory: Path) -> Iterator[Path]:
+    """Every Procedure file directly inside `directory`"""
+
+    exts = backends.extensions()
+
+    return (path for path in directory.glob("*") if path.suffix in exts)
+
+
+def discover(*directories: Path) -> ProcedureState:
+    """The Procedures in whichever of `directories` exist.
+    Order matters, Procedures in earlier directories shadow later ones."""
+
+    existing_directories: Tuple[Path, ...] = tuple(
+        directory for directory in directories if directory.is_dir()
+    )
+    existing_procedures: Tuple[Path, ...] = tuple(
+        path
+        for directory in existing_directories
+        for path in procedure_files(directory)
+    )
+
+    return ProcedureState(existing_procedures, existing_directories)
+
+
+def without_procedure_ext(name_or_filename: str) -> str:
+    """The name of a Procedure, whether or not it was given with an extension"""
+
+    for ext in backends.extensions():
+        if name_or_filename.endswith(ext):
+            return name_or_filename[: -len(ext)]
+
+    return name_or_filename
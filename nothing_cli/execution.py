@@ -0,0 +1,151 @@
+"""Running the commands in steps, for `not do --run`.
+
+A step whose last line starts with `$ ` has a command `not` can run itself:
+
+    Check that every pod came back
+    $ kubectl get pods -n {namespace}
+
+Ending the command with ` &` declares the step independent: it doesn't need the
+steps before it to have finished, and they don't need it. A run of consecutive
+independent steps has its commands run all at once, as many at a time as the
+concurrency limit allows. Each command gets its own timeout. Output is streamed
+line by line while the commands run."""
+import asyncio
+import os
+import signal
+from typing import Callable, List, NamedTuple, Optional
+
+COMMAND_PREFIX = "$ "
+INDEPENDENT_SUFFIX = " &"
+DEFAULT_JOBS = 4
+
+
+class Command(NamedTuple):
+    step: int
+    text: str  # without the $ or the &
+    independent: bool
+
+
+class Result(NamedTuple):
+    step: int
+    returncode: Optional[int]  # None if it timed out
+    timed_out: bool = False
+
+    @property
+    def ok(self) -> bool:
+        """Whether the command finished, and happily"""
+
+        return self.returncode == 0
+
+
+# what's done with each line of output: step, line (no newline), from stderr?
+OnLine = Callable[[int, str, bool], None]
+
+
+def command_for(step: int, rendered_step: str) -> Optional[Command]:
+    """The command on the last line of a rendered step, if it has one"""
+
+    last_line = rendered_step.rstrip("\n").rsplit("\n", 1)[-1].strip()
+
+    if not last_line.startswith(COMMAND_PREFIX):
+        return None
+
+    text = last_line[len(COMMAND_PREFIX) :].strip()  # noqa: E203
+    # `a&` is the shell's own business, only ` &` is ours
+    independent = text.endswith(INDEPENDENT_SUFFIX)
+    if independent:
+        text = text[: -len(INDEPENDENT_SUFFIX)].rstrip()
+
+    return Command(step, text, independent) if text else None
+
+
+async def _stream(
+    stream: asyncio.StreamReader, step: int, err: bool, on_line: OnLine
+) -> None:
+    while True:
+        line = await stream.readline()
+        if not line:
+            return
+        on_line(step, line.decode(errors="replace").rstrip("\r\n"), err)
+
+
+def _kill(process: asyncio.subprocess.Process) -> None:
+    try:
+        if hasattr(os, "killpg"):
+            os.killpg(process.pid, signal.SIGKILL)
+        else:
+            process.kill()
+    except ProcessLookupError:  # it finished just in time after all
+        pass
+
+
+async def run_command(
+    command: Command,
+    on_line: OnLine,
+    timeout: Optional[float] = None,
+    limit: Optional[asyncio.Semaphore] = None,
+) -> Result:
+    """Run one command in a shell, streaming its output to `on_line`"""
+
+    if limit is not None:
+        async with limit:
+            return await run_command(command, on_line, timeout)
+
+    process = await asyncio.create_subprocess_shell(
+        command.text,
+        stdin=asyncio.subprocess.DEVNULL,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+        # its own process group, so a timeout can stop whatever the shell started
+        start_new_session=hasattr(os, "killpg"),
+    )
+    streams = asyncio.gather(
+        _stream(process.stdout, command.step, False, on_line),
+        _stream(process.stderr, command.step, True, on_line),
+        process.wait(),
+    )
+
+    try:
+        await asyncio.wait_for(streams, timeout)
+    except asyncio.TimeoutError:
+        _kill(process)
+        await process.wait()
+
+        return Result(command.step, None, timed_out=True)
+
+    return Result(command.step, process.returncode)
+
+
+async def _run_all(
+    commands: List[Command], on_line: OnLine, timeout: Optional[float], jobs: int
+) -> List[Result]:
+    # made here and not in run_commands, so it belongs to the running loop on 3.6
+    limit = asyncio.Semaphore(max(jobs, 1))
+
+    return list(
+        await asyncio.gather(
+            *(run_command(command, on_line, timeout, limit) for command in commands)
+        )
+    )
+
+
+def run_commands(
+    commands: List[Command],
+    on_line: OnLine,
+    timeout: Optional[float] = None,
+    jobs: Optional[int] = None,
+) -> List[Result]:
+    """Run the commands concurrently, at most `jobs` (or DEFAULT_JOBS) at a time,
+    and wait for all of them. Results are in the same order as the commands."""
+
+    loop = asyncio.new_event_loop()
+    # before 3.8 the child watcher only knows about the current loop
+    asyncio.set_event_loop(loop)
+
+    try:
+        return loop.run_until_complete(
+            _run_all(commands, on_line, timeout, jobs or DEFAULT_JOBS)
+        )
+    finally:
+        asyncio.set_event_loop(None)
+        loop.close()
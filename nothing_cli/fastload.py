@@ -0,0 +1,271 @@
+"""A loader for the little corner of YAML that Procedure files live in.
+
+Procedure files are a mapping of scalars (`title`, `description`), block lists
+of scalars or single-key mappings (`context`, `knowns`) and one literal block
+(`steps`). That's all this understands, and it's a lot quicker at it than
+ruamel, which has the whole spec to worry about.
+
+Anything it isn't sure about (flow collections, anchors, tags, multi-line plain
+scalars, scalars YAML would read as numbers or booleans...) makes load()
+return None, and the caller should ask ruamel instead. When it does return
+something, it's exactly what ruamel would have."""
+
+import re
+from typing import Dict, List, Optional, Union
+
+KEY = re.compile(r"^(?P<indent> *)(?P<key>[A-Za-z_][A-Za-z0-9_-]*):(?P<rest>| .*)$")
+ITEM = re.compile(r"^(?P<indent> *)- (?P<rest>.*)$")
+INLINE_KEY = re.compile(r"^(?P<key>[A-Za-z_][A-Za-z0-9_-]*):(?P<rest>| .*)$")
+LITERAL = re.compile(r"^\|(?P<chomping>[-+]?)(?: +#.*)?$")
+SINGLE_QUOTED = re.compile(r"^'(?P<text>(?:[^']|'')*)'(?: +#.*)?$")
+DOUBLE_QUOTED = re.compile(r'^"(?P<text>[^"\\]*)"(?: +#.*)?$')
+
+# what the YAML reader refuses to read, plus line breaks other than \n
+UNUSUAL_CHARACTERS = re.compile(
+    "[^\x09\x0a\x20-\x7e\xa0-\u2027\u202a-\ud7ff\ue000-\ufefe\uff00-\ufffd"
+    "\U00010000-\U0010ffff]"
+)
+# plain scalars starting with these are indicators, numbers, or worse
+UNSAFE_PLAIN_START = set("-?:,[]{}#&*!|>'\"%@`+.~=0123456789")
+# plain scalars that YAML reads as something other than a string, in any version
+NOT_STRINGS = {"true", "false", "yes", "no", "on", "off", "y", "n", "null"}
+
+
+class Unsupported(Exception):
+    """Raised internally when the document strays from the subset"""
+
+
+def is_plain_string(text: str) -> bool:
+    """Whether YAML would read this plain scalar as the string it looks like"""
+
+    return bool(
+        text
+        and text[0] not in UNSAFE_PLAIN_START
+        and text.lower() not in NOT_STRINGS
+        and ": " not in text
+        and not text.endswith(":")
+        and not re.search(r"\s#", text)
+        and "\t" not in text
+    )
+
+
+def indentation(line: str) -> int:
+    """The number of leading spaces"""
+
+    return len(line) - len(line.lstrip(" "))
+
+
+def ignorable(line: str) -> bool:
+    """Blank lines and comments"""
+
+    stripped = line.strip(" ")
+
+    return not stripped or stripped.startswith("#")
+
+
+def scalar(text: str) -> str:
+    """A single line scalar, quoted or not"""
+
+    if text.startswith("'"):
+        match = SINGLE_QUOTED.match(text)
+        if not match:
+            raise Unsupported(text)
+        return match.group("text").replace("''", "'")
+
+    if text.startswith('"'):
+        match = DOUBLE_QUOTED.match(text)
+        if not match:
+            raise Unsupported(text)
+        return match.group("text")
+
+    text = text.rstrip(" ")
+    if not is_plain_string(text):
+        raise Unsupported(text)
+
+    return text
+
+
+class Parser:
+    """One pass over the lines of a document, top to bottom"""
+
+    def __init__(self, text: str):
+        if UNUSUAL_CHARACTERS.search(text):
+            raise Unsupported("unusual characters")
+
+        # a last line without a newline only counts if it's nothing but spaces
+        text, newline, last = text.rpartition("\n")
+        if last.strip(" "):
+            raise Unsupported("no final newline")
+
+        self.lines: List[str] = text.split("\n") if newline else []
+        self.position = 0
+
+    def next_content(self) -> Optional[int]:
+        """Position of the next line that isn't blank or a comment"""
+
+        for position in range(self.position, len(self.lines)):
+            if not ignorable(self.lines[position]):
+                return position
+
+        return None
+
+    def document(self) -> Dict:
+        """The top level mapping"""
+
+        fields: Dict = {}
+        indent: Optional[int] = None
+
+        start = self.next_content()
+        if start is not None and self.lines[start].rstrip(" ") == "---":
+            self.position = start + 1
+
+        while True:
+            position = self.next_content()
+            if position is None:
+                break
+
+            match = KEY.match(self.lines[position])
+            if not match or not is_plain_string(match.group("key")):
+                raise Unsupported(self.lines[position])
+
+            if indent is None:
+                indent = len(match.group("indent"))
+            if len(match.group("indent")) != indent or match.group("key") in fields:
+                raise Unsupported(self.lines[position])
+
+            self.position = position + 1
+            fields[match.group("key")] = self.value(match.group("rest"), indent)
+
+        if indent is None:
+            raise Unsupported("empty document")
+
+        return fields
+
+    def value(self, rest: str, indent: int) -> Union[str, List, None]:
+        """Whatever comes after `key:`"""
+
+        rest = rest.strip(" ")
+
+        if rest.startswith("|"):
+            return self.literal(rest, indent)
+
+        if rest:
+            return scalar(rest)
+
+        position = self.next_content()
+        if position is None:
+            return None
+
+        line = self.lines[position]
+        if ITEM.match(line) and indentation(line) >= indent:
+            return self.sequence(indent)
+        if indentation(line) > indent:
+            raise Unsupported(line)
+
+        return None
+
+    def sequence(self, parent_indent: int) -> List:
+        """A block sequence of scalars and single-key mappings"""
+
+        items: List = []
+        item_indent: Optional[int] = None
+
+        while True:
+            position = self.next_content()
+            if position is None:
+                break
+
+            line = self.lines[position]
+            match = ITEM.match(line)
+            indent = indentation(line)
+
+            if match and item_indent in (None, indent):
+                item_indent = indent
+                self.position = position + 1
+                items.append(self.item(match.group("rest").strip(" ")))
+            elif not match and indent <= parent_indent:
+                break
+            else:
+                raise Unsupported(line)
+
+        return items
+
+    @staticmethod
+    def item(rest: str) -> Union[str, Dict]:
+        """`- scalar` or `- key: scalar`"""
+
+        match = INLINE_KEY.match(rest)
+        if not match:
+            return scalar(rest)
+
+        if not is_plain_string(match.group("key")):
+            raise Unsupported(rest)
+
+        value = match.group("rest").strip(" ")
+
+        return {match.group("key"): scalar(value) if value else None}
+
+    def literal(self, header: str, indent: int) -> str:
+        """A literal block scalar, `|`, `|-` or `|+`"""
+
+        match = LITERAL.match(header)
+        if not match:
+            raise Unsupported(header)
+
+        lines: List[str] = []
+        content_indent: Optional[int] = None
+        leading_blanks: List[int] = []
+        last_content = -1
+
+        for line in self.lines[self.position :]:  # noqa: E203
+            if not line.strip(" "):
+                if content_indent is None:
+                    leading_blanks.append(len(line))
+                elif len(line) > content_indent:
+                    raise Unsupported("whitespace inside a literal block")
+                lines.append("")
+                continue
+
+            line_indent = indentation(line)
+            if line_indent <= indent:
+                break
+            if line[line_indent] == "\t":
+                raise Unsupported("tab where indentation would be")
+
+            if content_indent is None:
+                content_indent = line_indent
+                # ruamel won't have any of these be deeper than the first one,
+                # unless the first is completely empty
+                deepest = max([content_indent, *leading_blanks])
+                if leading_blanks and 0 < leading_blanks[0] < deepest:
+                    raise Unsupported("overindented leading blank line")
+                if deepest > content_indent:
+                    raise Unsupported("overindented leading blank line")
+            elif line_indent < content_indent:
+                raise Unsupported(line)
+
+            lines.append(line[content_indent:])
+            last_content = len(lines) - 1
+
+        if content_indent is None:
+            raise Unsupported("empty literal block")
+
+        self.position += len(lines)
+        text = "\n".join(lines[: last_content + 1])
+        trailing = len(lines) - last_content - 1
+
+        return {
+            "-": text,
+            "": text + "\n",
+            "+": text + "\n" * (trailing + 1),
+        }[match.group("chomping")]
+
+
+def load(content: Union[bytes, str]) -> Optional[Dict]:
+    """The fields of a Procedure file, or None if ruamel needs to handle it"""
+
+    try:
+        text = content.decode("utf-8") if isinstance(content, bytes) else content
+        return Parser(text).document()
+    except (Unsupported, UnicodeDecodeError):
+        return None
@@ -1,28 +1,53 @@
 """filesystem utilities for not"""
+import re
 from collections import defaultdict
+from functools import lru_cache
 from os.path import getatime, getmtime
 from pathlib import Path
 from time import ctime
-from typing import Callable, Dict, Iterator, List, Optional, Tuple, Union
+from typing import TYPE_CHECKING, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 
-from ruamel.yaml import YAML
 from typer import Abort, echo
 
-from .constants import (
-    CWD,
-    CWD_DOT_NOTHING_DIR,
-    HOME,
-    HOME_DOT_NOTHING_DIR,
-    PROCEDURE_EXT,
-    PROCEDURE_EXT_GLOB,
+from . import backends, fastload, index
+from .catalog import Catalog
+from .constants import CWD, CWD_DOT_NOTHING_DIR, HOME, HOME_DOT_NOTHING_DIR
+from .discovery import (  # noqa: F401 (re-exported, these used to live here)
+    ProcedureState,
+    discover,
+    procedure_files,
+    without_procedure_ext,
 )
 from .localization import polyglot as glot
-from .models import Procedure, context_var_name
+from .trace import span, traced
 
-yml = YAML()  # singleton pls
+if TYPE_CHECKING:  # pragma: no cover
+    from ruamel.yaml import YAML
 
+    from .models import Procedure
 
-def initstate() -> Callable[[Optional[bool]], Union[Iterator[Path], List[Path]]]:
+
+METADATA_KEYS = ("title", "description", "step_count", "context_vars", "knowns")
+
+# a top level `steps:` key introducing a literal block, the way `not new` writes it
+STEPS_KEY = re.compile(r"^ *steps:[ \t]*(?P<style>[|>]\S*)?[ \t]*(#.*)?$")
+LITERAL_BLOCK_STYLES = ("|", "|-", "|+")
+
+
+# pylint: disable=import-outside-toplevel
+@traced("filesystem.yml")
+@lru_cache(maxsize=None)
+def yml() -> "YAML":
+    """The ruamel loader, a singleton pls. Built on first use because importing ruamel
+    is a good chunk of the startup cost of `not`."""
+
+    from ruamel.yaml import YAML
+
+    return YAML()
+
+
+@traced("filesystem.initstate")
+def initstate() -> Catalog:
     """For the lifecycle of any subcommands that read from the filesytem,
     application state can be defined as the collection of .yml files in home and cwd"""
 
@@ -31,29 +56,61 @@ def initstate() -> Callable[[Optional[bool]], Union[Iterator[Path], List[Path]]]
 
         raise Abort
 
-    existing_procedures: Tuple[Path] = (
-        *CWD_DOT_NOTHING_DIR.glob(f"*{PROCEDURE_EXT_GLOB}"),
-        *HOME_DOT_NOTHING_DIR.glob(f"*{PROCEDURE_EXT_GLOB}"),
-    )
+    return Catalog((CWD_DOT_NOTHING_DIR, HOME_DOT_NOTHING_DIR))
+
+
+# pylint: disable=global-statement
+def state(iterator=False) -> Union[Iterator[Path], Tuple[Path, ...]]:
+    """Stand-in for the real state until something actually asks for it.
+    The first call takes the snapshot and replaces this function with it, so commands
+    that never touch the filesystem (--version, init...) never glob anything."""
+
+    global state
+    state = initstate()
+
+    return state(iterator)
+
+
+def _current_state() -> Catalog:
+    """The real state, taking the snapshot if it hasn't been taken yet"""
+
+    if not isinstance(state, ProcedureState):
+        state()
+
+    return state
 
-    def _state(iterator=False) -> Union[Iterator[Path], List[Path]]:
-        return iter(existing_procedures) if iterator else existing_procedures
 
-    return _state
+def catalog() -> Catalog:
+    """The state, for commands that add, remove or rename Procedure files to keep
+    up to date. Unlike state() it doesn't mind if there are no .nothing dirs yet"""
 
+    global state
 
-state: Callable[[Optional[bool]], Union[List, Iterator]] = initstate()
+    if not isinstance(state, Catalog):
+        state = Catalog((CWD_DOT_NOTHING_DIR, HOME_DOT_NOTHING_DIR))
+
+    return state
 
 
-# pylint: disable=unused-variable, redefined-outer-name
 def procedure_location(procedure_name: str) -> Union[Path, None]:
     """Take the name of a Procedure, find the corresponding file, and return its
     canonical location as a path, if it exists.
     Doesn't care if you include the extension."""
 
-    name = procedure_name.rstrip(PROCEDURE_EXT)
+    return _current_state().location(without_procedure_ext(procedure_name))
+
+
+def shadowed_procedure_locations(procedure_name: str) -> List[Path]:
+    """Files with the same name as the Procedure that procedure_location() picks,
+    which are unreachable by name. Usually a global one hidden by a local one."""
+
+    return _current_state().shadowed(without_procedure_ext(procedure_name))
 
-    return next((path for path in state(iterator=True) if path.stem == name), None)
+
+def catalog_summaries() -> Dict[Path, Dict]:
+    """Catalog index entries for every Procedure in cwd and home"""
+
+    return _current_state().summaries()
 
 
 def friendly_prefix_for_path(path: Path):
@@ -68,21 +125,159 @@ def friendly_prefix_for_path(path: Path):
     return path_string.replace(verbose_prefix, short_prefix)
 
 
-def deserialize_procedure_file(procedure_path: Path) -> Procedure:
+def deserialize_procedure_file(procedure_path: Path) -> "Procedure":
     """Take the content of a Procedure file, try to find the corresponding file,
     return it as a Procedure object"""
 
-    fields: Dict = yml.load(procedure_path)
+    return deserialize_procedure(procedure_path.read_bytes(), procedure_path)
+
+
+def deserialize_procedure(content: bytes, procedure_path: Path) -> "Procedure":
+    """The parsing half of deserialize_procedure_file(), for callers that already
+    hold the bytes of the file"""
+
+    with span("models.import"):
+        from .models import Procedure
+
+    with span("filesystem.parse"):
+        fields: Dict = backends.for_path(procedure_path).load(content)
+
+    with span("models.validate"):
+        return Procedure(path=procedure_path, **fields)
+
+
+def load_fields(content: Union[bytes, str]) -> Dict:
+    """The raw fields of a YAML Procedure file. The fast loader takes care of the
+    everyday ones, and ruamel of whatever it won't."""
+
+    fields = fastload.load(content)
+
+    return yml().load(content) if fields is None else fields
+
 
-    return Procedure(path=procedure_path, **fields)
+# pylint: disable=too-many-branches
+def split_steps_block(lines: Iterable[str]) -> Optional[Tuple[str, int]]:
+    """Split the lines of a Procedure file into everything but its steps, and the
+    number of steps. The steps are counted as they stream past, never held.
+
+    Returns None for anything but a single literal block (`steps: |-`), or
+    whatever else would take a real YAML parser to get right."""
+
+    header: List[str] = []
+    mapping_indent: Optional[int] = None
+    style: Optional[str] = None  # only set while inside the steps block
+    content_indent: Optional[int] = None
+    found = False
+    separators = blank_run = 0
+
+    for line in lines:
+        text = line.rstrip("\r\n")
+        indent = len(text) - len(text.lstrip(" "))
+
+        if style is not None:
+            if not text.strip():
+                if content_indent is not None and len(text) > content_indent:
+                    return None  # whitespace that's actually part of a step
+                blank_run += 1
+                continue
+
+            if indent > mapping_indent:
+                if content_indent is None:
+                    content_indent = indent
+                    separators += blank_run // 2
+                elif indent < content_indent:
+                    return None
+                else:
+                    # k blank lines between two lines of text make k+1 newlines,
+                    # which hold this many STEP_SEPARATORs
+                    separators += (blank_run + 1) // 2
+                blank_run = 0
+                continue
+
+            # the block is over, anything kept past its last line still counts
+            if style == "|+":
+                separators += (blank_run + 1) // 2
+            style = None
+
+        if mapping_indent is None and text.strip()[:1] not in ("", "#", "%", "-"):
+            mapping_indent = indent
+
+        match = STEPS_KEY.match(text)
+
+        if match and indent == mapping_indent:
+            if found or match.group("style") not in LITERAL_BLOCK_STYLES:
+                return None
+            found, style, blank_run = True, match.group("style"), 0
+            continue
+
+        header.append(line)
+
+    if style == "|+":
+        separators += (blank_run + 1) // 2
+
+    if content_indent is None:
+        return None
+
+    return "".join(header), separators + 1
+
+
+def _plausible_header(fields) -> bool:
+    """Whether Procedure(**fields) would take these as they are, no coercion"""
+
+    return (
+        isinstance(fields, dict)
+        and "steps" not in fields
+        and isinstance(fields.get("title"), str)
+        and isinstance(fields.get("description", ""), (str, type(None)))
+        and isinstance(fields.get("context", []), list)
+        and all(
+            isinstance(c, str) or (isinstance(c, dict) and c)
+            for c in fields.get("context", [])
+        )
+        and isinstance(fields.get("knowns", []), list)
+        and all(isinstance(k, dict) for k in fields.get("knowns", []))
+    )
+
+
+@traced("filesystem.procedure_header_metadata")
+def procedure_header_metadata(procedure_path: Path) -> Dict:
+    """procedure_object_metadata() for a Procedure file, parsing everything but
+    its steps. Falls back on the full parse for anything unusual,
+    so a broken file raises what it always has."""
+
+    from ruamel.yaml import YAMLError
+
+    from .models import context_var_name
+
+    if backends.for_path(procedure_path) is not backends.YAML_BACKEND:
+        # other formats have no header to speak of, and load quickly anyway
+        return procedure_object_metadata(deserialize_procedure_file(procedure_path))
+
+    try:
+        with open(str(procedure_path), encoding="utf-8") as file:
+            split = split_steps_block(file)
+        fields = load_fields(split[0]) if split else None
+    except (UnicodeDecodeError, YAMLError):
+        fields = None
+
+    if not _plausible_header(fields):
+        return procedure_object_metadata(deserialize_procedure_file(procedure_path))
+
+    return {
+        "title": fields["title"],
+        "description": fields.get("description", ""),
+        "step_count": split[1],
+        "context_vars": [context_var_name(c) for c in fields.get("context", [])],
+        "knowns": list(fields.get("knowns", [])),
+    }
 
 
 # no need to test stdlib
 def procedure_file_metadata(file_location: Path) -> Dict:  # pragma: no cover
-    """ A dict of:
-        full_path
-        last_modified
-        last_accessed"""
+    """A dict of:
+    full_path
+    last_modified
+    last_accessed"""
 
     last_modified = ctime(getmtime(file_location))
     last_accessed = ctime(getatime(file_location))
@@ -94,13 +289,33 @@ def procedure_file_metadata(file_location: Path) -> Dict:  # pragma: no cover
     }
 
 
-def procedure_object_metadata(procedure: Procedure) -> Dict:
+def procedure_object_metadata(procedure: Union["Procedure", Path]) -> Dict:
     """A dict of:
         title
         description
         step_count
         context_vars
-        knowns"""
+        knowns
+
+    Given the path to a Procedure file instead of the object,
+    the answer comes from the catalog index."""
+
+    from .models import context_var_name
+
+    if isinstance(procedure, Path):
+        # a catalog that's been kept around, by `not serve`, has it in memory
+        entry = (
+            state.summary(procedure)
+            if isinstance(state, Catalog)
+            else index.summary(procedure)
+        )
+
+        if "error" in entry:
+            # let the parse blow up properly, with the real traceback. if it
+            # doesn't, whatever broke the summary is fixed, go with the parse
+            return procedure_object_metadata(deserialize_procedure_file(procedure))
+
+        return {key: entry[key] for key in METADATA_KEYS}
 
     return {
         "title": procedure.title,
@@ -136,8 +351,8 @@ def collect_fancy_list_input() -> Dict[str, List[str]]:
     The values are lists of Procedure names."""
 
     collection = defaultdict(list)
-    for path in state(iterator=True):
+    for path, entry in catalog_summaries().items():
         key = "global" if path.parent == HOME_DOT_NOTHING_DIR else "local"
-        collection[key] += [path.stem]
+        collection[key] += [entry["name"]]
 
     return collection
@@ -0,0 +1,176 @@
+"""Steps that say what they come after, and the order that lets them happen in.
+
+A step can start with a declaration line giving it an id, and the ids of the steps
+it has to come after:
+
+    @build-api
+    Build the API image
+
+    @build-web after:
+    Build the web image
+
+    @deploy after: build-api, build-web
+    Ship both of them
+
+A step with no `after:` comes after the step before it, like steps always have,
+so a Procedure without declarations walks through in order. An empty `after:`
+means the step can happen right away. The declaration line is never shown or
+rendered, it's only there for the scheduler.
+
+Declarations only count in a Procedure where at least one step says `after:`.
+Until then a first line like `@here` or `@oncall` is just part of the step, the
+way it always was."""
+import re
+from typing import Dict, List, NamedTuple, Optional, Sequence, Set, Tuple
+
+DECLARATION = re.compile(r"^@(?P<id>[\w.-]+)(?:[ \t]+after:(?P<after>.*))?[ \t]*$")
+
+
+class StepDeclaration(NamedTuple):
+    id: Optional[str]
+    after: Optional[Tuple[str, ...]]  # None when it's simply after the last step
+    body: str  # the step without its declaration
+
+
+class BadStepGraph(ValueError):
+    """Declarations that can't all be satisfied: unknown or repeated ids, or cycles"""
+
+
+def split_declaration(step: str) -> StepDeclaration:
+    """The declaration a step starts with, if any, and the rest of the step"""
+
+    first_line, _, rest = step.partition("\n")
+    match = DECLARATION.match(first_line.strip())
+
+    if match is None:
+        return StepDeclaration(None, None, step)
+
+    after = match.group("after")
+
+    return StepDeclaration(
+        match.group("id"),
+        None if after is None else tuple(filter(None, re.split(r"[\s,]+", after))),
+        rest,
+    )
+
+
+def declarations(steps: Sequence[str]) -> List[StepDeclaration]:
+    """The declaration of every step, or none at all when no step says `after:`"""
+
+    declared = [split_declaration(step) for step in steps]
+
+    if all(declaration.after is None for declaration in declared):
+        return [StepDeclaration(None, None, step) for step in steps]
+
+    return declared
+
+
+class StepGraph:
+    """Which steps have to wait on which, and which are free to go right now"""
+
+    def __init__(self, steps: Sequence[str]):
+        self.declarations: List[StepDeclaration] = declarations(steps)
+        self.declared: bool = any(d.id is not None for d in self.declarations)
+        self.dependencies: List[Set[int]] = self._dependencies()
+        self.dependents: List[List[int]] = [[] for _ in self.dependencies]
+        for step, deps in enumerate(self.dependencies):
+            for dependency in deps:
+                self.dependents[dependency].append(step)
+        self.order: List[int] = self._topological_order()
+
+        self.finished: Set[int] = set()
+        # how many unfinished steps each step still waits on, and the steps that
+        # no longer wait on anything but haven't been handed out
+        self._waiting_on: List[int] = [len(deps) for deps in self.dependencies]
+        self._ready: List[int] = [
+            step for step, count in enumerate(self._waiting_on) if not count
+        ]
+
+    def _dependencies(self) -> List[Set[int]]:
+        index_by_id: Dict[str, int] = {}
+
+        for i, declaration in enumerate(self.declarations):
+            if declaration.id is None:
+                continue
+            if declaration.id in index_by_id:
+                raise BadStepGraph(f"@{declaration.id} is declared twice")
+            index_by_id[declaration.id] = i
+
+        dependencies = []
+        for i, declaration in enumerate(self.declarations):
+            if declaration.after is None:
+                dependencies.append({i - 1} if i else set())
+                continue
+
+            unknown = [name for name in declaration.after if name not in index_by_id]
+            if unknown:
+                raise BadStepGraph(
+                    f"step {i} comes after {', '.join(unknown)}, which aren't declared"
+                )
+            dependencies.append({index_by_id[name] for name in declaration.after})
+
+        return dependencies
+
+    def _topological_order(self) -> List[int]:
+        waiting_on = [len(deps) for deps in self.dependencies]
+        order = [step for step, count in enumerate(waiting_on) if not count]
+
+        for step in order:  # grows as it goes
+            for dependent in self.dependents[step]:
+                waiting_on[dependent] -= 1
+                if not waiting_on[dependent]:
+                    order.append(dependent)
+
+        if len(order) != len(self.dependencies):
+            stuck = sorted(set(range(len(self.dependencies))) - set(order))
+            raise BadStepGraph(f"steps {', '.join(map(str, stuck))} wait on each other")
+
+        return order
+
+    def ready(self) -> List[int]:
+        """Every step that isn't waiting on anything anymore and hasn't been handed
+        out (or finished) yet, in step order. They count as handed out from now on."""
+
+        ready = sorted(step for step in self._ready if step not in self.finished)
+        self._ready = []
+
+        return ready
+
+    def finish(self, steps: Sequence[int]) -> None:
+        """Mark steps as done, letting whatever waited on them go"""
+
+        for step in steps:
+            if step in self.finished:
+                continue
+            self.finished.add(step)
+            for dependent in self.dependents[step]:
+                self._waiting_on[dependent] -= 1
+                if not self._waiting_on[dependent]:
+                    self._ready.append(dependent)
+
+    @property
+    def done(self) -> bool:
+        """Whether every step is finished"""
+
+        return len(self.finished) == len(self.dependencies)
+
+    def critical_path(self) -> List[int]:
+        """The longest chain of steps that have to happen one after the other.
+        However many people or jobs there are, it can't take less than this."""
+
+        # the length of the longest chain ending at each step, and the step before
+        length: Dict[int, int] = {}
+        previous: Dict[int, Optional[int]] = {}
+
+        for step in self.order:
+            before = max(self.dependencies[step], key=length.__getitem__, default=None)
+            length[step] = 1 + (0 if before is None else length[before])
+            previous[step] = before
+
+        path: List[int] = []
+        step = max(length, key=length.__getitem__, default=None)
+        while step is not None:
+            path.append(step)
+            step = previous[step]
+
+        return path[::-1]
@@ -0,0 +1,265 @@
+"""How long each step of each walkthrough took, for `not stats`.
+
+A step's dwell time is how long it sat on screen: from when it was shown to when
+enter was pressed on its nag. Dwell times go in a SQLite database in the cache
+directory of the Procedure's .nothing dir, but not one by one. They're counted
+into buckets of a histogram that are BUCKET_RATIO wide, one histogram per step.
+That keeps percentiles within a few percent and makes the database as big as the
+number of steps, not the number of runs, so a report takes as long after years of
+history as it does after a week.
+
+Each run also gets a row saying the first step it's still waiting on, so runs
+that were never finished show where they were given up."""
+import math
+import sqlite3
+from pathlib import Path
+from time import perf_counter, time
+from typing import Dict, Iterable, List, NamedTuple, Optional, Sequence, Set, Tuple
+
+from .constants import CACHE_DIRECTORY_NAME, HISTORY_FILENAME
+
+BUCKET_RATIO = 1.05
+SHORTEST_DWELL = 0.01  # seconds. anything quicker counts as this
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    procedure TEXT NOT NULL,
+    started REAL NOT NULL,
+    waiting_on INTEGER,
+    completed INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS runs_by_outcome ON runs (procedure, completed, waiting_on);
+CREATE TABLE IF NOT EXISTS dwells (
+    procedure TEXT NOT NULL,
+    step INTEGER NOT NULL,
+    bucket INTEGER NOT NULL,
+    count INTEGER NOT NULL,
+    PRIMARY KEY (procedure, step, bucket)
+) WITHOUT ROWID;
+"""
+
+
+class StepStats(NamedTuple):
+    step: int
+    count: int
+    p50: float  # seconds
+    p95: float
+
+
+class ProcedureStats(NamedTuple):
+    runs: int
+    completed: int
+    steps: List[StepStats]
+    abandoned: Dict[int, int]  # the step unfinished runs stopped at: how many did
+
+
+def history_location(procedure_path: Path) -> Path:
+    """Where the history for Procedures in this .nothing dir lives"""
+
+    return procedure_path.parent / CACHE_DIRECTORY_NAME / HISTORY_FILENAME
+
+
+def bucket_for(seconds: float) -> int:
+    """The histogram bucket a dwell time is counted in"""
+
+    return math.floor(math.log(max(seconds, SHORTEST_DWELL), BUCKET_RATIO))
+
+
+def bucket_seconds(bucket: int) -> float:
+    """The dwell time a bucket stands for, the middle of it"""
+
+    return BUCKET_RATIO ** (bucket + 0.5)
+
+
+def percentile(histogram: Sequence[Tuple[int, int]], fraction: float) -> float:
+    """The dwell time `fraction` of the counts are at or under, from (bucket, count)
+    pairs in bucket order"""
+
+    total = sum(count for _, count in histogram)
+    wanted = max(1, math.ceil(total * fraction))
+    seen = 0
+
+    for bucket, count in histogram:
+        seen += count
+        if seen >= wanted:
+            return bucket_seconds(bucket)
+
+    raise ValueError("no dwell times to take a percentile of")
+
+
+def connect(location: Path) -> sqlite3.Connection:
+    """A connection to the history database, made if it has to be"""
+
+    location.parent.mkdir(parents=True, exist_ok=True)
+    connection = sqlite3.connect(str(location))
+    # losing the last few steps to a power cut is fine, waiting on fsyncs isn't
+    connection.execute("PRAGMA journal_mode=WAL")
+    connection.execute("PRAGMA synchronous=NORMAL")
+    connection.executescript(SCHEMA)
+
+    return connection
+
+
+class Recorder:
+    """The dwell times of one run, recorded as it goes. When the database can't be
+    opened or written to, it quietly records nothing."""
+
+    def __init__(
+        self,
+        connection: Optional[sqlite3.Connection],
+        procedure: str,
+        done: Iterable[int] = (),
+    ):
+        self.connection: Optional[sqlite3.Connection] = connection
+        self.procedure: str = procedure
+        self.run: Optional[int] = None
+        self.shown_at: Dict[int, float] = {}
+        self.done: Set[int] = set(done)
+        self.waiting_on: int = self._first_not_done(0)
+
+        self._write(self._start)
+
+    @classmethod
+    def open(cls, procedure_path: Path, done: Iterable[int] = ()) -> "Recorder":
+        """A recorder for a new run of the Procedure at `procedure_path`, with the
+        steps that are `done` already when it's resumed"""
+
+        try:
+            connection: Optional[sqlite3.Connection] = connect(
+                history_location(procedure_path)
+            )
+        except (OSError, sqlite3.Error):
+            connection = None
+
+        return cls(connection, procedure_path.stem, done)
+
+    def _first_not_done(self, step: int) -> int:
+        while step in self.done:
+            step += 1
+
+        return step
+
+    def _write(self, write, *args) -> None:
+        if self.connection is None:
+            return
+
+        try:
+            with self.connection:  # a transaction, committed on the way out
+                write(self.connection, *args)
+        except sqlite3.Error:
+            self.close()
+
+    def _start(self, connection: sqlite3.Connection) -> None:
+        self.run = connection.execute(
+            "INSERT INTO runs (procedure, started, waiting_on) VALUES (?, ?, ?)",
+            (self.procedure, time(), self.waiting_on),
+        ).lastrowid
+
+    def shown(self, step: int) -> None:
+        """A step just went on screen"""
+
+        self.shown_at[step] = perf_counter()
+
+    def acknowledged(self, steps: Iterable[int]) -> None:
+        """Steps were done"""
+
+        now = perf_counter()
+        dwells = []
+        for step in steps:
+            self.done.add(step)
+            if step in self.shown_at:
+                dwells.append((step, now - self.shown_at.pop(step)))
+        self.waiting_on = self._first_not_done(self.waiting_on)
+
+        self._write(self._acknowledge, dwells)
+
+    def _acknowledge(
+        self, connection: sqlite3.Connection, dwells: List[Tuple[int, float]]
+    ) -> None:
+        for step, seconds in dwells:
+            key = (self.procedure, step, bucket_for(seconds))
+            connection.execute("INSERT OR IGNORE INTO dwells VALUES (?, ?, ?, 0)", key)
+            connection.execute(
+                "UPDATE dwells SET count = count + 1"
+                " WHERE procedure = ? AND step = ? AND bucket = ?",
+                key,
+            )
+        connection.execute(
+            "UPDATE runs SET waiting_on = ? WHERE id = ?", (self.waiting_on, self.run)
+        )
+
+    def finish(self) -> None:
+        """The run made it to the end"""
+
+        self._write(
+            lambda connection: connection.execute(
+                "UPDATE runs SET completed = 1, waiting_on = NULL WHERE id = ?",
+                (self.run,),
+            )
+        )
+
+    def close(self) -> None:
+        """Done recording, whether the run finished or not"""
+
+        if self.connection is not None:
+            self.connection.close()
+            self.connection = None
+
+
+def procedure_stats(procedure_path: Path) -> Optional[ProcedureStats]:
+    """Every run of the Procedure at `procedure_path` summed up, or None if it's
+    never been walked through"""
+
+    location = history_location(procedure_path)
+    if not location.exists():
+        return None
+
+    procedure = procedure_path.stem
+    # only looking, so nothing gets created or converted on the way in
+    connection = sqlite3.connect(f"{location.resolve().as_uri()}?mode=ro", uri=True)
+
+    try:
+        outcomes = dict(
+            connection.execute(
+                "SELECT completed, count(*) FROM runs"
+                " WHERE procedure = ? GROUP BY completed",
+                (procedure,),
+            ).fetchall()
+        )
+        abandoned = dict(
+            connection.execute(
+                "SELECT waiting_on, count(*) FROM runs"
+                " WHERE procedure = ? AND completed = 0 GROUP BY waiting_on",
+                (procedure,),
+            ).fetchall()
+        )
+        histograms: Dict[int, List[Tuple[int, int]]] = {}
+        for step, bucket, count in connection.execute(
+            "SELECT step, bucket, count FROM dwells"
+            " WHERE procedure = ? ORDER BY step, bucket",
+            (procedure,),
+        ):
+            histograms.setdefault(step, []).append((bucket, count))
+    except sqlite3.Error:  # not a history database after all
+        return None
+    finally:
+        connection.close()
+
+    if not outcomes:
+        return None
+
+    return ProcedureStats(
+        runs=sum(outcomes.values()),
+        completed=outcomes.get(1, 0),
+        steps=[
+            StepStats(
+                step,
+                sum(count for _, count in histogram),
+                percentile(histogram, 0.5),
+                percentile(histogram, 0.95),
+            )
+            for step, histogram in sorted(histograms.items())
+        ],
+        abandoned=abandoned,
+    )
@@ -0,0 +1,209 @@
+"""The catalog index: a summary of every Procedure in a .nothing directory,
+kept on disk so listing and completion don't have to parse any YAML.
+
+Each .nothing dir gets its own index in its cache directory. Entries are keyed by
+filename and carry the (mtime, size, inode) of the file they were built from.
+An entry is trusted for as long as `os.stat` agrees with it, so the common case
+costs one stat call per Procedure. Only files whose stat changed get re-parsed."""
+
+import json
+import os
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+from . import loader
+from .completion import (
+    completables_from_entries,
+    completion_file_is_stale,
+    write_completion_file,
+)
+from .constants import CACHE_DIRECTORY_NAME, INDEX_FILENAME
+from .trace import traced
+
+# bump whenever the shape of an entry changes, stale indexes are simply rebuilt
+INDEX_VERSION = 1
+
+
+def stat_key(path: Path) -> List[int]:
+    """The bits of `os.stat` that tell us a file has changed"""
+
+    stat = os.stat(str(path))
+
+    return [stat.st_mtime_ns, stat.st_size, stat.st_ino]
+
+
+# pylint: disable=import-outside-toplevel,broad-except
+def summarize(path: Path) -> Dict:
+    """Parse the header of the Procedure at `path` into an index entry.
+    A broken file still gets an entry, so one typo doesn't take down `not ls`."""
+
+    from .filesystem import procedure_header_metadata
+
+    try:
+        summary = procedure_header_metadata(path)
+    except Exception as err:
+        summary = {"error": f"{type(err).__name__}: {err}"}
+
+    return {"name": path.stem, **summary}
+
+
+def entry(path: Path) -> Dict:
+    """A fresh index entry for the Procedure at `path`, whatever the index says"""
+
+    return {"stat": stat_key(path), **summarize(path)}
+
+
+class CatalogIndex:
+    """The index for a single .nothing directory"""
+
+    def __init__(self, directory: Path):
+        self.directory: Path = directory
+        self.location: Path = directory / CACHE_DIRECTORY_NAME / INDEX_FILENAME
+        self.entries: Dict[str, Dict] = self.read()
+        self.dirty: bool = False
+
+    def read(self) -> Dict[str, Dict]:
+        """Entries from disk, or nothing at all if the index is missing or unusable"""
+
+        try:
+            with open(str(self.location), "rb") as file:
+                contents = json.load(file)
+        except (OSError, ValueError):
+            return {}
+
+        if not isinstance(contents, dict) or contents.get("version") != INDEX_VERSION:
+            return {}
+
+        return contents.get("entries", {})
+
+    def summary(self, path: Path) -> Dict:
+        """The entry for `path`, re-parsing the file only if it changed on disk"""
+
+        stat = stat_key(path)
+
+        if not self.fresh(path, stat):
+            self.update(path, stat, summarize(path))
+
+        return self.entries[path.name]
+
+    def fresh(self, path: Path, stat: List[int]) -> bool:
+        """Whether the entry for `path` was built from a file with this stat"""
+
+        entry = self.entries.get(path.name)
+
+        return entry is not None and entry["stat"] == stat
+
+    def update(self, path: Path, stat: List[int], summary: Dict) -> None:
+        """Replace the entry for `path` with a freshly made summary"""
+
+        self.entries[path.name] = {"stat": stat, **summary}
+        self.dirty = True
+
+    def forget(self, filename: str) -> None:
+        """Drop the entry for one file"""
+
+        if self.entries.pop(filename, None) is not None:
+            self.dirty = True
+
+    def prune(self, keep: Iterable[str]) -> None:
+        """Forget every entry whose file isn't in `keep`"""
+
+        vanished = set(self.entries) - set(keep)
+
+        for filename in vanished:
+            del self.entries[filename]
+
+        self.dirty = self.dirty or bool(vanished)
+
+    def save(self) -> None:
+        """Write the index back if anything changed, along with the completion file
+        the shell reads. A .nothing dir we can't write to just doesn't get either;
+        everything still works, only slower."""
+
+        if self.dirty:
+            self.write()
+
+        if self.dirty or completion_file_is_stale(self.directory):
+            write_completion_file(
+                self.directory, completables_from_entries(self.entries.values())
+            )
+
+        self.dirty = False
+
+    def write(self) -> None:
+        """Atomically replace the index file on disk"""
+
+        temporary = self.location.with_name(f".{INDEX_FILENAME}.{os.getpid()}")
+
+        try:
+            self.location.parent.mkdir(exist_ok=True)
+            with open(str(temporary), "w") as file:
+                json.dump(
+                    {"version": INDEX_VERSION, "entries": self.entries},
+                    file,
+                    default=str,
+                )
+            os.replace(str(temporary), str(self.location))
+        except OSError:
+            pass
+
+
+@traced("index.summaries")
+def summaries(
+    paths: Iterable[Path], directories: Optional[Iterable[Path]] = None
+) -> Dict[Path, Dict]:
+    """Index entries for every path, in the order given, leaving out any that no
+    longer exist. Each .nothing directory's index is read once, brought up to date
+    and written back if it changed.
+
+    Pass `directories` when `paths` is everything in them, so that files which
+    disappeared get dropped from their indexes, even if a directory is now empty."""
+
+    paths = list(paths)
+    indexes: Dict[Path, CatalogIndex] = {
+        directory: CatalogIndex(directory) for directory in directories or ()
+    }
+
+    for path in paths:
+        if path.parent not in indexes:
+            indexes[path.parent] = CatalogIndex(path.parent)
+
+    # stat everything, then re-parse whatever changed. with a cold index and a
+    # big catalog that's a lot of parsing, which loader spreads across processes
+    stats = dict(zip(paths, loader.map_threads(stat_key, paths)))
+    # a file deleted since it was listed has simply been removed
+    paths = [
+        path
+        for path in paths
+        if not isinstance(stats[path], loader.LoadError) or path.exists()
+    ]
+    for path in paths:
+        if isinstance(stats[path], loader.LoadError):
+            raise stats[path]
+
+    stale = [
+        path for path in paths if not indexes[path.parent].fresh(path, stats[path])
+    ]
+    for path, fresh_summary in zip(stale, loader.map_processes(summarize, stale)):
+        indexes[path.parent].update(path, stats[path], fresh_summary)
+
+    result = {path: indexes[path.parent].entries[path.name] for path in paths}
+
+    for directory, catalog_index in indexes.items():
+        if directories is not None:
+            catalog_index.prune(
+                path.name for path in paths if path.parent == directory
+            )
+        catalog_index.save()
+
+    return result
+
+
+def summary(path: Path) -> Dict:
+    """Index entry for a single Procedure file"""
+
+    entries = summaries([path])
+    if path not in entries:
+        raise FileNotFoundError(str(path))
+
+    return entries[path]
@@ -0,0 +1,265 @@
+"""A journal of each walkthrough, so one that dies can pick up where it left off.
+
+Every run of `not do` appends to its own file of JSON lines in the cache directory
+of the Procedure's .nothing dir: which Procedure it was (and exactly which content
+of it), every variable answered and every step acknowledged. Nothing is ever
+rewritten, so a run killed halfway through leaves a journal that's good up to its
+last complete line.
+
+Each line is flushed as it's written, so it survives the process dying, say when
+an SSH connection drops. Making it survive the machine dying takes an fsync, which
+is slow enough to notice, so those are batched: one every FSYNC_EVERY lines or
+FSYNC_INTERVAL seconds, and one when the journal is closed.
+
+`not do --resume` reads the newest unfinished journal for the same content of the
+same Procedure and carries on from it. That's the only journal that could ever be
+resumed, so each Procedure keeps just the one: starting a run deletes the journals
+of earlier ones that are over, and finishing a run deletes its own. Runs that are
+still going, in another terminal say, keep theirs as long as they're for the same
+content. Answers are in journals as
+plain text, so only their owner can read them."""
+
+import json
+import os
+from hashlib import sha1
+from pathlib import Path
+from time import monotonic, time
+from typing import IO, Dict, List, NamedTuple, Optional, Set
+
+from .constants import CACHE_DIRECTORY_NAME, RUNS_DIRECTORY_NAME
+
+FSYNC_EVERY = 32
+FSYNC_INTERVAL = 2.0  # seconds
+JOURNAL_MODE = 0o600  # answers may well be secrets
+RUNS_DIRECTORY_MODE = 0o700
+
+
+class Progress(NamedTuple):
+    """How far a journaled run got"""
+
+    answers: Dict[str, str]
+    steps: Set[int]  # acknowledged
+    finished: bool
+
+
+def runs_directory(procedure_path: Path) -> Path:
+    """Where the journals for Procedures in this .nothing dir live"""
+
+    return procedure_path.parent / CACHE_DIRECTORY_NAME / RUNS_DIRECTORY_NAME
+
+
+def content_digest(procedure_path: Path) -> str:
+    """Which content of a Procedure file a run was for"""
+
+    return sha1(procedure_path.read_bytes()).hexdigest()
+
+
+def read_progress(location: Path) -> Progress:
+    """Replay a journal. A torn last line, from a run that died mid-write, is
+    simply ignored."""
+
+    answers: Dict[str, str] = {}
+    steps: Set[int] = set()
+    finished = False
+
+    with open(str(location), encoding="utf-8") as file:
+        for line in file:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                break
+
+            event = record.get("event")
+            if event == "answer":
+                answers[record["name"]] = record["value"]
+            elif event == "steps":
+                steps.update(record["steps"])
+            elif event == "finish":
+                finished = True
+
+    return Progress(answers, steps, finished)
+
+
+def _header(location: Path) -> Dict:
+    try:
+        with open(str(location), encoding="utf-8") as file:
+            return json.loads(file.readline())
+    except (OSError, ValueError):
+        return {}
+
+
+def journals(procedure_path: Path) -> List[Path]:
+    """Every journal of a run of this Procedure, newest first"""
+
+    candidates = []
+
+    for location in runs_directory(procedure_path).glob(
+        f"{procedure_path.stem}.*.jsonl"
+    ):
+        try:
+            modified = location.stat().st_mtime
+        except OSError:  # deleted by a run starting or finishing just now
+            continue
+        if _header(location).get("name") == procedure_path.name:
+            candidates.append((modified, location))
+
+    return [location for _, location in sorted(candidates, reverse=True)]
+
+
+def latest_unfinished(procedure_path: Path) -> Optional[Path]:
+    """The newest journal of a run of this very content of this Procedure that
+    didn't make it to the end"""
+
+    digest = content_digest(procedure_path)
+
+    for location in journals(procedure_path):
+        if _header(location).get("digest") != digest:
+            continue
+        if not read_progress(location).finished:
+            return location
+
+    return None
+
+
+def _running(location: Path) -> bool:
+    """Whether the run writing a journal is still going, going by the pid at the
+    end of its name. A run in this process is over, since a new one is starting"""
+
+    try:
+        pid = int(location.stem.rsplit(".", 1)[-1])
+    except ValueError:
+        return False
+
+    if pid == os.getpid():
+        return False
+    if os.name == "nt":  # where os.kill(pid, 0) would terminate the process
+        return True
+
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except OSError:  # it's there, just not ours to signal
+        return True
+
+    return True
+
+
+def _delete(location: Path) -> None:
+    try:
+        location.unlink()
+    except OSError:
+        pass
+
+
+class Journal:
+    """The append-only record of one run. When the .nothing dir can't be written
+    to, it quietly records nothing."""
+
+    def __init__(self, location: Path, file: Optional[IO[str]]):
+        self.location: Path = location
+        self.file: Optional[IO[str]] = file
+        self.unsynced: int = 0
+        self.last_sync: float = monotonic()
+
+    @classmethod
+    def start(cls, procedure_path: Path) -> "Journal":
+        """A new journal for a fresh run of the Procedure"""
+
+        location = runs_directory(procedure_path) / (
+            f"{procedure_path.stem}.{int(time() * 1000)}.{os.getpid()}.jsonl"
+        )
+
+        try:
+            digest = content_digest(procedure_path)
+        except OSError:
+            return cls(location, None)
+
+        for superseded in journals(procedure_path):
+            if _header(superseded).get("digest") != digest or not _running(superseded):
+                _delete(superseded)
+
+        journal = cls.reopen(location)
+        journal.append(
+            {
+                "event": "start",
+                "name": procedure_path.name,
+                "digest": digest,
+                "time": time(),
+            }
+        )
+
+        return journal
+
+    @classmethod
+    def reopen(cls, location: Path) -> "Journal":
+        """A journal to keep appending to"""
+
+        try:
+            location.parent.mkdir(mode=RUNS_DIRECTORY_MODE, parents=True, exist_ok=True)
+            descriptor = os.open(
+                str(location), os.O_WRONLY | os.O_APPEND | os.O_CREAT, JOURNAL_MODE
+            )
+            file: Optional[IO[str]] = open(descriptor, "a", encoding="utf-8")
+        except OSError:
+            file = None
+
+        return cls(location, file)
+
+    def append(self, record: Dict) -> None:
+        """Write a line, flushed right away and fsynced when the batch is due"""
+
+        if self.file is None:
+            return
+
+        try:
+            self.file.write(json.dumps(record, default=str) + "\n")
+            self.file.flush()
+            self.unsynced += 1
+
+            if (
+                self.unsynced >= FSYNC_EVERY
+                or monotonic() - self.last_sync >= FSYNC_INTERVAL
+            ):
+                self.sync()
+        except OSError:
+            self.file = None  # a full disk shouldn't take the walkthrough down too
+
+    def sync(self) -> None:
+        """Make sure everything so far is on disk"""
+
+        if self.file is not None and self.unsynced:
+            os.fsync(self.file.fileno())
+        self.unsynced = 0
+        self.last_sync = monotonic()
+
+    def answered(self, name: str, value: str) -> None:
+        """A variable was given a value"""
+
+        self.append({"event": "answer", "name": name, "value": value})
+
+    def acknowledged(self, steps: List[int]) -> None:
+        """Steps were done"""
+
+        self.append({"event": "steps", "steps": list(steps)})
+
+    def finish(self) -> None:
+        """The run made it to the end, so there's nothing left to resume. The
+        journal is deleted, and says it's finished in case it can't be"""
+
+        self.append({"event": "finish", "time": time()})
+        self.close()
+        _delete(self.location)
+
+    def close(self) -> None:
+        """Sync and close, whether the run finished or not"""
+
+        if self.file is None:
+            return
+
+        try:
+            self.sync()
+            self.file.close()
+        except OSError:
+            pass
+        self.file = None
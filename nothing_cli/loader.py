@@ -0,0 +1,143 @@
+"""Loading many Procedure files at once.
+
+Reading and stat-ing files is mostly waiting on the disk, so that happens in a
+pool of threads. Parsing is pure Python and holds the GIL the whole time, so that
+happens in a pool of processes. Neither is worth starting for a handful of files:
+below PARALLEL_LOADING_THRESHOLD files (or $NOT_PARALLEL_THRESHOLD) everything
+happens right here, one file at a time.
+
+Either way results come back in the order the paths were given, and a file that
+can't be loaded gets a LoadError in its place instead of sinking the rest."""
+import os
+from pathlib import Path
+from typing import TYPE_CHECKING, Callable, List, Optional, Sequence, TypeVar, Union
+
+from .constants import PARALLEL_LOADING_THRESHOLD, PARALLEL_LOADING_THRESHOLD_VAR
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .models import Procedure
+
+T = TypeVar("T")
+
+
+# pylint: disable=import-outside-toplevel
+# the pools, and multiprocessing behind them, are imported only once they're needed.
+# index.py uses this module on every run of `not`, mostly for a few files
+
+
+class LoadError(Exception):
+    """A single file that couldn't be read or parsed"""
+
+    def __init__(self, path: Path, message: str):
+        self.path: Path = path
+        self.message: str = message
+        super().__init__(f"{path}: {message}")
+
+    def __reduce__(self):
+        # whatever went wrong in a worker may not survive pickling, this does
+        return LoadError, (self.path, self.message)
+
+    @classmethod
+    def from_exception(cls, path: Path, err: Exception) -> "LoadError":
+        return cls(path, f"{type(err).__name__}: {err}")
+
+
+def threshold() -> int:
+    """How many files it takes to bother with pools"""
+
+    try:
+        return int(os.environ[PARALLEL_LOADING_THRESHOLD_VAR])
+    except (KeyError, ValueError):
+        return PARALLEL_LOADING_THRESHOLD
+
+
+def worth_a_pool(count: int, minimum: Optional[int] = None) -> bool:
+    """Whether `count` files are enough to spread across workers"""
+
+    return (os.cpu_count() or 1) > 1 and count >= (
+        threshold() if minimum is None else minimum
+    )
+
+
+def _guarded(func: Callable[[Path], T], path: Path) -> Union[T, LoadError]:
+    try:
+        return func(path)
+    except Exception as err:  # pylint: disable=broad-except
+        return LoadError.from_exception(path, err)
+
+
+def _guarded_parse(path: Path, content: Union[bytes, LoadError]):
+    if isinstance(content, LoadError):
+        return content
+
+    from .filesystem import deserialize_procedure
+
+    try:
+        return deserialize_procedure(content, path)
+    except Exception as err:  # pylint: disable=broad-except
+        return LoadError.from_exception(path, err)
+
+
+def _chunksize(count: int) -> int:
+    return max(1, count // ((os.cpu_count() or 1) * 4))
+
+
+def map_threads(
+    func: Callable[[Path], T], paths: Sequence[Path], minimum: Optional[int] = None
+) -> List[Union[T, LoadError]]:
+    """`func` applied to every path, in threads if there are enough of them.
+    For anything that spends its time waiting on the filesystem."""
+
+    if not worth_a_pool(len(paths), minimum):
+        return [_guarded(func, path) for path in paths]
+
+    from concurrent.futures import ThreadPoolExecutor
+
+    with ThreadPoolExecutor() as pool:
+        return list(pool.map(_guarded, [func] * len(paths), paths))
+
+
+def map_processes(
+    func: Callable[[Path], T], paths: Sequence[Path], minimum: Optional[int] = None
+) -> List[Union[T, LoadError]]:
+    """`func` applied to every path, in processes if there are enough of them.
+    `func` must be importable by name, since it's sent to the workers by name."""
+
+    if not worth_a_pool(len(paths), minimum):
+        return [_guarded(func, path) for path in paths]
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor() as pool:
+        return list(
+            pool.map(
+                _guarded,
+                [func] * len(paths),
+                paths,
+                chunksize=_chunksize(len(paths)),
+            )
+        )
+
+
+def _read_bytes(path: Path) -> bytes:
+    return path.read_bytes()
+
+
+def load_procedures(
+    paths: Sequence[Path], minimum: Optional[int] = None
+) -> List[Union["Procedure", LoadError]]:
+    """A Procedure, or the LoadError explaining why not, for every path.
+    Files are read in threads and parsed in processes, once there are enough."""
+
+    paths = list(paths)
+    contents = map_threads(_read_bytes, paths, minimum)
+
+    if not worth_a_pool(len(paths), minimum):
+        return [_guarded_parse(path, content) for path, content in zip(paths, contents)]
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor() as pool:
+        return list(
+            pool.map(_guarded_parse, paths, contents, chunksize=_chunksize(len(paths)))
+        )
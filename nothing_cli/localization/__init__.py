@@ -5,17 +5,20 @@ generally, one need only import the polyglot singleton object
 This module uses an unorthodox approach to singletons to avoid keeping
 state in the module, which feels more awkward.
 
-When python 3.9 comes out in earnest, revisit using a backport of:
-https://www.python.org/dev/peps/pep-0603/ which deals in frozenmappings"""
+Nothing is loaded until the first string is asked for. Strings come from the
+locale files compiled into catalogs/ (see compile.py), and any string a locale
+doesn't have yet comes from English instead."""
 
 import ctypes
+from importlib import import_module
 from json import load
 from locale import getdefaultlocale, normalize, windows_locale
 from os import getenv
 from pathlib import Path
 from platform import system
-from typing import Dict, NamedTuple, Set, Union
+from typing import Dict, Iterator, Mapping, NamedTuple, Optional, Set, Union
 
+from ..trace import span
 from .constants import DEFAULT_LOCALE, STRINGS_SUPPORTED
 
 
@@ -24,7 +27,20 @@ class _LocaleConfig(NamedTuple):
     filename: str
 
 
-class _Polyglot(Dict[str, str]):
+def load_catalog(filename: str) -> Dict[str, str]:
+    """The strings of a locale file, from its compiled catalog if there is one"""
+
+    module_name = filename.rsplit(".", 1)[0]
+
+    try:
+        return import_module(f"{__name__}.catalogs.{module_name}").STRINGS
+    except ImportError:
+        # a locale file that hasn't been compiled yet
+        with open(str(Path(__file__).parent / filename), "rb") as file:
+            return load(file)
+
+
+class _Polyglot(Mapping[str, str]):
     """This class is responsible for lazy-loading the best-effort translation of user-facing
     strings."""
 
@@ -33,42 +49,69 @@ class _Polyglot(Dict[str, str]):
     }
 
     def __init__(self) -> None:
-        system_locale = get_system_locale()
-        maybe_locale_from_alias_map = (
-            k
-            for k, v in self.language_mappings.items()
-            if system_locale == k or system_locale in v.aliases
-        )
-        self.locale = next(maybe_locale_from_alias_map, DEFAULT_LOCALE)
-        locale_file = (
-            Path(__file__).resolve().parent
-            / self.language_mappings[self.locale].filename
-        )
-
-        with open(locale_file, "rb") as file:
-            contents: Dict[str, str] = load(file)
-            super(_Polyglot, self).__init__(contents)
+        self._locale: Optional[str] = None
+        self._strings: Optional[Dict[str, str]] = None
+
+    @property
+    def locale(self) -> str:
+        """The locale strings are chosen for, worked out the first time it's needed"""
+
+        if self._locale is None:
+            system_locale = get_system_locale()
+            maybe_locale_from_alias_map = (
+                k
+                for k, v in self.language_mappings.items()
+                if system_locale == k or system_locale in v.aliases
+            )
+            self._locale = next(maybe_locale_from_alias_map, DEFAULT_LOCALE)
+
+        return self._locale
+
+    @property
+    def strings(self) -> Dict[str, str]:
+        """Every string, English standing in for whatever the locale is missing"""
+
+        if self._strings is None:
+            with span("localization.load"):
+                strings = load_catalog(
+                    self.language_mappings[DEFAULT_LOCALE].filename
+                )
+                if self.locale != DEFAULT_LOCALE:
+                    strings = {
+                        **strings,
+                        **load_catalog(self.language_mappings[self.locale].filename),
+                    }
+                self._strings = strings
+
+        return self._strings
+
+    def __getitem__(self, key: str) -> str:
+        return self.strings[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.strings)
+
+    def __len__(self) -> int:
+        return len(self.strings)
 
     def localized(
         self, key: str, context: Dict[str, Union[int, Union[str, int, object]]]
     ) -> str:
         """Given a key string and context, return formatted localized string"""
-        # Pylint believes this isnt a dict because it doesnt _quite_ speak mypy.
-        return self.__getitem__(key).format(**context)  # pylint: disable=E1101
 
-    # TODO run this somewhere lol :scream_cat:
+        # the template is looked up in a dict that's already loaded. formatting is
+        # cheap next to keeping every message a long-lived `not serve` ever printed
+        return self[key].format(**context)
+
     def test(self) -> None:
         """Test if the locfile is complete."""
 
+        own_strings = load_catalog(self.language_mappings[self.locale].filename)
         missing_entries = [
-            entry
-            for entry in STRINGS_SUPPORTED
-            if entry not in self  # pylint: disable=E1135
+            entry for entry in STRINGS_SUPPORTED if entry not in own_strings
         ]
         superfluous_entries = [
-            entry
-            for entry in self  # pylint: disable=E1133
-            if entry not in STRINGS_SUPPORTED
+            entry for entry in own_strings if entry not in STRINGS_SUPPORTED
         ]
 
         if missing_entries:
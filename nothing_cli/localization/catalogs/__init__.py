@@ -0,0 +1 @@
+"""Locale files compiled into modules, one per locale, see ../compile.py"""
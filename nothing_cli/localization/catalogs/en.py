@@ -0,0 +1,127 @@
+"""Generated from en.json by `python -m nothing_cli.localization.compile`.
+Edit en.json and run that instead of editing this."""
+# flake8: noqa
+# pylint: skip-file
+STRINGS = {
+    "step_prefix": "Step",
+    "default_context_prompt": "Please provide a value for {}",
+    "completion_message": "All done!",
+    "undefined_variable_warn": "Undefined variable in step {step_number}",
+    "steps_placeholder": "...\n\n",
+    "skeleton_title": "Skeleton Procedure",
+    "skeleton_description": "The procedure you get when you pass `--skeleton`",
+    "skeleton_context_name_name": "weather_today",
+    "skeleton_context_name_prompt": "Type anything anything here",
+    "skeleton_knowns_name": "tau",
+    "skeleton_knowns_value": "2π",
+    "skeleton_steps": "Put steps here...\n\nand here.\nAnd use multiple lines if you want.\n\nUse context variables like 'weather_today' --which you said was '{weather_today}'.\nAnd knowns like the value of tau, {tau}, which is hard coded in the procedure...",
+    "easter_steps": "Take 3 deep breaths, {name}.\n\nFind a comfortable position in your seat.\n\nBegin to breathe lightly and slowly, as if you're going to sleep.\n\nClose your eyes and count 10 of your gentle breaths.",
+    "easter_title": "Do Nothing",
+    "easter_description": "Literally do not do anything",
+    "easter_context_var_name": "name",
+    "easter_context_var_prompt": "What's your name?",
+    "cwd": "cwd",
+    "home": "home",
+    "both": "both",
+    "help": "Nothing helps coder be more smarter & less dumber.",
+    "plain_help": "No colors or styles in the output. Setting NO_COLOR does the same",
+    "trace_help": "Print where the time went as JSON to stderr, when done. See also NOT_TRACE",
+    "version_help": "Print the nothing-cli version and exit.",
+    "file_written": "{filename} written to {destination}",
+    "filename_prompt": "What is the new name for the file? 📝",
+    "file_edited": "Edited {name}",
+    "file_renamed": "Renamed {old_name} to {name}",
+    "copied": "Copy of {name} written to {destination}",
+    "dropped": "'{name}' permanetly deleted from:\n    {location} ☠️",
+    "home_dot_nothing_exists_warn": "There is already a .nothing dir in your home",
+    "cwd_dot_nothing_exists_warn": "There is already a .nothing dir in your cwd",
+    "missing_dot_nothings_warn": "No .nothing directory in cwd or home.\nRun `not init` to create one.",
+    "made_cwd_dot_nothing_dir": "Created ./.nothing/",
+    "made_sample_procedure": "Created a sample Procdure called 'nothing' for you in {directory} 💖",
+    "delete_suggestion": "    For a clean start, delete and run this command again.",
+    "init_help": "Create ./.nothing if it doesn't exist.",
+    "completion_help": "Print the shell completion script for bash, zsh or fish.",
+    "unsupported_shell_warn": "Completion is available for: {shells}",
+    "do_batch_option_help": "Don't prompt, print every step at once. Variables come from --set, --answers or knowns.",
+    "do_set_option_help": "name=value for a variable, implies --batch. Can be given more than once.",
+    "do_answers_option_help": "A JSON or YAML file of variable values, or - for stdin (JSON lines render once per line). Implies --batch.",
+    "bad_answers_warn": "Couldn't read the answers: {error}",
+    "do_run_option_help": "Run the command on the last line of a step, if it starts with $. Commands ending in & run alongside the next ones that do",
+    "do_timeout_option_help": "Seconds each command gets before it's stopped, with --run",
+    "do_jobs_option_help": "How many commands can run at once, with --run. 4 by default",
+    "command_failed_warn": "Step {step}'s command exited with status {code}. Keep going?",
+    "command_timed_out_warn": "Step {step}'s command was stopped after {timeout} seconds. Keep going?",
+    "critical_path": "Critical path: {path} ({length} of {count} steps). Starred steps hold everything else up",
+    "ready_steps": "Ready now, in any order: steps {steps}",
+    "checklist_nag": "Press enter once they're all done...",
+    "bad_step_graph_warn": "😕 The steps of this Procedure can't be put in order: {error}",
+    "do_resume_option_help": "Pick up the last run of this Procedure that didn't finish, at its first unfinished step",
+    "resuming": "Resuming at step {step}, with {answers} answers from last time",
+    "nothing_to_resume_warn": "There's no unfinished run of this Procedure to resume, starting from the top",
+    "stats_help": "Show how long each step of a Procedure takes, and where runs of it are given up",
+    "stats_runs": "{runs} runs, {completed} finished",
+    "stats_step_column": "Step",
+    "stats_runs_column": "Runs",
+    "stats_abandoned": "Given up at: {points}",
+    "stats_abandoned_point": "step {step} ({count})",
+    "no_history_warn": "{name} hasn't been walked through yet",
+    "serve_help": "Keep not loaded in the background to answer ls, info, stats, render and do --batch in this directory instantly",
+    "serve_detach_option_help": "Run in the background",
+    "serve_stop_option_help": "Stop the daemon serving this directory",
+    "serving": "Serving {directory} on {socket}",
+    "already_serving_warn": "Something is serving on {socket} already",
+    "not_serving_warn": "Nothing is serving on {socket}",
+    "socket_not_private_warn": "Not serving on {socket}, it or its directory belongs to somebody else",
+    "missing_answers_warn": "😕 No value for: {names}",
+    "render_help": "Render a Procedure once per row of a CSV or JSON lines file",
+    "render_rows_argument_help": "A CSV or JSON lines file of variable values, or - for stdin",
+    "render_format_option_help": "csv or jsonl. Defaults to csv for .csv files and jsonl otherwise",
+    "render_output_option_help": "A directory to write one file per row to, instead of stdout",
+    "render_key_option_help": "The column to name each file after. Files are numbered by row otherwise, and repeated names get the row number appended",
+    "render_jobs_option_help": "How many processes to render with. 0 for one per CPU",
+    "render_format_warn": "--format must be csv or jsonl",
+    "missing_row_answers_warn": "😕 Row {row} has no value for: {names}",
+    "convert_help": "Rewrite the Procedures in a directory as yaml, json or binary.",
+    "convert_directory_option_help": "The directory to convert, instead of ./.nothing or ~/.nothing",
+    "convert_keep_option_help": "Keep the original files around.",
+    "unsupported_format_warn": "Procedures can be written as: {formats}",
+    "convert_exists_warn": "⚠️  Skipping, {name} exists already",
+    "convert_failed_warn": "⚠️  Skipping {name}, it couldn't be read: {error}",
+    "converted": "Converted {count} Procedure(s) in {directory} to {format}",
+    "not_editable_warn": "😕 '{name}' is stored as binary. Run `not convert yaml` to edit it.",
+    "nag": "Press enter to continue...",
+    "new_description_prompt": "A short description",
+    "new_title_prompt": "The title of your Procedure",
+    "new_name_prompt": "The name of the file",
+    "new_destination_prompt": "Destination directory",
+    "new_open_editor_prompt": "Open $EDITOR now?",
+    "new_help": "Create a new Procedure. Interactive when called without arguments (recommended).",
+    "new_procedure_name_option_help": "The name of the Procedure you're making. No extension, just the name.",
+    "new_extension_option_help": "The extension to apply to the generated file",
+    "new_nothing_flag_help": "Create a sample Procedure called 'nothing'.",
+    "global_flag_help": "Point the command at ~/.nothing instead of the deafault, ./.nothing",
+    "new_skeleton_option_help": "Create the Procedure without prompting for values instead using default placeholders.",
+    "edit_after_option_help": "Open $EDITOR after command completes.",
+    "new_overwrite_option_help": "If a Procedure with the given name exists, overwrite it or don't.",
+    "must_be_called_with_name_warn": "Can't use --empty/-E without --name/-N specified",
+    "edit_name_prompt": "New Procedure name",
+    "edit_title_prompt": "New Procedure title",
+    "edit_destination_prompt": "Destination dir for copy",
+    "edit_extension_prompt": "Extension for new Procedure",
+    "edit_open_editor_prompt": "Edit after write?",
+    "GLOBAL": "GLOBAL",
+    "LOCAL": "LOCAL",
+    "overwrite_warn": "🤔 Procedure '{name}' appears to exist already\nWould you like to overwrite it?",
+    "drop_warn": "😬 Are you sure you want to permanently delete '{name}'?",
+    "stylish_interjection": "Success! 🙌",
+    "missing_file_warn": "😕 It doesn't look like there's a procedure for '{name}'.",
+    "shadowed_warn": "⚠️  Shadows another Procedure with the same name at {location}",
+    "title_descriptor": "Title",
+    "description_descriptor": "Description",
+    "context_vars_descriptor": "Context vars",
+    "knowns_descriptor": "Knowns",
+    "step_count_descriptor": "# Steps",
+    "full_path_descriptor": "Full path",
+    "last_modified_descriptor": "Last modified",
+    "last_accessed_descriptor": "Last accessed",
+}
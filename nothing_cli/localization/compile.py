@@ -0,0 +1,56 @@
+"""Compile the locale files into modules under catalogs/
+
+Importing a module comes straight out of its cached bytecode, where a JSON file has
+to be found, read and parsed on every run of `not`. The JSON files stay the source
+of truth: after editing one, run
+
+    python -m nothing_cli.localization.compile
+
+and commit the catalog it rewrites alongside it."""
+import json
+from pathlib import Path
+from typing import Dict
+
+LOCALIZATION_DIR = Path(__file__).parent
+CATALOGS_DIR = LOCALIZATION_DIR / "catalogs"
+
+HEADER = '''"""Generated from {source} by `python -m nothing_cli.localization.compile`.
+Edit {source} and run that instead of editing this."""
+# flake8: noqa
+# pylint: skip-file
+'''
+
+
+def catalog_source(strings: Dict[str, str], source: str) -> str:
+    """The Python module holding `strings`"""
+
+    # JSON strings are Python strings too, and come out the way black likes them
+    entries = "".join(
+        f"    {json.dumps(key)}: {json.dumps(value, ensure_ascii=False)},\n"
+        for key, value in strings.items()
+    )
+
+    return HEADER.format(source=source) + f"STRINGS = {{\n{entries}}}\n"
+
+
+def compile_locale(path: Path) -> Path:
+    """Write the catalog for one locale file, returning where it went"""
+
+    with open(str(path), "rb") as file:
+        strings: Dict[str, str] = json.load(file)
+
+    catalog = CATALOGS_DIR / f"{path.stem}.py"
+    catalog.write_text(catalog_source(strings, path.name), encoding="utf-8")
+
+    return catalog
+
+
+def main() -> None:
+    """Compile every locale file"""
+
+    for path in sorted(LOCALIZATION_DIR.glob("*.json")):
+        print(f"{path.name} -> {compile_locale(path).relative_to(LOCALIZATION_DIR)}")
+
+
+if __name__ == "__main__":
+    main()
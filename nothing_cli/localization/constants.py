@@ -3,39 +3,128 @@ from locale import normalize
 
 DEFAULT_LOCALE = normalize("en")
 
-# This was generated by calling set() on the en file.
+# Every key of the en file, which every other locale should have too.
+# polyglot.test() checks the two agree
 STRINGS_SUPPORTED = {
     "GLOBAL",
     "LOCAL",
+    "already_serving_warn",
+    "bad_answers_warn",
+    "bad_step_graph_warn",
     "both",
+    "checklist_nag",
+    "command_failed_warn",
+    "command_timed_out_warn",
+    "completion_help",
     "completion_message",
-    "context_prompt",
+    "context_vars_descriptor",
+    "convert_directory_option_help",
+    "convert_exists_warn",
+    "convert_failed_warn",
+    "convert_help",
+    "convert_keep_option_help",
+    "converted",
     "copied",
+    "critical_path",
     "cwd",
-    "default_context_name_name",
-    "default_context_name_prompt",
-    "default_knowns_name",
-    "default_knowns_response",
-    "default_steps",
-    "default_title",
+    "cwd_dot_nothing_exists_warn",
+    "default_context_prompt",
+    "delete_suggestion",
+    "description_descriptor",
+    "do_answers_option_help",
+    "do_batch_option_help",
+    "do_jobs_option_help",
+    "do_resume_option_help",
+    "do_run_option_help",
+    "do_set_option_help",
+    "do_timeout_option_help",
+    "drop_warn",
+    "dropped",
+    "easter_context_var_name",
+    "easter_context_var_prompt",
+    "easter_description",
+    "easter_steps",
+    "easter_title",
+    "edit_after_option_help",
     "edit_destination_prompt",
     "edit_extension_prompt",
     "edit_name_prompt",
     "edit_open_editor_prompt",
     "edit_title_prompt",
     "file_edited",
+    "file_renamed",
     "file_written",
     "filename_prompt",
+    "full_path_descriptor",
+    "global_flag_help",
     "help",
     "home",
+    "home_dot_nothing_exists_warn",
+    "init_help",
+    "knowns_descriptor",
+    "last_accessed_descriptor",
+    "last_modified_descriptor",
+    "made_cwd_dot_nothing_dir",
+    "made_sample_procedure",
+    "missing_answers_warn",
+    "missing_dot_nothings_warn",
     "missing_file_warn",
+    "missing_row_answers_warn",
+    "must_be_called_with_name_warn",
     "nag",
+    "new_description_prompt",
     "new_destination_prompt",
-    "new_extension_prompt",
-    "new_extra_config_prompt",
+    "new_extension_option_help",
+    "new_help",
+    "new_name_prompt",
+    "new_nothing_flag_help",
     "new_open_editor_prompt",
+    "new_overwrite_option_help",
+    "new_procedure_name_option_help",
+    "new_skeleton_option_help",
     "new_title_prompt",
+    "no_history_warn",
+    "not_editable_warn",
+    "not_serving_warn",
+    "nothing_to_resume_warn",
     "overwrite_warn",
+    "plain_help",
+    "ready_steps",
+    "render_format_option_help",
+    "render_format_warn",
+    "render_help",
+    "render_jobs_option_help",
+    "render_key_option_help",
+    "render_output_option_help",
+    "render_rows_argument_help",
+    "resuming",
+    "serve_detach_option_help",
+    "serve_help",
+    "serve_stop_option_help",
+    "serving",
+    "shadowed_warn",
+    "skeleton_context_name_name",
+    "skeleton_context_name_prompt",
+    "skeleton_description",
+    "skeleton_knowns_name",
+    "skeleton_knowns_value",
+    "skeleton_steps",
+    "skeleton_title",
+    "socket_not_private_warn",
+    "stats_abandoned",
+    "stats_abandoned_point",
+    "stats_help",
+    "stats_runs",
+    "stats_runs_column",
+    "stats_step_column",
+    "step_count_descriptor",
     "step_prefix",
+    "steps_placeholder",
     "stylish_interjection",
+    "title_descriptor",
+    "trace_help",
+    "undefined_variable_warn",
+    "unsupported_format_warn",
+    "unsupported_shell_warn",
+    "version_help",
 }
@@ -1,37 +1,28 @@
-# pylint: disable=too-many-arguments
+# pylint: disable=too-many-arguments,import-outside-toplevel
 
-"""The subcommands of `not`"""
+"""The subcommands of `not`
 
+Each subcommand imports what it needs from theatrics, writer and models itself.
+Those pull in pydantic, ruamel and friends, which `not --version` has no use for."""
+
+from inspect import signature
 from pathlib import Path
+from typing import TYPE_CHECKING, List, Set
 
 import typer
 
-from . import __version__, writer
+from . import __version__, screen, trace
 from .constants import CWD_DOT_NOTHING_DIR, HOME_DOT_NOTHING_DIR, PROCEDURE_EXT
-from .filesystem import (
-    deserialize_procedure_file,
-    friendly_prefix_for_path,
-    procedure_location,
-)
+from .filesystem import friendly_prefix_for_path, procedure_location
 from .localization import polyglot as glot
-from .models import Procedure
 from .subcommand_shared import (
     completable_procedure_name_argument,
     edit_after_flag,
     global_flag,
 )
-from .theatrics import (
-    ask,
-    config_exists_warn,
-    confirm_drop,
-    confirm_overwrite,
-    interactive_walkthrough,
-    prompt_for_new_args,
-    show_dossier,
-    show_fancy_list,
-    success,
-    warn_missing_file,
-)
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .models import Procedure
 
 app = typer.Typer(help=glot["help"])
 
@@ -52,16 +43,26 @@ def _(
         callback=_version_callback,
         is_eager=True,
         help=glot["version_help"],
-    )
+    ),
+    trace_: bool = typer.Option(False, "--trace", help=glot["trace_help"]),
+    plain: bool = typer.Option(False, "--plain", help=glot["plain_help"]),
 ):
     """This unnamed function is for registering any --options that ought to be attached
     to the `not` command itself, but not any subcommands."""
 
+    if trace_:
+        trace.enable()
+
+    if plain:
+        screen.set_plain()
+
 
 @app.command(help=glot["init_help"])
 def init():
     """Command to create a .nothing directory locally"""
 
+    from .theatrics import config_exists_warn, success
+
     if CWD_DOT_NOTHING_DIR.exists():
         config_exists_warn(glot["cwd_dot_nothing_exists_warn"])
     else:
@@ -70,18 +71,171 @@ def init():
 
 
 @app.command()
-def do(procedure_name: str = completable_procedure_name_argument):
+def do(
+    procedure_name: str = completable_procedure_name_argument,
+    batch: bool = typer.Option(
+        False, "--batch", "-b", help=glot["do_batch_option_help"]
+    ),
+    assignments: List[str] = typer.Option(
+        None, "--set", "-s", help=glot["do_set_option_help"]
+    ),
+    answers: str = typer.Option(
+        None, "--answers", "-a", help=glot["do_answers_option_help"]
+    ),
+    run: bool = typer.Option(False, "--run", "-r", help=glot["do_run_option_help"]),
+    timeout: float = typer.Option(
+        None, "--timeout", "-t", help=glot["do_timeout_option_help"]
+    ),
+    jobs: int = typer.Option(None, "--jobs", "-j", help=glot["do_jobs_option_help"]),
+    resume: bool = typer.Option(False, "--resume", help=glot["do_resume_option_help"]),
+):
     """Go through the steps of a Procedure you have already created"""
 
+    from .compiled import load_procedure
+    from .graph import BadStepGraph
+    from .theatrics import interactive_walkthrough, warn_missing_file
+
+    file_location: Path = procedure_location(procedure_name)
+
+    if file_location is None:
+        warn_missing_file(procedure_name)
+        raise typer.Abort
+
+    procedure: "Procedure" = load_procedure(file_location)
+
+    if batch or assignments or answers:
+        _do_batch(procedure, assignments or [], answers)
+        return
+
+    try:
+        interactive_walkthrough(
+            procedure, run=run, timeout=timeout, jobs=jobs, resume=resume
+        )
+    except BadStepGraph as err:
+        typer.echo(glot.localized("bad_step_graph_warn", {"error": err}), err=True)
+        raise typer.Exit(code=1)
+
+
+def _do_batch(procedure: "Procedure", assignments: List[str], answers: str):
+    """`not do --batch`: render every step at once, or fail before printing any"""
+
+    from .batch import (
+        BadAnswers,
+        MissingVariables,
+        parse_answers,
+        parse_assignments,
+        read_answers,
+        render_all,
+    )
+
+    try:
+        overrides = parse_assignments(assignments)
+        if answers == "-":
+            answer_sets = parse_answers(typer.get_text_stream("stdin").read())
+        else:
+            answer_sets = [read_answers(Path(answers)) if answers else {}]
+    except (BadAnswers, OSError) as err:
+        raise typer.BadParameter(glot.localized("bad_answers_warn", {"error": err}))
+
+    try:
+        output = render_all(procedure, answer_sets, overrides)
+    except MissingVariables as err:
+        typer.echo(
+            glot.localized("missing_answers_warn", {"names": ", ".join(err.names)}),
+            err=True,
+        )
+        raise typer.Exit(code=1)
+
+    typer.echo(output, nl=False)
+
+
+@app.command(help=glot["render_help"])
+def render(
+    procedure_name: str = completable_procedure_name_argument,
+    rows: str = typer.Argument(..., help=glot["render_rows_argument_help"]),
+    format_: str = typer.Option(
+        None, "--format", "-f", help=glot["render_format_option_help"]
+    ),
+    output: Path = typer.Option(
+        None, "--output", "-o", help=glot["render_output_option_help"]
+    ),
+    key: str = typer.Option(None, "--key", "-k", help=glot["render_key_option_help"]),
+    jobs: int = typer.Option(1, "--jobs", "-j", help=glot["render_jobs_option_help"]),
+):
+    """Render a Procedure once for every row of a CSV or JSON lines file"""
+
+    import os
+    from contextlib import ExitStack
+
+    from slugify import slugify
+
+    from .batch import (
+        BadAnswers,
+        MissingVariables,
+        read_rows,
+        render_rows,
+        renderer_for,
+    )
+    from .compiled import load_procedure
+    from .theatrics import warn_missing_file
+
     file_location: Path = procedure_location(procedure_name)
 
     if file_location is None:
         warn_missing_file(procedure_name)
         raise typer.Abort
 
-    procedure: Procedure = deserialize_procedure_file(file_location)
+    if format_ is None:
+        format_ = "csv" if rows.endswith(".csv") else "jsonl"
+    if format_ not in ("csv", "jsonl"):
+        raise typer.BadParameter(glot["render_format_warn"])
+
+    procedure: "Procedure" = load_procedure(file_location)
+    jobs = jobs if jobs > 0 else os.cpu_count() or 1
 
-    interactive_walkthrough(procedure)
+    if output is not None:
+        output.mkdir(parents=True, exist_ok=True)
+    written: Set[str] = set()
+
+    try:
+        with ExitStack() as stack:
+            stream = (
+                typer.get_text_stream("stdin")
+                if rows == "-"
+                else stack.enter_context(open(rows, newline=""))
+            )
+            columns, answer_sets = read_rows(stream, format_)
+            if columns is not None:
+                # every row of a CSV has the same names, so one check covers them all
+                renderer_for(procedure).check(dict.fromkeys(columns))
+
+            rendered = render_rows(procedure, answer_sets, jobs)
+            for row, (answers, document) in enumerate(rendered, 1):
+                if output is None:
+                    typer.echo(document if row == 1 else "\n" + document, nl=False)
+                    continue
+                name = (
+                    slugify(str(answers[key]))
+                    if key in answers
+                    else f"{procedure_name}-{row}"
+                )
+                while name in written:  # rows can share a key, or its slug
+                    name = f"{name}-{row}"
+                written.add(name)
+                (output / f"{name}.txt").write_text(document)
+    except (BadAnswers, OSError) as err:
+        raise typer.BadParameter(glot.localized("bad_answers_warn", {"error": err}))
+    except MissingVariables as err:
+        names = ", ".join(err.names)
+        warning = (
+            glot.localized("missing_answers_warn", {"names": names})
+            if err.row is None
+            else glot.localized(
+                "missing_row_answers_warn", {"row": err.row, "names": names}
+            )
+        )
+        typer.echo(warning, err=True)
+        raise typer.Exit(code=1)
 
 
 def _which_procedure(
@@ -90,10 +244,12 @@ def _which_procedure(
     description: str,
     destination_dir: Path,
     procedure_filename: str,
-) -> Procedure:
+) -> "Procedure":
     """Wrapper around the logic for deciding what procedure to write when calling
     `not new` with different arguments."""
 
+    from .models import Procedure
+
     path = destination_dir / procedure_filename
     proc_map = {
         "skeleton": Procedure(
@@ -164,6 +320,9 @@ def new(
 ):
     """Subcommand for creating new Procedures"""
 
+    from . import filesystem, writer
+    from .theatrics import confirm_overwrite, prompt_for_new_args, success
+
     destination_dir = HOME_DOT_NOTHING_DIR if global_ else CWD_DOT_NOTHING_DIR
 
     prompt_display_defaults = {
@@ -203,17 +362,9 @@ def new(
     except FileExistsError:
         if confirm_overwrite(procedure.name):
             writer.write(procedure, force=True)
+    filesystem.catalog().save()
 
-    # pylint: disable=import-outside-toplevel
     if edit_after:
-        # this is a special occasion!
-        from importlib import reload
-        from . import filesystem
-
-        # `state` in filesystem needs to be recalculated on account of the new
-        # file in the directories it looks at. importlib does the trick!
-        reload(filesystem)
-
         ctx.invoke(edit, procedure_name=procedure.name)
 
     success(
@@ -230,15 +381,25 @@ def edit(
 ):
     """Edit existing Procedure with $EDITOR"""
 
+    from . import backends, filesystem
+    from .theatrics import ask, success, warn_missing_file
+
     path_to_procedure: Path = procedure_location(procedure_name)
 
     if path_to_procedure is None:
         warn_missing_file(procedure_name)
         raise typer.Abort()
 
+    if not backends.for_path(path_to_procedure).editable:
+        typer.echo(glot.localized("not_editable_warn", {"name": procedure_name}))
+        raise typer.Abort()
+
     if rename:
-        new_name = ask(glot["filename_prompt"])
-        path_to_procedure.rename(path_to_procedure.parent / new_name)
+        new_name = filesystem.without_procedure_ext(ask(glot["filename_prompt"]))
+        renamed = path_to_procedure.with_name(new_name + path_to_procedure.suffix)
+        path_to_procedure.rename(renamed)
+        filesystem.catalog().rename(path_to_procedure, renamed)
+        path_to_procedure = renamed
         success(
             glot.localized(
                 "file_renamed", {"name": new_name, "old_name": procedure_name}
@@ -246,6 +407,9 @@ def edit(
         )
 
     typer.edit(filename=str(path_to_procedure))
+    catalog = filesystem.catalog()
+    catalog.invalidate(path_to_procedure)
+    catalog.save()
     success(glot.localized("file_edited", {"name": procedure_name}))
 
 
@@ -253,6 +417,8 @@ def edit(
 def ls():
     """Display the location of every Procedure in cwd and/or $HOME"""
 
+    from .theatrics import show_fancy_list
+
     show_fancy_list()
 
 
@@ -262,6 +428,9 @@ def drop(
 ):
     """Permanently delete a Procedure file. Confirm before doing unless specified"""
 
+    from . import filesystem
+    from .theatrics import confirm_drop, success, warn_missing_file
+
     file: Path = procedure_location(procedure_name)
 
     if file is None:
@@ -270,6 +439,9 @@ def drop(
 
     if no_confirm or confirm_drop(procedure_name):
         file.unlink()
+        catalog = filesystem.catalog()
+        catalog.remove(file)
+        catalog.save()
         success(
             glot.localized("dropped", {"name": procedure_name, "location": file.parent})
         )
@@ -279,4 +451,161 @@ def drop(
 def info(procedure_name: str = completable_procedure_name_argument):
     """Display a little overview of the Procedure"""
 
+    from .theatrics import show_dossier
+
     show_dossier(procedure_name)
+
+
+@app.command(help=glot["stats_help"])
+def stats(procedure_name: str = completable_procedure_name_argument):
+    """Display how long each step of a Procedure takes, from its history"""
+
+    from .theatrics import show_stats
+
+    show_stats(procedure_name)
+
+
+@app.command(help=glot["convert_help"])
+def convert(
+    to: str,
+    directory: Path = typer.Option(
+        None, "--directory", "-d", help=glot["convert_directory_option_help"]
+    ),
+    global_: bool = global_flag,
+    keep: bool = typer.Option(
+        False, "--keep", "-k", help=glot["convert_keep_option_help"]
+    ),
+):
+    """Rewrite every Procedure in a directory in another format"""
+
+    from . import backends, filesystem, writer
+    from .filesystem import procedure_files
+    from .loader import LoadError, load_procedures
+    from .theatrics import success
+
+    backend = backends.BACKENDS.get(to)
+
+    if backend is None:
+        raise typer.BadParameter(
+            glot.localized(
+                "unsupported_format_warn", {"formats": ", ".join(backends.BACKENDS)}
+            )
+        )
+
+    if directory is None:
+        directory = HOME_DOT_NOTHING_DIR if global_ else CWD_DOT_NOTHING_DIR
+    directory = directory.expanduser()
+
+    convertible = []
+    for path in sorted(procedure_files(directory)):
+        destination = path.with_suffix(backend.extensions[0])
+
+        if path.suffix in backend.extensions:
+            continue
+
+        if destination.exists():
+            typer.echo(
+                glot.localized("convert_exists_warn", {"name": destination.name})
+            )
+            continue
+
+        convertible.append(path)
+
+    converted = 0
+    for path, procedure in zip(convertible, load_procedures(convertible)):
+        if isinstance(procedure, LoadError):
+            typer.echo(
+                glot.localized(
+                    "convert_failed_warn",
+                    {"name": path.name, "error": procedure.message},
+                )
+            )
+            continue
+
+        procedure.path = path.with_suffix(backend.extensions[0])
+        writer.write(procedure)
+
+        if not keep:
+            path.unlink()
+            filesystem.catalog().remove(path)
+        converted += 1
+    filesystem.catalog().save()
+
+    success(
+        glot.localized(
+            "converted", {"count": converted, "format": to, "directory": directory}
+        )
+    )
+
+
+@app.command(help=glot["serve_help"])
+def serve(
+    detach: bool = typer.Option(
+        False, "--detach", "-d", help=glot["serve_detach_option_help"]
+    ),
+    stop: bool = typer.Option(False, "--stop", help=glot["serve_stop_option_help"]),
+):
+    """Keep `not` loaded in the background, answering commands run in this directory"""
+
+    from . import server
+    from .client import socket_path
+
+    location = socket_path()
+
+    if stop:
+        if not server.stop():
+            typer.echo(glot.localized("not_serving_warn", {"socket": location}))
+            raise typer.Exit(code=1)
+        return
+
+    try:
+        daemon = server.start(location)
+    except FileExistsError:
+        typer.echo(glot.localized("already_serving_warn", {"socket": location}))
+        raise typer.Exit(code=1)
+    except PermissionError:
+        typer.echo(glot.localized("socket_not_private_warn", {"socket": location}))
+        raise typer.Exit(code=1)
+
+    typer.echo(glot.localized("serving", {"directory": Path.cwd(), "socket": location}))
+
+    if detach and not server.detach():
+        return  # the daemon carries on in the child
+
+    daemon.serve()
+
+
+@app.command(help=glot["completion_help"])
+def completion(shell: str):
+    """Print the completion script for bash, zsh or fish"""
+
+    from .completion import SHELLS, shell_script
+
+    if shell not in SHELLS:
+        raise typer.BadParameter(
+            glot.localized("unsupported_shell_warn", {"shells": ", ".join(SHELLS)})
+        )
+
+    def command_name(command) -> str:
+        return command.name or command.callback.__name__.replace("_", "-")
+
+    def takes_procedure_name(command) -> bool:
+        return any(
+            parameter.default is completable_procedure_name_argument
+            for parameter in signature(command.callback).parameters.values()
+        )
+
+    typer.echo(
+        shell_script(
+            shell,
+            commands=[
+                command_name(c) for c in app.registered_commands if not c.hidden
+            ],
+            procedure_commands=[
+                command_name(c)
+                for c in app.registered_commands
+                if takes_procedure_name(c)
+            ],
+        ),
+        nl=False,
+    )
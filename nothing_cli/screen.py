@@ -0,0 +1,84 @@
+"""Output built up a screen at a time and written all at once.
+
+Every typer.echo is a write to the terminal, which over a slow SSH connection is
+something you can watch happen line by line. A Screen collects everything that
+goes on screen together and writes it in one go when it's done.
+
+Styles are worked out once: the ANSI codes that start each style are cached, so
+styling a line is just gluing strings together. In plain mode (`not --plain`, or
+the NO_COLOR environment variable, see no-color.org) there are no styles at all."""
+import os
+from functools import lru_cache
+from typing import List, Tuple
+
+import typer
+
+RESET = "\x1b[0m"
+
+_plain: bool = bool(os.environ.get("NO_COLOR"))
+
+
+def set_plain(plain: bool = True) -> None:
+    """Turn styling off (or back on) for everything from here on"""
+
+    global _plain  # pylint: disable=global-statement
+    _plain = plain
+
+
+def is_plain() -> bool:
+    """Whether styles are being left out"""
+
+    return _plain
+
+
+@lru_cache(maxsize=None)
+def _prefix(style: Tuple[Tuple[str, object], ...]) -> str:
+    return typer.style("", reset=False, **dict(style))
+
+
+def style(text: str, **styles) -> str:
+    """`text` in the given style. Takes the same arguments as typer.style"""
+
+    if _plain or not styles:
+        return text
+
+    return _prefix(tuple(sorted(styles.items()))) + text + RESET
+
+
+class Screen:
+    """Lines of output that get written all at once, either on flush() or when the
+    `with` block it was opened in ends
+
+        with Screen() as screen:
+            screen.line("Hello", bold=True)
+            screen.line()
+    """
+
+    def __init__(self, err: bool = False):
+        self.err: bool = err
+        self.parts: List[str] = []
+
+    def __enter__(self) -> "Screen":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.flush()
+
+    def add(self, text: str = "", **styles) -> "Screen":
+        """Some text, with no newline after it"""
+
+        self.parts.append(style(text, **styles))
+
+        return self
+
+    def line(self, text: str = "", **styles) -> "Screen":
+        """A line of text, styled"""
+
+        return self.add(text, **styles).add("\n")
+
+    def flush(self) -> None:
+        """Write out everything so far in a single echo"""
+
+        if self.parts:
+            typer.echo("".join(self.parts), nl=False, err=self.err)
+            self.parts = []
@@ -0,0 +1,257 @@
+"""`not serve`: `not`, kept running so commands don't pay for starting up.
+
+Every run of `not` starts an interpreter, imports typer, pydantic and ruamel,
+finds the catalog and loads its strings before it does anything at all. For
+scripts that call `not` thousands of times a day that's nearly all the time it
+takes. The daemon pays for it once, then answers the client (see client.py) over
+a Unix socket, with the catalog, localized strings, loaded Procedures and their
+compiled templates already in memory.
+
+A daemon serves the directory it was started in, plus home, the same as `not`
+would there. It watches their .nothing dirs (see catalog.py) and brings itself up
+to date before every request, forgetting any Procedure whose file changed.
+
+Each request is one line of JSON, and so is its answer:
+
+    {"argv": ["info", "deploy"], "stdin": null, "color": false, "plain": false}
+    {"complete": "dep"}   what `not-complete dep` prints
+    {"locate": "deploy"}  where the Procedure called deploy lives
+    {"stop": true}
+
+    {"code": 0, "stdout": "...", "stderr": ""}
+
+Requests also say which directory they're from. One from anywhere but the
+daemon's own directory, which can happen when $NOT_SOCKET points every `not` at
+the same daemon, is answered with {"refused": "..."} and runs in the client.
+
+Requests are answered one at a time, in this one thread, since a command is free
+to change module state as it runs."""
+import io
+import json
+import os
+import socket
+import socketserver
+import sys
+import traceback
+from pathlib import Path
+from stat import S_ISDIR
+from typing import Dict, List, Optional
+
+from . import compiled, filesystem, screen, trace
+from .catalog import Catalog
+from .client import private, socket_directory, socket_path
+from .completion import CompletionIndex, completables_from_entries, completion_lines
+
+
+class _Output(io.TextIOWrapper):
+    """Somewhere for a command to print to, that's a terminal if the client's is"""
+
+    def __init__(self, terminal: bool):
+        super().__init__(io.BytesIO(), encoding="utf-8", newline="")
+        self.terminal: bool = terminal
+
+    def isatty(self) -> bool:
+        return self.terminal
+
+    def text(self) -> str:
+        """Everything printed so far"""
+
+        self.flush()
+
+        return self.buffer.getvalue().decode("utf-8")
+
+
+def run_captured(
+    argv: List[str], stdin: Optional[str], color: bool, plain: bool = False
+) -> Dict:
+    """Run `not` with `argv` in this process, as if from the client's terminal.
+    Whatever the command's options switch on (--plain, --trace) is only switched
+    on for the command"""
+
+    from .main import app  # pylint: disable=import-outside-toplevel
+
+    stdout, stderr = _Output(color), _Output(color)
+    saved = sys.stdin, sys.stdout, sys.stderr
+    was_plain, was_tracing = screen.is_plain(), trace.enabled()
+    sys.stdin = io.StringIO(stdin or "")
+    sys.stdout, sys.stderr = stdout, stderr
+    screen.set_plain(plain)
+
+    try:
+        app(argv, prog_name="not")
+        code = 0
+    except SystemExit as exit_:
+        code = exit_.code if isinstance(exit_.code, int) else int(bool(exit_.code))
+    except Exception:  # pylint: disable=broad-except
+        traceback.print_exc()
+        code = 1
+    finally:
+        if trace.enabled() and not was_tracing:  # the report goes to the client
+            trace.finish()
+        screen.set_plain(was_plain)
+        sys.stdin, sys.stdout, sys.stderr = saved
+
+    return {"code": code, "stdout": stdout.text(), "stderr": stderr.text()}
+
+
+class Daemon(socketserver.UnixStreamServer):
+    """The server, and everything it keeps in memory between requests"""
+
+    def __init__(self, location: Path, catalog: Catalog):
+        self.location: Path = location
+        self.catalog: Catalog = catalog
+        self.cwd: str = os.getcwd()
+        self.stopping: bool = False
+
+        _clear_stale_socket(location)
+        super().__init__(str(location), _Handler)
+        os.chmod(str(location), 0o600)
+
+    def answer(self, message: Dict) -> Dict:
+        """What to send back for a request"""
+
+        if message.get("stop"):
+            self.stopping = True
+            return _printed("")
+
+        if message.get("cwd", self.cwd) != self.cwd:
+            return {"refused": f"serving {self.cwd}, not {message['cwd']}"}
+
+        for path in self.catalog.refresh():
+            compiled.forget(path)
+
+        if "complete" in message:
+            completions = CompletionIndex(
+                completables_from_entries(self.catalog.summaries().values())
+            )
+            return _printed(completion_lines(completions.complete(message["complete"])))
+
+        if "locate" in message:
+            location = self.catalog.location(
+                filesystem.without_procedure_ext(message["locate"])
+            )
+            return _printed("", 1) if location is None else _printed(str(location))
+
+        return run_captured(
+            message["argv"],
+            message.get("stdin"),
+            bool(message.get("color")),
+            bool(message.get("plain")),
+        )
+
+    def serve(self) -> None:
+        """Answer requests until asked to stop"""
+
+        try:
+            while not self.stopping:
+                self.handle_request()
+        finally:
+            self.close()
+
+    def close(self) -> None:
+        """Stop listening and watching"""
+
+        self.server_close()
+        self.catalog.close()
+        try:
+            self.location.unlink()
+        except OSError:
+            pass
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    def handle(self) -> None:
+        line = self.rfile.readline()
+        if not line:  # only checking somebody's listening, see _clear_stale_socket
+            return
+
+        try:
+            response = self.server.answer(json.loads(line))
+        except (ValueError, KeyError, TypeError) as err:
+            response = _printed("", 2, f"{type(err).__name__}: {err}\n")
+
+        try:
+            self.wfile.write(json.dumps(response).encode() + b"\n")
+        except OSError:  # the client gave up, and will have run it itself
+            pass
+
+
+def _printed(stdout: str, code: int = 0, stderr: str = "") -> Dict:
+    return {"code": code, "stdout": stdout, "stderr": stderr}
+
+
+def _private_directory(directory: Path) -> None:
+    """Make the directory sockets go in, if it's not there, so that only this
+    user can get into it"""
+
+    directory.mkdir(mode=0o700, exist_ok=True)
+    status = os.lstat(str(directory))
+
+    if status.st_uid != os.getuid() or not S_ISDIR(status.st_mode):
+        raise PermissionError(f"{directory} belongs to somebody else")
+    if status.st_mode & 0o077:
+        os.chmod(str(directory), 0o700)
+
+
+def _clear_stale_socket(location: Path) -> None:
+    """Remove a socket left behind by a daemon that died, or complain if there's a
+    live one already. Somebody else's socket is left well alone"""
+
+    if not os.path.lexists(str(location)):
+        return
+
+    if not private(location):
+        raise PermissionError(f"{location} belongs to somebody else")
+
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+        try:
+            probe.connect(str(location))
+        except OSError:
+            location.unlink()
+            return
+
+    raise FileExistsError(str(location))
+
+
+def start(location: Optional[Path] = None) -> Daemon:
+    """A daemon for the current directory, listening and with everything it'll
+    need already loaded"""
+
+    # pylint: disable=import-outside-toplevel,unused-import
+    from . import main, models, theatrics  # noqa: F401
+    from .localization import polyglot
+
+    location = location or socket_path()
+    if location.parent == socket_directory():
+        _private_directory(location.parent)
+
+    compiled.keep_loaded()
+    catalog = filesystem.catalog().watch()
+    catalog.summaries()
+    polyglot.strings  # pylint: disable=pointless-statement
+
+    return Daemon(location, catalog)
+
+
+def stop() -> bool:
+    """Ask the daemon for the current directory to stop, returning whether there
+    was one"""
+
+    from .client import request  # pylint: disable=import-outside-toplevel
+
+    return request({"stop": True}) is not None
+
+
+def detach() -> bool:
+    """Carry on in the background, returning True in the process that should
+    carry on. The foreground one gets False"""
+
+    if os.fork():
+        return False
+
+    os.setsid()
+    with open(os.devnull, "r+b") as devnull:
+        for stream in (sys.stdin, sys.stdout, sys.stderr):
+            os.dup2(devnull.fileno(), stream.fileno())
+
+    return True
@@ -0,0 +1,41 @@
+# bash completion for `not`. Install with:
+#   not completion bash > ~/.local/share/bash-completion/completions/not
+#
+# Procedure names come straight from the completion files nothing-cli keeps in
+# each .nothing dir. Python only gets started when one of them is missing, or
+# older than its directory.
+
+_not_cached_completions() {
+    local dir
+    for dir in ./.nothing ~/.nothing; do
+        [ -d "$dir" ] || continue
+        if [ ! -f "$dir/__notcache__/completions" ] || [ "$dir" -nt "$dir/__notcache__/completions" ]; then
+            return 1
+        fi
+    done
+    for dir in ./.nothing ~/.nothing; do
+        [ -f "$dir/__notcache__/completions" ] && cat "$dir/__notcache__/completions"
+    done | awk -F '\t' '!seen[$1]++'  # cwd shadows $HOME, as in `not ls`
+    return 0
+}
+
+_not_completions() {
+    local cur="${COMP_WORDS[COMP_CWORD]}" completions
+
+    if [ "$COMP_CWORD" -eq 1 ]; then
+        COMPREPLY=($(compgen -W "@COMMANDS@" -- "$cur"))
+        return
+    fi
+
+    [ "$COMP_CWORD" -eq 2 ] || return
+    case "${COMP_WORDS[1]}" in
+        @PROCEDURE_COMMAND_PATTERN@) ;;
+        *) return ;;
+    esac
+
+    completions=$(_not_cached_completions) ||
+        completions=$(not-complete "$cur" 2>/dev/null)
+    COMPREPLY=($(compgen -W "$(printf '%s\n' "$completions" | cut -f1)" -- "$cur"))
+}
+
+complete -F _not_completions not
@@ -0,0 +1,27 @@
+# fish completion for `not`. Install with:
+#   not completion fish > ~/.config/fish/completions/not.fish
+#
+# Procedure names come straight from the completion files nothing-cli keeps in
+# each .nothing dir. Python only gets started when one of them is missing, or
+# older than its directory.
+
+function __not_cached_completions
+    for dir in ./.nothing ~/.nothing
+        test -d $dir; or continue
+        if not test -f $dir/__notcache__/completions; or command test $dir -nt $dir/__notcache__/completions
+            return 1
+        end
+    end
+    for dir in ./.nothing ~/.nothing
+        test -f $dir/__notcache__/completions; and cat $dir/__notcache__/completions
+    end | awk -F '\t' '!seen[$1]++'  # cwd shadows $HOME, as in `not ls`
+    return 0
+end
+
+function __not_procedures
+    __not_cached_completions; or not-complete (commandline -ct) 2>/dev/null
+end
+
+complete -c not -f
+complete -c not -n __fish_use_subcommand -a "@COMMANDS@"
+complete -c not -n "__fish_seen_subcommand_from @PROCEDURE_COMMANDS@" -a "(__not_procedures)"
@@ -1,16 +1,10 @@
 """Bits of functionality shared across the subcommands in main"""
-from pathlib import Path
-from typing import List, Tuple
-
 import typer
 
-from .filesystem import deserialize_procedure_file, state
+from . import filesystem
+from .completion import CompletionIndex, completables_from_entries
 from .localization import polyglot as glot
-from .models import Procedure
-
-procedures: List[Tuple[Path, Procedure]] = [
-    (path, deserialize_procedure_file(path)) for path in state()
-]
+from .trace import span
 
 
 def procedure_name_completions(incomplete: str):
@@ -18,9 +12,12 @@ def procedure_name_completions(incomplete: str):
     Displays the list of procedures in CWD and home
     along with their descriptions for clarity"""
 
-    for path, proc in procedures:
-        if incomplete in proc.name:
-            yield path.stem, f"'{proc.description or '-'}'"
+    with span("subcommand_shared.procedure_name_completions"):
+        summaries = filesystem.catalog_summaries()
+        completer = CompletionIndex(completables_from_entries(summaries.values()))
+        completions = list(completer.complete(incomplete))
+
+    yield from completions
 
 
 completable_procedure_name_argument: typer.Argument = typer.Argument(
@@ -0,0 +1,135 @@
+"""Steps, compiled once into templates so that showing one is just a join.
+
+A step is a `str.format` template. Compiling it splits it into its literal text
+and its fields once and for all, and notes which variables it needs along with
+the context item each of them comes from. Nothing gets parsed twice, no matter
+how many steps there are or how many times they're rendered."""
+from string import Formatter
+from typing import (
+    TYPE_CHECKING,
+    Callable,
+    Dict,
+    FrozenSet,
+    Iterable,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Set,
+    Union,
+)
+
+from .graph import declarations
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .models import Procedure
+
+ContextItem = Union[str, Dict]
+
+CONVERSIONS: Dict[Optional[str], Callable] = {
+    None: lambda value: value,
+    "s": str,
+    "r": repr,
+    "a": ascii,
+}
+
+
+class Field(NamedTuple):
+    name: str
+    conversion: Optional[str]
+    spec: str
+
+
+def format_names(text: str) -> Set[str]:
+    """The names of any variables mentioned in the templates of `text`"""
+
+    return {name for _, name, _, _ in Formatter().parse(text) if name is not None}
+
+
+class StepTemplate:
+    """A step, split into literal text and fields"""
+
+    __slots__ = (
+        "source",
+        "segments",
+        "names",
+        "undefined",
+        "context_items",
+        "error",
+        "nested",
+    )
+
+    def __init__(
+        self,
+        source: str,
+        context_by_name: Mapping[str, ContextItem],
+        known_names: Iterable[str] = (),
+    ):
+        self.source: str = source
+        self.segments: List[Union[str, Field]] = []
+        self.error: Optional[ValueError] = None
+
+        try:
+            for literal, name, spec, conversion in Formatter().parse(source):
+                if literal:
+                    self.segments.append(literal)
+                if name is not None:
+                    self.segments.append(Field(name, conversion, spec or ""))
+        except ValueError as err:  # unbalanced braces, mostly
+            self.error = err
+
+        # a spec with fields of its own, like {name:{width}}. rare enough to just
+        # hand the whole step to str.format
+        self.nested: bool = any(
+            "{" in segment.spec
+            for segment in self.segments
+            if isinstance(segment, Field)
+        )
+        self.names: FrozenSet[str] = frozenset(
+            segment.name for segment in self.segments if isinstance(segment, Field)
+        )
+        # needed, but neither a known nor in the context
+        self.undefined: FrozenSet[str] = self.names.difference(
+            context_by_name, known_names
+        )
+        # where the value of each lazy variable comes from
+        self.context_items: Dict[str, ContextItem] = {
+            name: context_by_name[name]
+            for name in self.names
+            if name in context_by_name
+        }
+
+    def render(self, values: Mapping[str, object]) -> str:
+        """The step with every field filled in, same as `source.format(**values)`"""
+
+        if self.error is not None:
+            raise self.error
+
+        if self.nested:
+            return self.source.format(**values)
+
+        return "".join(
+            segment if isinstance(segment, str) else render_field(segment, values)
+            for segment in self.segments
+        )
+
+
+def render_field(field: Field, values: Mapping[str, object]) -> str:
+    """One {field}, the way str.format would do it"""
+
+    return format(CONVERSIONS[field.conversion](values[field.name]), field.spec)
+
+
+def compile_steps(procedure: "Procedure") -> List[StepTemplate]:
+    """A template for every step of the Procedure, in order, minus declarations"""
+
+    from .models import context_var_name  # pylint: disable=import-outside-toplevel
+
+    context_by_name = {context_var_name(item): item for item in procedure.context}
+    known_names = [next(iter(known)) for known in procedure.knowns]
+
+    # a step's @id/after: declaration is for the scheduler, never for display
+    return [
+        StepTemplate(declaration.body, context_by_name, known_names)
+        for declaration in declarations(procedure.steps)
+    ]
@@ -7,10 +7,20 @@ from typing import Callable, List, Tuple
 
 import pytest
 
-from .. import filesystem, main
+from .. import completion, filesystem, main
 from ..filesystem import deserialize_procedure_file
 from ..models import Procedure
 
+# the stand-in that takes the snapshot on first use, before any test replaces it
+LAZY_STATE = filesystem.state
+
+
+@pytest.fixture(autouse=True)
+def fresh_state(monkeypatch):
+    """Each test gets its own catalog of its own .nothing dirs"""
+
+    monkeypatch.setattr(filesystem, "state", LAZY_STATE)
+
 
 @pytest.fixture
 def patched_filesystem(monkeypatch, tmp_path) -> Tuple[Path, Path]:
@@ -28,6 +38,7 @@ def existing_home_dot_nothing_dir(monkeypatch, patched_filesystem) -> Path:
     dot_nothing.mkdir(exist_ok=True, parents=True)
     monkeypatch.setattr(filesystem, "HOME_DOT_NOTHING_DIR", dot_nothing)
     monkeypatch.setattr(main, "HOME_DOT_NOTHING_DIR", dot_nothing)
+    monkeypatch.setattr(completion, "HOME_DOT_NOTHING_DIR", dot_nothing)
 
     return dot_nothing
 
@@ -38,6 +49,7 @@ def existing_cwd_dot_nothing_dir(monkeypatch, patched_filesystem) -> Path:
     dot_nothing.mkdir(exist_ok=True, parents=True)
     monkeypatch.setattr(filesystem, "CWD_DOT_NOTHING_DIR", dot_nothing)
     monkeypatch.setattr(main, "CWD_DOT_NOTHING_DIR", dot_nothing)
+    monkeypatch.setattr(completion, "CWD_DOT_NOTHING_DIR", dot_nothing)
 
     return dot_nothing
 
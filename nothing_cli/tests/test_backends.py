@@ -0,0 +1,55 @@
+# pylint: disable=missing-function-docstring,unused-argument
+# pylint: disable=invalid-name,redefined-outer-name
+"""Test suite for Procedure serialization backends"""
+from pathlib import Path
+from typing import List
+
+import pytest
+
+from .. import backends, writer
+from ..discovery import procedure_files
+from ..filesystem import deserialize_procedure_file, procedure_header_metadata
+
+
+@pytest.mark.parametrize("name", list(backends.BACKENDS))
+def test_round_trip(name, files_in_cwd_and_home: List[Path]):
+    backend = backends.BACKENDS[name]
+
+    for path in files_in_cwd_and_home:
+        procedure = deserialize_procedure_file(path)
+        converted = procedure.copy(
+            update={"path": path.with_name(f"copy{backend.extensions[0]}")}
+        )
+        writer.write(converted, force=True)
+
+        assert deserialize_procedure_file(converted.path) == converted
+        assert procedure_header_metadata(converted.path) == procedure_header_metadata(
+            path
+        )
+
+
+def test_every_extension_is_discovered(existing_cwd_dot_nothing_dir: Path):
+    for ext in [*backends.extensions(), ".txt"]:
+        (existing_cwd_dot_nothing_dir / f"procedure{ext}").touch()
+
+    found = {path.suffix for path in procedure_files(existing_cwd_dot_nothing_dir)}
+
+    assert found == set(backends.extensions())
+
+
+def test_binary_rejects_other_files(path_to_simple_basic_proc_file: Path):
+    with pytest.raises(ValueError):
+        backends.BINARY_BACKEND.load(path_to_simple_basic_proc_file.read_bytes())
+
+
+def test_binary_rejects_other_versions():
+    content = backends.BINARY_BACKEND.dump({"title": "Old", "steps": "a"})
+    older = content.replace(backends.BINARY_MAGIC, b"NOTB\x01", 1)
+
+    with pytest.raises(ValueError, match="format 1"):
+        backends.BINARY_BACKEND.load(older)
+
+
+def test_unknown_extension():
+    with pytest.raises(ValueError):
+        backends.for_path(Path("procedure.toml"))
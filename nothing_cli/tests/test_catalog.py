@@ -0,0 +1,177 @@
+# pylint: disable=missing-function-docstring,unused-argument
+# pylint: disable=invalid-name,redefined-outer-name
+"""Test suite for catalogs that follow changes to their .nothing dirs"""
+import shutil
+from pathlib import Path
+from typing import List
+
+import pytest
+
+from .. import index
+from ..catalog import Catalog
+from ..discovery import discover
+
+
+@pytest.fixture(params=[True, False], ids=["polling", "inotify"])
+def catalog(
+    request, files_in_cwd_and_home: List[Path], existing_cwd_dot_nothing_dir: Path
+):
+    directories = [existing_cwd_dot_nothing_dir, files_in_cwd_and_home[-1].parent]
+
+    with Catalog(directories).watch(polling=request.param) as catalog:
+        yield catalog
+
+
+@pytest.mark.parametrize("polling", [True, False], ids=["polling", "inotify"])
+def test_directory_made_after_watching_starts(polling: bool, tmp_path: Path):
+    directory = tmp_path / ".nothing"
+
+    with Catalog([directory]).watch(polling=polling) as catalog:
+        directory.mkdir()
+        catalog.refresh()
+        made = directory / "made.yml"
+        made.write_text("title: Made\nsteps: go")
+
+        assert catalog.refresh() == {made}
+        assert catalog.location("made") == made
+
+
+@pytest.mark.parametrize("polling", [True, False], ids=["polling", "inotify"])
+def test_directory_deleted_and_made_again(polling: bool, tmp_path: Path):
+    directory = tmp_path / ".nothing"
+    directory.mkdir()
+    old = directory / "old.yml"
+    old.write_text("title: Old\nsteps: go")
+
+    with Catalog([directory]).watch(polling=polling) as catalog:
+        shutil.rmtree(str(directory))
+
+        assert catalog.refresh() == {old}
+        assert catalog.location("old") is None
+
+        directory.mkdir()
+        catalog.refresh()
+        new = directory / "new.yml"
+        new.write_text("title: New\nsteps: go")
+
+        assert catalog.refresh() == {new}
+        assert catalog.location("new") == new
+
+
+def test_starts_out_like_a_snapshot(catalog: Catalog):
+    snapshot = discover(*catalog.watched)
+
+    assert set(catalog.paths) == set(snapshot.paths)
+    assert catalog.location("basic") == snapshot.location("basic")
+
+
+def test_new_shadowing_and_deleted_files(catalog: Catalog):
+    global_run = catalog.location("run")
+    local_run = catalog.watched[0] / "run.yml"
+    local_run.write_text("title: Local run\nsteps: go")
+
+    assert catalog.refresh() == {local_run}
+    assert catalog.location("run") == local_run
+    assert catalog.shadowed("run") == [global_run]
+    assert local_run in catalog.paths
+
+    local_run.unlink()
+
+    assert catalog.refresh() == {local_run}
+    assert catalog.location("run") == global_run
+    assert catalog.shadowed("run") == []
+
+
+def test_only_changed_files_are_summarized(catalog: Catalog, monkeypatch):
+    assert catalog.summaries()[catalog.location("basic")]["title"]
+
+    summarized = []
+    summarize = index.summarize
+    monkeypatch.setattr(
+        index, "summarize", lambda path: summarized.append(path) or summarize(path)
+    )
+    simple = catalog.location("simple")
+    simple.write_text("title: Simpler\nsteps: one")
+    (catalog.watched[0] / "notes.txt").write_text("not a Procedure")
+
+    catalog.refresh()
+
+    assert summarized == [simple]
+    assert catalog.summaries()[simple]["title"] == "Simpler"
+
+
+def test_renames(catalog: Catalog):
+    basic = catalog.location("basic")
+    catalog.summaries()
+    basic.rename(basic.with_name("renamed.yml"))
+
+    catalog.refresh()
+
+    assert catalog.location("basic") is None
+    assert catalog.location("renamed") == basic.with_name("renamed.yml")
+    assert basic not in catalog.summaries()
+
+    catalog.save()
+
+    assert "basic.yml" not in index.CatalogIndex(basic.parent).entries
+
+
+def test_changes_made_in_process(files_in_cwd: List[Path]):
+    catalog = Catalog([files_in_cwd[0].parent])
+    basic = catalog.location("basic")
+    renamed = basic.with_name("renamed.yml")
+
+    basic.rename(renamed)
+    catalog.rename(basic, renamed)
+
+    assert catalog.location("basic") is None
+    assert catalog.location("renamed") == renamed
+
+    catalog.save()
+
+    assert "renamed.yml" in index.CatalogIndex(renamed.parent).entries
+
+    renamed.unlink()
+    catalog.remove(renamed)
+    catalog.save()
+
+    assert renamed not in catalog.paths
+    assert "renamed.yml" not in index.CatalogIndex(renamed.parent).entries
+
+
+def test_changes_touch_only_the_changed_files(files_in_cwd: List[Path], monkeypatch):
+    directory = files_in_cwd[0].parent
+    catalog = Catalog([directory])
+    catalog.summaries()
+
+    stat_key, summarize = index.stat_key, index.summarize
+    looked_at, written = [], []
+    monkeypatch.setattr(
+        index, "stat_key", lambda path: looked_at.append(path) or stat_key(path)
+    )
+    monkeypatch.setattr(
+        index, "summarize", lambda path: looked_at.append(path) or summarize(path)
+    )
+    write = index.CatalogIndex.write
+    monkeypatch.setattr(
+        index.CatalogIndex,
+        "write",
+        lambda catalog_index: written.append(catalog_index) or write(catalog_index),
+    )
+
+    dropped = files_in_cwd[0]
+    dropped.unlink()
+    catalog.remove(dropped)
+    added = directory / "added.yml"
+    added.write_text("title: Added\nsteps: go")
+    catalog.add(added)
+
+    assert looked_at == [added, added]
+    assert not written, "Nothing is written until it's saved"
+
+    catalog.save()
+
+    assert looked_at == [added, added]
+    assert len(written) == 1
+    entries = index.CatalogIndex(directory).entries
+    assert "added.yml" in entries and dropped.name not in entries
@@ -0,0 +1,61 @@
+# pylint: disable=missing-function-docstring,unused-argument
+# pylint: disable=invalid-name,redefined-outer-name
+"""Test suite for compiled Procedures"""
+from pathlib import Path
+from typing import List
+
+from .. import filesystem
+from ..compiled import load_procedure
+from ..constants import CACHE_DIRECTORY_NAME, COMPILED_DIRECTORY_NAME
+
+
+def compiled_files(procedure_path: Path) -> List[Path]:
+    return list(
+        (procedure_path.parent / CACHE_DIRECTORY_NAME / COMPILED_DIRECTORY_NAME).glob(
+            f"{procedure_path.name}.*"
+        )
+    )
+
+
+def test_cold_load_matches_full_parse(files_in_cwd_and_home: List[Path]):
+    for path in files_in_cwd_and_home:
+        assert load_procedure(path) == filesystem.deserialize_procedure_file(path)
+        assert len(compiled_files(path)) == 1
+
+
+def test_warm_load_skips_parsing(files_in_cwd_and_home: List[Path], monkeypatch):
+    cold = [load_procedure(path) for path in files_in_cwd_and_home]
+
+    def explode(content, path):
+        raise AssertionError(f"{path} was parsed")
+
+    monkeypatch.setattr(filesystem, "deserialize_procedure", explode)
+    warm = [load_procedure(path) for path in files_in_cwd_and_home]
+
+    assert warm == cold
+
+
+def test_edit_invalidates(path_to_simple_basic_proc_file: Path):
+    assert len(load_procedure(path_to_simple_basic_proc_file).steps) == 2
+
+    path_to_simple_basic_proc_file.write_text(
+        "title: Longer now\nsteps: |-\n  one\n\n  two\n\n  three\n"
+    )
+    procedure = load_procedure(path_to_simple_basic_proc_file)
+
+    assert procedure.title == "Longer now"
+    assert len(procedure.steps) == 3
+    assert len(compiled_files(path_to_simple_basic_proc_file)) == 1, "Old one is gone"
+
+
+def test_uncompilable_fields_still_load(
+    existing_proc_file_path, existing_cwd_dot_nothing_dir
+):
+    path = existing_proc_file_path(
+        existing_cwd_dot_nothing_dir,
+        "floaty.yml",
+        "title: Floats\nknowns:\n  - pi: 3.14\nsteps: |-\n  {pi}\n",
+    )
+
+    assert load_procedure(path).knowns[0]["pi"] == 3.14
+    assert load_procedure(path).knowns[0]["pi"] == 3.14
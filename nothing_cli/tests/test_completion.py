@@ -0,0 +1,85 @@
+# pylint: disable=missing-function-docstring,unused-argument
+# pylint: disable=invalid-name,redefined-outer-name
+"""Test suite for Procedure name completion"""
+from pathlib import Path
+from typing import List
+
+import pytest
+
+from ..completion import (
+    Completable,
+    CompletionIndex,
+    completion_file_is_stale,
+    completion_file_location,
+)
+from ..subcommand_shared import procedure_name_completions
+
+COMPLETABLES = [
+    Completable("deploy-api", "Deploy the API", "Ship it"),
+    Completable("rollback", "Roll back a deploy", ""),
+    Completable("db-migrate", "Migrate the database", "Carefully"),
+    Completable("Deployment-Review", "Review a deployment", "Afterwards"),
+    Completable("deploy-api", "A shadowed global duplicate", "Nope"),
+]
+
+
+@pytest.fixture(params=[False, True], ids=["scan", "ngrams"])
+def completer(request) -> CompletionIndex:
+    return CompletionIndex(COMPLETABLES, use_ngrams=request.param)
+
+
+def names(completions) -> List[str]:
+    return [name for name, _ in completions]
+
+
+def test_prefix_matches_come_first(completer):
+    assert names(completer.complete("deploy")) == [
+        "deploy-api",
+        "Deployment-Review",
+        "rollback",  # 'deploy' is in its title
+    ]
+
+
+def test_substring_in_name(completer):
+    assert names(completer.complete("grat")) == ["db-migrate"]
+
+
+def test_empty_completes_everything_once(completer):
+    assert sorted(names(completer.complete(""))) == sorted(
+        {c.name for c in COMPLETABLES}
+    )
+
+
+def test_fragments_shorter_than_an_ngram(completer):
+    assert names(completer.complete("ba")) == ["db-migrate", "rollback"]
+
+
+def test_descriptions_are_hints(completer):
+    assert dict(completer.complete("")) == {
+        "deploy-api": "'Ship it'",
+        "rollback": "'-'",
+        "db-migrate": "'Carefully'",
+        "Deployment-Review": "'Afterwards'",
+    }
+
+
+def test_no_match(completer):
+    assert completer.complete("zebra") == []
+
+
+def test_completions_come_from_the_catalog(files_in_cwd_and_home: List[Path]):
+    completions = dict(procedure_name_completions("s"))
+
+    assert set(completions) == {"basic", "preflight", "simple", "sleep"}
+    assert list(procedure_name_completions("sl"))[0] == ("sleep", "'-'")
+
+
+def test_completion_file_written_with_index(files_in_cwd: List[Path]):
+    directory = files_in_cwd[0].parent
+    assert completion_file_is_stale(directory)
+
+    list(procedure_name_completions(""))
+
+    assert not completion_file_is_stale(directory)
+    lines = completion_file_location(directory).read_text().splitlines()
+    assert [line.split("\t")[0] for line in lines] == ["basic", "preflight", "simple"]
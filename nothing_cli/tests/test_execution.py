@@ -0,0 +1,68 @@
+# pylint: disable=missing-function-docstring,unused-argument
+# pylint: disable=invalid-name,redefined-outer-name
+"""Test suite for running the commands in steps"""
+from time import perf_counter
+from typing import List, Tuple
+
+import pytest
+
+from ..execution import Command, command_for, run_commands
+
+
+@pytest.mark.parametrize(
+    "step, expected",
+    [
+        ("Just words", None),
+        ("Look around\n$ ls -la", ("ls -la", False)),
+        ("Look around\n$ ls -la &\n", ("ls -la", True)),
+        ("$ make test  &", ("make test", True)),
+        ("$ echo a&", ("echo a&", False)),
+        ("$ echo a && echo b", ("echo a && echo b", False)),
+        ("$ ls\nThen do the other thing", None),
+        ("$ ", None),
+    ],
+)
+def test_command_for(step, expected):
+    command = command_for(3, step)
+
+    assert (command and (command.text, command.independent)) == expected
+
+
+@pytest.fixture
+def lines() -> List[Tuple[int, str, bool]]:
+    return []
+
+
+def collect(lines):
+    return lambda step, line, err: lines.append((step, line, err))
+
+
+def test_output_is_streamed_per_step(lines):
+    results = run_commands(
+        [Command(1, "echo one; echo oops >&2", False), Command(2, "exit 3", True)],
+        collect(lines),
+    )
+
+    assert [(r.step, r.returncode) for r in results] == [(1, 0), (2, 3)]
+    assert sorted(lines) == [(1, "one", False), (1, "oops", True)]
+
+
+def test_commands_run_concurrently_up_to_the_limit(lines):
+    commands = [Command(n, "sleep 0.3", True) for n in range(4)]
+
+    start = perf_counter()
+    assert all(r.ok for r in run_commands(commands, collect(lines), jobs=4))
+    assert perf_counter() - start < 1.0
+
+    start = perf_counter()
+    run_commands(commands, collect(lines), jobs=1)
+    assert perf_counter() - start >= 1.2
+
+
+def test_timeout(lines):
+    start = perf_counter()
+    [result] = run_commands([Command(1, "sleep 5", False)], collect(lines), 0.2)
+
+    assert result.timed_out
+    assert not result.ok
+    assert perf_counter() - start < 3
@@ -0,0 +1,190 @@
+# pylint: disable=missing-function-docstring,unused-argument
+# pylint: disable=invalid-name,redefined-outer-name
+"""Differential tests for the fast loader: whatever it returns, ruamel agrees"""
+import random
+from pathlib import Path
+from typing import List
+
+import pytest
+
+from .. import fastload
+from ..filesystem import yml
+from ..models import Procedure
+
+SCALARS = [
+    "plain",
+    "Preflight Checks",
+    "What's your name?",
+    "it's got: a colon",
+    "ends with a colon:",
+    "C# is fine",
+    "but not # this",
+    "yes",
+    "No",
+    "null",
+    "~",
+    "12",
+    "1.5",
+    "2020-01-01",
+    "-dash",
+    "*star",
+    "&anchor",
+    "!tag",
+    "[flow]",
+    "{flow}",
+    "a, b, [c]",
+    "=",
+    "unicode ✓",
+    "tab\there",
+    "trailing  ",
+    "",
+    "%percent",
+    "key:value",
+    'a "quote"',
+    "back\\slash",
+]
+STEP_LINES = ["Do the thing", "  more indented", "# not a comment", "\ttabbed", ""]
+KEYS = ["title", "description", "context", "knowns", "steps", "extra"]
+MUTATIONS = [" ", "\n", "-", ":", "#", "|", "'", '"', "\t", "a", "  ", "\n\n"]
+
+
+def render_scalar(rng: random.Random) -> str:
+    text = rng.choice(SCALARS[:3] if rng.random() < 0.7 else SCALARS)
+    style = rng.random()
+    if style < 0.6:
+        return text
+    if style < 0.85:
+        return "'" + text.replace("'", "''") + "'"
+    return '"' + text + '"'
+
+
+def render_literal(rng: random.Random, indent: str) -> List[str]:
+    chomping = rng.choice(["", "-", "+"])
+    comment = rng.choice(["", "  # steps"])
+    block_indent = indent + " " * rng.choice([1, 2, 4])
+    lines = [f"{indent}steps: |{chomping}{comment}"]
+
+    lines.extend(
+        rng.choice(["", " ", block_indent]) for _ in range(rng.choice([0, 0, 1, 2]))
+    )
+    for _ in range(rng.randint(1, 8)):
+        lines.append(block_indent + rng.choice(STEP_LINES[:4]))
+        lines.extend(
+            rng.choice(["", block_indent, " "]) for _ in range(rng.choice([0, 1, 2, 3]))
+        )
+
+    return lines
+
+
+def render_sequence(rng: random.Random, key: str, indent: str) -> List[str]:
+    item_indent = indent + " " * rng.choice([0, 2, 4])
+    lines = [f"{indent}{key}:"]
+
+    for _ in range(rng.randint(0, 4)):
+        value = render_scalar(rng)
+        if rng.random() < 0.5:
+            lines.append(f"{item_indent}- {rng.choice(['name', 'who', 'y'])}: {value}")
+        else:
+            lines.append(f"{item_indent}- {value}")
+        if rng.random() < 0.1:
+            lines.append(f"{item_indent}  # a comment")
+
+    return lines
+
+
+def random_procedure_file(rng: random.Random) -> str:
+    indent = " " * rng.choice([0, 0, 2, 4])
+    lines = ["---"] if rng.random() < 0.3 else []
+    keys = rng.sample(KEYS, rng.randint(1, len(KEYS)))
+
+    for key in keys:
+        if key == "steps":
+            lines.extend(render_literal(rng, indent))
+        elif key in ("context", "knowns"):
+            lines.extend(render_sequence(rng, key, indent))
+        elif rng.random() < 0.1:
+            lines.append(f"{indent}{key}:")
+        else:
+            lines.append(f"{indent}{key}: {render_scalar(rng)}")
+
+        if rng.random() < 0.2:
+            lines.append(rng.choice(["", "# comment", f"{indent}# comment"]))
+
+    return "\n".join(lines) + "\n"
+
+
+def mutate(rng: random.Random, text: str) -> str:
+    for _ in range(rng.randint(1, 3)):
+        at = rng.randrange(len(text))
+        if rng.random() < 0.5:
+            text = text[:at] + text[at + 1 :]  # noqa: E203
+        else:
+            text = text[:at] + rng.choice(MUTATIONS) + text[at:]
+
+    return text
+
+
+def assert_agrees_with_ruamel(text: str) -> bool:
+    """Whether the fast loader handled this document itself"""
+
+    fast = fastload.load(text)
+    if fast is None:
+        return False
+
+    try:
+        expected = yml().load(text)
+    except Exception as err:  # pylint: disable=broad-except
+        pytest.fail(f"fast loader accepted what ruamel rejects ({err}):\n{text}")
+
+    assert list(fast) == list(expected), text
+    assert fast == expected, text
+
+    return True
+
+
+@pytest.mark.parametrize("seed", range(4))
+def test_fuzzed_files(seed):
+    rng = random.Random(seed)
+    handled = sum(
+        assert_agrees_with_ruamel(random_procedure_file(rng)) for _ in range(150)
+    )
+
+    assert handled > 30, "Fast path is exercised"
+
+
+@pytest.mark.parametrize("seed", range(4))
+def test_mutated_files(seed):
+    rng = random.Random(seed)
+
+    for _ in range(150):
+        assert_agrees_with_ruamel(mutate(rng, random_procedure_file(rng)))
+
+
+def test_same_procedures(files_in_cwd_and_home: List[Path]):
+    for path in files_in_cwd_and_home:
+        content = path.read_bytes()
+        fields = fastload.load(content)
+
+        assert fields is not None, "Everyday Procedures take the fast path"
+        assert Procedure(path=path, **fields) == Procedure(
+            path=path, **yml().load(content)
+        )
+
+
+@pytest.mark.parametrize(
+    "content",
+    [
+        "title: &a anchored\n",
+        "title: [flow]\nsteps: |-\n  one\n",
+        "title: multi\n  line\n",
+        "context:\n  - name: x\n    prompt: y\n",
+        "steps: >-\n  folded\n",
+        "steps: |2-\n    explicit\n",
+        "title: no newline at the end",
+        "title: 10\n",
+        "title: ok\r\n",
+        "",
+    ],
+)
+def test_unsupported_falls_back(content):
+    assert fastload.load(content) is None
@@ -0,0 +1,100 @@
+# pylint: disable=missing-function-docstring,unused-argument
+# pylint: disable=invalid-name,redefined-outer-name
+"""Test suite for filesytem.procedure_header_metadata"""
+from pathlib import Path
+from typing import Callable, List
+
+import pytest
+
+from ... import filesystem
+from ...filesystem import (
+    deserialize_procedure_file,
+    procedure_header_metadata,
+    procedure_object_metadata,
+)
+
+STEPS_BLOCKS = [
+    "steps: |-\n  one\n",
+    "steps: |-\n  one\n\n  two\n",
+    "steps: |-\n  one\n\n\n  two\n",
+    "steps: |-\n  one\n\n\n\n  two\n\n\n\n\n  three\n",
+    "steps: |-\n\n\n  one\n\n  two\n",
+    "steps: |\n  one\n\n  two\n\n\n",
+    "steps: |+\n  one\n\n  two\n\n\n",
+    "steps: |+\n  one\n\n  two\n\n\n\n",
+    "steps: |-  # comment\n  one\n    indented\n\n  two\n",
+]
+
+
+@pytest.fixture
+def no_full_parse(monkeypatch):
+    def explode(*args):
+        raise AssertionError("The whole file was parsed")
+
+    monkeypatch.setattr(filesystem, "deserialize_procedure_file", explode)
+
+
+def assert_matches_full_parse(path: Path):
+    expected = procedure_object_metadata(deserialize_procedure_file(path))
+    assert procedure_header_metadata(path) == expected
+
+
+@pytest.mark.parametrize("steps", STEPS_BLOCKS)
+@pytest.mark.parametrize("steps_first", [True, False])
+def test_step_count_matches_full_parse(
+    steps: str,
+    steps_first: bool,
+    existing_proc_file_path: Callable,
+    existing_cwd_dot_nothing_dir: Path,
+):
+    rest = "title: Counting\ncontext:\n  - who\nknowns:\n  - where: here\n"
+    content = steps + rest if steps_first else rest + steps
+    path = existing_proc_file_path(existing_cwd_dot_nothing_dir, "count.yml", content)
+
+    assert_matches_full_parse(path)
+
+
+def test_fixtures_match_full_parse(files_in_cwd_and_home: List[Path]):
+    for path in files_in_cwd_and_home:
+        assert_matches_full_parse(path)
+
+
+def test_steps_are_not_parsed(files_in_cwd_and_home: List[Path], no_full_parse):
+    for path in files_in_cwd_and_home:
+        assert procedure_header_metadata(path)["step_count"] > 1
+
+
+@pytest.mark.parametrize(
+    "content",
+    [
+        "title: Folded\nsteps: >-\n  one\n\n  two\n",
+        "title: Quoted\nsteps: 'one\n\n  two'\n",
+        "title: 5\nsteps: |-\n  one\n",
+        "title: Twice\nsteps: |-\n  one\nsteps: |-\n  two\n",
+    ],
+)
+def test_unusual_files_fall_back(
+    content: str, existing_proc_file_path: Callable, existing_cwd_dot_nothing_dir: Path
+):
+    path = existing_proc_file_path(existing_cwd_dot_nothing_dir, "odd.yml", content)
+
+    try:
+        expected = procedure_object_metadata(deserialize_procedure_file(path))
+    except Exception as err:  # pylint: disable=broad-except
+        with pytest.raises(type(err)):
+            procedure_header_metadata(path)
+    else:
+        assert procedure_header_metadata(path) == expected
+
+
+def test_missing_title_raises_like_full_parse(
+    existing_proc_file_path: Callable, existing_cwd_dot_nothing_dir: Path
+):
+    path = existing_proc_file_path(
+        existing_cwd_dot_nothing_dir, "untitled.yml", "steps: |-\n  one\n"
+    )
+
+    with pytest.raises(Exception) as full:
+        deserialize_procedure_file(path)
+    with pytest.raises(type(full.value)):
+        procedure_header_metadata(path)
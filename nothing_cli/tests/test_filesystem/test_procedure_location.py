@@ -2,8 +2,10 @@
 # pylint: disable=invalid-name,redefined-outer-name
 """Test suite for filesytem.procedure_location"""
 
+import pytest
+
 from ...constants import PROCEDURE_EXT
-from ...filesystem import procedure_location
+from ...filesystem import procedure_location, shadowed_procedure_locations
 
 
 def test_doesnt_care_about_extension(path_to_proc_with_simple_context):
@@ -16,3 +18,38 @@ def test_doesnt_care_about_extension(path_to_proc_with_simple_context):
 
 def test_returns_none_for_nonexistent():
     assert procedure_location("secret of life please???") is None
+
+
+@pytest.mark.parametrize("name", ["daily", "html", "yaml", "l"])
+@pytest.mark.parametrize("ext", [".yml", ".yaml"])
+def test_names_ending_in_extension_letters(
+    name, ext, existing_proc_file_path, existing_cwd_dot_nothing_dir
+):
+    path = existing_proc_file_path(
+        existing_cwd_dot_nothing_dir, f"{name}{ext}", "title: hi\nsteps: hi\n"
+    )
+
+    assert procedure_location(name) == path
+    assert procedure_location(path.name) == path
+
+
+@pytest.fixture
+def same_name_in_cwd_and_home(
+    existing_proc_file_path, existing_cwd_dot_nothing_dir, existing_home_dot_nothing_dir
+):
+    content = "title: twins\nsteps: hi\n"
+    home = existing_proc_file_path(existing_home_dot_nothing_dir, "twin.yml", content)
+    cwd = existing_proc_file_path(existing_cwd_dot_nothing_dir, "twin.yml", content)
+
+    return cwd, home
+
+
+def test_cwd_shadows_home(same_name_in_cwd_and_home):
+    cwd, home = same_name_in_cwd_and_home
+
+    assert procedure_location("twin") == cwd
+    assert shadowed_procedure_locations("twin") == [home]
+
+
+def test_nothing_shadowed(path_to_proc_with_simple_context):
+    assert shadowed_procedure_locations(path_to_proc_with_simple_context.stem) == []
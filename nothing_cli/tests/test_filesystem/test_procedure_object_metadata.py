@@ -3,6 +3,7 @@
 """Test suite for filesytem.procedure_object_metadata"""
 
 # TODO don't use deserialize here, use the fixture
+from ... import index
 from ...filesystem import deserialize_procedure_file, procedure_object_metadata
 
 
@@ -55,3 +56,15 @@ def test_step_count(path_to_simple_basic_proc_file, path_to_proc_with_complex_co
 
     assert procedure_object_metadata(proc_1)["step_count"] == 2
     assert procedure_object_metadata(proc_2)["step_count"] == 4
+
+
+def test_stale_error_in_index(path_to_simple_basic_proc_file, monkeypatch):
+    monkeypatch.setattr(
+        index, "summary", lambda path: {"name": path.stem, "error": "Boom: no more"}
+    )
+
+    meta = procedure_object_metadata(path_to_simple_basic_proc_file)
+
+    assert meta == procedure_object_metadata(
+        deserialize_procedure_file(path_to_simple_basic_proc_file)
+    )
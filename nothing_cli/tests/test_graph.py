@@ -0,0 +1,87 @@
+# pylint: disable=missing-function-docstring,unused-argument
+# pylint: disable=invalid-name,redefined-outer-name
+"""Test suite for step declarations and the scheduler"""
+import pytest
+
+from ..graph import BadStepGraph, StepGraph, split_declaration
+
+RELEASE = [
+    "@build-api after:\nBuild the API",
+    "@build-web after:\nBuild the web app",
+    "@test-web\nTest the web app",
+    "@deploy after: build-api, test-web\nShip it",
+    "Tell everyone",
+]
+
+
+@pytest.mark.parametrize(
+    "step, expected",
+    [
+        ("Just a step", (None, None, "Just a step")),
+        ("@id\nbody", ("id", None, "body")),
+        ("@id after:\nbody", ("id", (), "body")),
+        ("  @x.y after: a,b c\nbody\nmore", ("x.y", ("a", "b", "c"), "body\nmore")),
+        ("@ not a declaration\nbody", (None, None, "@ not a declaration\nbody")),
+        ("email me @ noon", (None, None, "email me @ noon")),
+    ],
+)
+def test_split_declaration(step, expected):
+    assert tuple(split_declaration(step)) == expected
+
+
+def test_undeclared_steps_go_in_order():
+    graph = StepGraph(["a", "b", "c"])
+
+    assert not graph.declared
+    assert graph.critical_path() == [0, 1, 2]
+    for step in range(3):
+        assert graph.ready() == [step]
+        graph.finish([step])
+    assert graph.done
+
+
+def test_declarations_need_an_after():
+    graph = StepGraph(["@here\nBe here", "@oncall\nPage them", "@here\nAgain"])
+
+    assert not graph.declared
+    assert [d.body for d in graph.declarations] == [
+        "@here\nBe here",
+        "@oncall\nPage them",
+        "@here\nAgain",
+    ]
+    assert graph.critical_path() == [0, 1, 2]
+
+
+def test_ready_steps_are_handed_out_together():
+    graph = StepGraph(RELEASE)
+
+    assert graph.ready() == [0, 1]
+    assert graph.ready() == [], "Nothing is handed out twice"
+
+    graph.finish([1])
+    assert graph.ready() == [2]
+    graph.finish([2])
+    assert graph.ready() == [], "deploy still waits on build-api"
+    graph.finish([0])
+    assert graph.ready() == [3]
+    graph.finish([3])
+    assert graph.ready() == [4]
+    graph.finish([4])
+    assert graph.done
+
+
+def test_critical_path():
+    assert StepGraph(RELEASE).critical_path() == [1, 2, 3, 4]
+
+
+@pytest.mark.parametrize(
+    "steps",
+    [
+        ["@a after:\none", "@a\ntwo"],
+        ["@a after: nowhere\none"],
+        ["@a after: b\none", "@b after: a\ntwo"],
+    ],
+)
+def test_bad_graphs(steps):
+    with pytest.raises(BadStepGraph):
+        StepGraph(steps)
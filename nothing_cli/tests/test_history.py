@@ -0,0 +1,91 @@
+# pylint: disable=missing-function-docstring,unused-argument
+# pylint: disable=invalid-name,redefined-outer-name
+"""Test suite for the history of how long steps take"""
+from pathlib import Path
+
+import pytest
+
+from .. import history
+
+
+@pytest.fixture
+def procedure_path(tmp_path: Path) -> Path:
+    path = tmp_path / "deploy.yml"
+    path.write_text("title: Deploy\nsteps: |-\n  one\n\n  two\n\n  three\n")
+
+    return path
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [0.0]
+    monkeypatch.setattr(history, "perf_counter", lambda: now[0])
+
+    return now
+
+
+def walk(procedure_path: Path, clock, dwells, done=()):
+    recorder = history.Recorder.open(procedure_path, done)
+    for step, seconds in dwells:
+        recorder.shown(step)
+        clock[0] += seconds
+        recorder.acknowledged([step])
+
+    return recorder
+
+
+@pytest.mark.parametrize("seconds", [0.5, 3, 90, 4000])
+def test_buckets_are_close(seconds):
+    bucket = history.bucket_for(seconds)
+
+    assert abs(history.bucket_seconds(bucket) - seconds) / seconds < 0.05
+
+
+def test_percentile():
+    histogram = [(history.bucket_for(s), 1) for s in range(1, 101)]
+
+    assert history.percentile(histogram, 0.5) == pytest.approx(50, rel=0.05)
+    assert history.percentile(histogram, 0.95) == pytest.approx(95, rel=0.05)
+
+
+def test_stats(procedure_path: Path, clock):
+    for seconds in (10, 20, 30):
+        recorder = walk(procedure_path, clock, [(0, 1), (1, seconds), (2, 1)])
+        recorder.finish()
+        recorder.close()
+    walk(procedure_path, clock, [(0, 1)]).close()
+    walk(procedure_path, clock, [(1, 20)], done=[0]).close()
+
+    stats = history.procedure_stats(procedure_path)
+
+    assert stats.runs == 5
+    assert stats.completed == 3
+    assert [s.count for s in stats.steps] == [4, 4, 3]
+    assert stats.steps[1].p50 == pytest.approx(20, rel=0.05)
+    assert stats.steps[1].p95 == pytest.approx(30, rel=0.05)
+    assert stats.abandoned == {1: 1, 2: 1}
+
+
+def test_histograms_stay_small(procedure_path: Path, clock):
+    for _ in range(200):
+        walk(procedure_path, clock, [(0, 5)]).close()
+
+    connection = history.connect(history.history_location(procedure_path))
+    (rows,) = connection.execute("SELECT count(*) FROM dwells").fetchone()
+    connection.close()
+
+    assert rows == 1
+    assert history.procedure_stats(procedure_path).steps[0].count == 200
+
+
+def test_never_walked_through(procedure_path: Path):
+    assert history.procedure_stats(procedure_path) is None
+
+
+def test_stats_leave_the_database_alone(procedure_path: Path):
+    location = history.history_location(procedure_path)
+    location.parent.mkdir(parents=True)
+    location.touch()
+
+    assert history.procedure_stats(procedure_path) is None
+    assert location.read_bytes() == b""
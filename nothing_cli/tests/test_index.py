@@ -0,0 +1,94 @@
+# pylint: disable=missing-function-docstring,unused-argument
+# pylint: disable=invalid-name,redefined-outer-name
+"""Test suite for the catalog index"""
+from pathlib import Path
+from typing import List
+
+import pytest
+
+from .. import filesystem, index
+from ..constants import CACHE_DIRECTORY_NAME, INDEX_FILENAME
+
+
+def test_index_written_per_directory(files_in_cwd_and_home: List[Path]):
+    index.summaries(files_in_cwd_and_home)
+
+    for directory in {path.parent for path in files_in_cwd_and_home}:
+        assert (directory / CACHE_DIRECTORY_NAME / INDEX_FILENAME).exists()
+
+
+@pytest.mark.parametrize("which", range(2))
+def test_summary_matches_object_metadata(which, files_in_home: List[Path]):
+    path = files_in_home[which]
+    procedure = filesystem.deserialize_procedure_file(path)
+    entry = index.summary(path)
+
+    assert entry["name"] == procedure.name
+    assert {
+        key: entry[key] for key in filesystem.METADATA_KEYS
+    } == filesystem.procedure_object_metadata(procedure)
+
+
+def test_unchanged_files_are_not_reparsed(files_in_cwd: List[Path], monkeypatch):
+    cold = index.summaries(files_in_cwd)
+
+    def explode(path):
+        raise AssertionError(f"{path} was parsed")
+
+    monkeypatch.setattr(index, "summarize", explode)
+    warm = index.summaries(files_in_cwd)
+
+    assert warm == cold
+    assert not any("error" in entry for entry in warm.values())
+
+
+def test_changed_file_is_reparsed(path_to_simple_basic_proc_file: Path):
+    assert index.summary(path_to_simple_basic_proc_file)["step_count"] == 2
+
+    path_to_simple_basic_proc_file.write_text(
+        "title: Now with more steps\nsteps: |-\n  one\n\n  two\n\n  three\n"
+    )
+
+    assert index.summary(path_to_simple_basic_proc_file)["step_count"] == 3
+
+
+def test_vanished_files_are_pruned(files_in_cwd: List[Path]):
+    index.summaries(files_in_cwd)
+    dropped, *kept = files_in_cwd
+    dropped.unlink()
+
+    index.summaries(kept, directories=[dropped.parent])
+
+    assert dropped.name not in index.CatalogIndex(dropped.parent).entries
+
+
+def test_files_deleted_while_listing_are_left_out(files_in_cwd: List[Path]):
+    dropped, *kept = files_in_cwd
+    dropped.unlink()
+
+    entries = index.summaries(files_in_cwd, directories=[dropped.parent])
+
+    assert list(entries) == kept
+    assert dropped.name not in index.CatalogIndex(dropped.parent).entries
+
+
+def test_broken_file_still_listed(
+    existing_proc_file_path, existing_cwd_dot_nothing_dir
+):
+    path = existing_proc_file_path(
+        existing_cwd_dot_nothing_dir, "broken.yml", "title: [unclosed\n"
+    )
+
+    entry = index.summary(path)
+
+    assert entry["name"] == "broken"
+    assert "error" in entry
+    assert filesystem.collect_fancy_list_input()["local"] == ["broken"]
+
+
+def test_unusable_index_is_rebuilt(path_to_simple_basic_proc_file: Path):
+    location = path_to_simple_basic_proc_file.parent / CACHE_DIRECTORY_NAME
+    location.mkdir()
+    (location / INDEX_FILENAME).write_text("{ this is not json")
+
+    assert index.summary(path_to_simple_basic_proc_file)["step_count"] == 2
@@ -0,0 +1,136 @@
+# pylint: disable=missing-function-docstring,unused-argument
+# pylint: disable=invalid-name,redefined-outer-name
+"""Test suite for the journals that let walkthroughs be resumed"""
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from .. import journal
+
+
+@pytest.fixture
+def procedure_path(tmp_path: Path) -> Path:
+    path = tmp_path / "deploy.yml"
+    path.write_text("title: Deploy\nsteps: one\n")
+
+    return path
+
+
+def test_replay(procedure_path: Path):
+    run = journal.Journal.start(procedure_path)
+    run.answered("host", "db1")
+    run.acknowledged([0, 1])
+    run.answered("host", "db2")
+    run.close()
+
+    progress = journal.read_progress(run.location)
+
+    assert progress.answers == {"host": "db2"}
+    assert progress.steps == {0, 1}
+    assert not progress.finished
+    assert journal.latest_unfinished(procedure_path) == run.location
+
+
+def test_torn_last_line_is_ignored(procedure_path: Path):
+    run = journal.Journal.start(procedure_path)
+    run.acknowledged([0])
+    run.close()
+    with open(str(run.location), "a") as file:
+        file.write('{"event": "steps", "ste')
+
+    assert journal.read_progress(run.location).steps == {0}
+
+
+def test_finished_and_changed_procedures_are_not_resumed(procedure_path: Path):
+    run = journal.Journal.start(procedure_path)
+    run.finish()
+    run.close()
+
+    assert not run.location.exists(), "Finished journals are deleted"
+    assert journal.latest_unfinished(procedure_path) is None
+
+    journal.Journal.start(procedure_path).close()
+    procedure_path.write_text("title: Deploy\nsteps: two\n")
+
+    assert journal.latest_unfinished(procedure_path) is None
+
+
+def test_only_the_latest_run_is_kept(procedure_path: Path):
+    other = procedure_path.with_name("deploy.prod.yml")
+    other.write_text("title: Deploy prod\nsteps: one\n")
+    kept_for_other = journal.Journal.start(other)
+    kept_for_other.close()
+
+    for _ in range(5):
+        run = journal.Journal.start(procedure_path)
+        run.acknowledged([0])
+        run.close()
+
+    assert journal.journals(procedure_path) == [run.location]
+    assert journal.latest_unfinished(procedure_path) == run.location
+    assert journal.journals(other) == [kept_for_other.location]
+
+
+def test_runs_still_going_keep_their_journals(procedure_path: Path):
+    def run_in(pid: int) -> Path:
+        location = journal.runs_directory(procedure_path) / f"deploy.1.{pid}.jsonl"
+        run = journal.Journal.reopen(location)
+        run.append(
+            {
+                "event": "start",
+                "name": procedure_path.name,
+                "digest": journal.content_digest(procedure_path),
+            }
+        )
+        run.close()
+        os.utime(str(location), (0, 0))
+        return location
+
+    process = subprocess.Popen([sys.executable, "-c", ""])
+    process.wait()
+    ended = run_in(process.pid)
+    going = run_in(os.getppid())
+
+    latest = journal.Journal.start(procedure_path)
+    latest.close()
+
+    assert journal.journals(procedure_path) == [latest.location, going]
+    assert not ended.exists()
+
+
+def test_journals_are_private(procedure_path: Path):
+    run = journal.Journal.start(procedure_path)
+    run.answered("password", "hunter2")
+    run.close()
+
+    assert run.location.stat().st_mode & 0o777 == 0o600
+    assert run.location.parent.stat().st_mode & 0o777 == 0o700
+
+
+def test_fsyncs_are_batched(procedure_path: Path, monkeypatch):
+    synced = []
+    monkeypatch.setattr(os, "fsync", synced.append)
+    monkeypatch.setattr(journal, "FSYNC_INTERVAL", 3600)
+
+    run = journal.Journal.start(procedure_path)
+    for step in range(journal.FSYNC_EVERY * 2):
+        run.acknowledged([step])
+
+    assert len(synced) == 2
+
+    run.close()
+
+    assert len(synced) == 3
+
+
+def test_unwritable_directory(procedure_path: Path):
+    (procedure_path.parent / "__notcache__").write_text("not a directory")
+
+    run = journal.Journal.start(procedure_path)
+    run.acknowledged([0])
+    run.close()
+
+    assert run.file is None
@@ -0,0 +1,70 @@
+# pylint: disable=missing-function-docstring,unused-argument
+# pylint: disable=invalid-name,redefined-outer-name
+"""Test suite for loading many Procedure files at once"""
+import os
+from pathlib import Path
+from typing import List
+
+import pytest
+
+from .. import filesystem, index, loader
+from ..constants import CACHE_DIRECTORY_NAME, PARALLEL_LOADING_THRESHOLD_VAR
+
+
+@pytest.fixture
+def many_cpus(monkeypatch):
+    monkeypatch.setattr(os, "cpu_count", lambda: 4)
+
+
+@pytest.fixture
+def catalog(files_in_cwd_and_home: List[Path]) -> List[Path]:
+    broken = files_in_cwd_and_home[0].with_name("broken.yml")
+    broken.write_text("title: [unclosed\n")
+
+    return [*files_in_cwd_and_home[:2], broken, *files_in_cwd_and_home[2:]]
+
+
+@pytest.mark.parametrize("minimum", [1, 1000])
+def test_order_and_failures_are_per_file(many_cpus, catalog: List[Path], minimum):
+    loaded = loader.load_procedures(catalog, minimum=minimum)
+
+    assert isinstance(loaded[2], loader.LoadError)
+    assert loaded[2].path == catalog[2]
+    assert [p.name for p in loaded if not isinstance(p, loader.LoadError)] == [
+        filesystem.deserialize_procedure_file(path).name
+        for path in catalog
+        if path.name != "broken.yml"
+    ]
+
+
+def test_missing_file(many_cpus, catalog: List[Path], tmp_path: Path):
+    loaded = loader.load_procedures([tmp_path / "gone.yml", *catalog], minimum=1)
+
+    assert isinstance(loaded[0], loader.LoadError)
+    assert len(loaded) == len(catalog) + 1
+
+
+def test_threshold_from_the_environment(monkeypatch):
+    monkeypatch.setenv(PARALLEL_LOADING_THRESHOLD_VAR, "3")
+    assert loader.threshold() == 3
+
+    monkeypatch.setenv(PARALLEL_LOADING_THRESHOLD_VAR, "lots")
+    assert loader.threshold() == loader.PARALLEL_LOADING_THRESHOLD
+
+
+def test_parallel_index_matches_serial(
+    many_cpus, monkeypatch, files_in_cwd_and_home: List[Path]
+):
+    monkeypatch.setenv(PARALLEL_LOADING_THRESHOLD_VAR, "1")
+    parallel = index.summaries(files_in_cwd_and_home)
+
+    for path in files_in_cwd_and_home:
+        cache = path.parent / CACHE_DIRECTORY_NAME
+        for cached in cache.iterdir():
+            cached.unlink()
+
+    monkeypatch.delenv(PARALLEL_LOADING_THRESHOLD_VAR)
+    serial = index.summaries(files_in_cwd_and_home)
+
+    assert list(parallel) == files_in_cwd_and_home
+    assert parallel == serial
@@ -0,0 +1,64 @@
+# pylint: disable=missing-function-docstring,unused-argument
+# pylint: disable=invalid-name,redefined-outer-name,protected-access
+"""Test suite for localization"""
+import json
+from importlib import import_module
+
+import pytest
+
+from .. import localization
+from ..localization import _LocaleConfig, _Polyglot, polyglot
+from ..localization.compile import CATALOGS_DIR, LOCALIZATION_DIR
+
+
+def test_locfile_is_complete():
+    polyglot.test()
+
+
+@pytest.mark.parametrize("locfile", sorted(LOCALIZATION_DIR.glob("*.json")))
+def test_catalogs_are_compiled(locfile):
+    assert (CATALOGS_DIR / f"{locfile.stem}.py").exists(), "run localization.compile"
+    catalog = import_module(f"{localization.__name__}.catalogs.{locfile.stem}")
+
+    assert catalog.STRINGS == json.loads(locfile.read_text(encoding="utf-8"))
+
+
+@pytest.fixture
+def half_french(monkeypatch):
+    catalogs = {
+        "en.json": {"nag": "Press enter", "step_prefix": "Step"},
+        "fr.json": {"step_prefix": "Étape"},
+    }
+    monkeypatch.setenv("NOT_LOCALE", "fr")
+    monkeypatch.setattr(localization, "load_catalog", catalogs.__getitem__)
+    monkeypatch.setattr(
+        _Polyglot,
+        "language_mappings",
+        {
+            **_Polyglot.language_mappings,
+            "fr_FR.ISO8859-1": _LocaleConfig(aliases=set(), filename="fr.json"),
+        },
+    )
+
+    return _Polyglot()
+
+
+def test_nothing_loaded_until_asked(half_french: _Polyglot):
+    assert half_french._strings is None
+    assert half_french._locale is None
+
+    assert half_french["step_prefix"] == "Étape"
+
+
+def test_missing_strings_fall_back_to_english(half_french: _Polyglot):
+    assert half_french["nag"] == "Press enter"
+
+
+def test_localized_formats_every_value_as_itself():
+    glot = _Polyglot()
+
+    assert [
+        glot.localized("missing_file_warn", {"name": value}) for value in [1, True, 1.0]
+    ] == [
+        glot["missing_file_warn"].format(name=value) for value in ["1", "True", "1.0"]
+    ]
@@ -0,0 +1,133 @@
+# pylint: disable=missing-function-docstring,unused-argument
+# pylint: disable=invalid-name,redefined-outer-name
+"""Tests for `not completion` and the completion files the shell scripts read"""
+
+import os
+import shutil
+import subprocess
+from pathlib import Path
+from typing import List
+
+import pytest
+
+from ... import filesystem
+from ...completion import (
+    SHELLS,
+    completion_file_is_stale,
+    completion_file_location,
+    main,
+)
+from ...main import app
+from ...subcommand_shared import procedure_name_completions
+
+
+@pytest.mark.parametrize("shell", SHELLS)
+def test_scripts_know_the_subcommands(shell, runner):
+    result = runner.invoke(app, ["completion", shell])
+
+    assert result.exit_code == 0
+    assert "@" not in result.output, "Every placeholder is filled in"
+    assert "not-complete" in result.output, "Python is the fallback"
+    for command in ["do", "edit", "drop", "info", "ls"]:
+        assert command in result.output
+
+
+def test_unsupported_shell(runner):
+    result = runner.invoke(app, ["completion", "powershell"])
+
+    assert result.exit_code != 0
+
+
+def test_not_complete_fallback(files_in_cwd: List[Path], capsys):
+    main(["pre"])
+
+    assert capsys.readouterr().out.splitlines() == ["preflight\t'-'"]
+
+
+def test_completion_file_goes_stale_on_drop(
+    files_in_cwd: List[Path], runner, monkeypatch
+):
+    directory = files_in_cwd[0].parent
+    list(procedure_name_completions(""))
+
+    written = completion_file_location(directory)
+    os.utime(str(written), ns=(0, 0))  # as if the file were written ages ago
+    files_in_cwd[0].unlink()
+    assert completion_file_is_stale(directory), "Same check the shell does"
+
+    # every command is its own process out in the world
+    monkeypatch.setattr(filesystem, "state", filesystem.initstate())
+    runner.invoke(app, ["drop", "preflight", "--no-confirm"])
+    names = completion_file_location(directory).read_text().split()
+    assert "preflight" not in names and "basic" not in names
+
+
+def _bash_completions(script: Path, cwd: Path, home: Path, cur: str) -> List[str]:
+    """Complete `not do <cur>` in a bash with a fake `not-complete` on the PATH,
+    which leaves a mark behind if the script ever falls back to it"""
+
+    fake_bin = script.parent / "bin"
+    fake_bin.mkdir(exist_ok=True)
+    fallback = fake_bin / "not-complete"
+    fallback.write_text(f"#!/bin/sh\ntouch {fake_bin / 'called'}\n")
+    fallback.chmod(0o755)
+
+    completed = subprocess.run(
+        [
+            "bash",
+            "-c",
+            f"source {script}; COMP_WORDS=(not do {cur}); COMP_CWORD=2; "
+            "_not_completions; printf '%s\\n' \"${COMPREPLY[@]}\"",
+        ],
+        cwd=str(cwd),
+        env={
+            **os.environ,
+            "HOME": str(home),
+            "PATH": f"{fake_bin}:{os.environ['PATH']}",
+        },
+        stdout=subprocess.PIPE,
+        check=True,
+    )
+
+    assert not (fake_bin / "called").exists(), "Python was never started"
+    return completed.stdout.decode().split()
+
+
+@pytest.mark.skipif(not shutil.which("bash"), reason="no bash around")
+def test_bash_reads_the_completion_file(
+    files_in_cwd: List[Path], existing_home_dot_nothing_dir: Path, tmp_path, runner
+):
+    list(procedure_name_completions(""))
+    script = tmp_path / "not.bash"
+    script.write_text(runner.invoke(app, ["completion", "bash"]).output)
+
+    assert _bash_completions(
+        script,
+        files_in_cwd[0].parent.parent,
+        existing_home_dot_nothing_dir.parent,
+        "p",
+    ) == ["preflight"]
+
+
+@pytest.mark.skipif(not shutil.which("bash"), reason="no bash around")
+def test_bash_offers_shadowed_names_once(
+    files_in_cwd: List[Path],
+    existing_home_dot_nothing_dir: Path,
+    existing_proc_file_path,
+    tmp_path,
+    runner,
+):
+    (shadowing,) = [path for path in files_in_cwd if path.stem == "preflight"]
+    existing_proc_file_path(
+        existing_home_dot_nothing_dir, shadowing.name, shadowing.read_text()
+    )
+    list(procedure_name_completions(""))
+    script = tmp_path / "not.bash"
+    script.write_text(runner.invoke(app, ["completion", "bash"]).output)
+
+    assert _bash_completions(
+        script,
+        files_in_cwd[0].parent.parent,
+        existing_home_dot_nothing_dir.parent,
+        "p",
+    ) == ["preflight"]
@@ -0,0 +1,82 @@
+# pylint: disable=missing-function-docstring,unused-argument
+# pylint: disable=invalid-name,redefined-outer-name
+"""Tests for `not convert`"""
+from pathlib import Path
+from typing import List
+
+from ... import filesystem
+from ...filesystem import deserialize_procedure_file
+from ...main import app
+
+
+def test_convert_to_json(files_in_cwd: List[Path], runner):
+    before = [deserialize_procedure_file(path) for path in files_in_cwd]
+
+    result = runner.invoke(app, ["convert", "json"])
+
+    assert result.exit_code == 0
+    for procedure in before:
+        converted = procedure.path.with_suffix(".json")
+        assert not procedure.path.exists()
+        assert deserialize_procedure_file(converted) == procedure.copy(
+            update={"path": converted}
+        )
+
+
+def test_keep_and_convert_back(files_in_home: List[Path], runner):
+    runner.invoke(app, ["convert", "binary", "--global", "--keep"])
+    for path in files_in_home:
+        assert path.exists() and path.with_suffix(".notb").exists()
+
+    for path in files_in_home:
+        path.unlink()
+    result = runner.invoke(app, ["convert", "yaml", "-d", str(files_in_home[0].parent)])
+
+    assert result.exit_code == 0
+    assert all(path.exists() for path in files_in_home)
+
+
+def test_existing_files_are_left_alone(path_to_simple_basic_proc_file: Path, runner):
+    json_file = path_to_simple_basic_proc_file.with_suffix(".json")
+    json_file.write_text("{}")
+
+    runner.invoke(app, ["convert", "json"])
+
+    assert json_file.read_text() == "{}"
+    assert path_to_simple_basic_proc_file.exists()
+
+
+def test_unsupported_format(files_in_cwd: List[Path], runner):
+    result = runner.invoke(app, ["convert", "toml"])
+
+    assert result.exit_code != 0
+    assert all(path.exists() for path in files_in_cwd)
+
+
+def test_converted_procedures_still_work(
+    path_to_simple_basic_proc_file: Path, runner, monkeypatch
+):
+    runner.invoke(app, ["convert", "binary"])
+    # every command is its own process out in the world
+    monkeypatch.setattr(filesystem, "state", filesystem.initstate())
+
+    result = runner.invoke(app, ["info", "basic"])
+    assert "Set yourself up to be the automation whiz" in result.output
+
+    result = runner.invoke(app, ["edit", "basic"])
+    assert result.exit_code != 0, "Binary Procedures can't be edited"
+
+
+def test_broken_files_are_skipped(
+    files_in_cwd: List[Path], existing_proc_file_path, runner
+):
+    broken = existing_proc_file_path(
+        files_in_cwd[0].parent, "broken.yml", "title: [unclosed\n"
+    )
+
+    result = runner.invoke(app, ["convert", "json"])
+
+    assert result.exit_code == 0
+    assert "Skipping broken.yml" in result.output
+    assert broken.exists() and not broken.with_suffix(".json").exists()
+    assert all(path.with_suffix(".json").exists() for path in files_in_cwd)
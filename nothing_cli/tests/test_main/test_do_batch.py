@@ -0,0 +1,90 @@
+# pylint: disable=missing-function-docstring,unused-argument
+# pylint: disable=invalid-name,redefined-outer-name
+"""Test suite for `not do --batch`"""
+import json
+from pathlib import Path
+
+from ...main import app
+from ...models import Procedure
+
+
+def test_knowns_alone(proc_with_knowns: Procedure, runner):
+    result = runner.invoke(app, ["do", proc_with_knowns.name, "--batch"])
+
+    assert result.exit_code == 0
+    assert result.output == (
+        "Freak out!!\n\n"
+        "Grab Everything you own\n\n"
+        "Get out of here!\nRun as fast as you can!!\n"
+    )
+
+
+def test_set(proc_with_context: Procedure, runner):
+    result = runner.invoke(
+        app,
+        [
+            "do",
+            proc_with_context.name,
+            "--set",
+            "current_user_name=Ainsley",
+            "-s",
+            "what_user_accomplished_today=a=b",
+        ],
+    )
+
+    assert result.exit_code == 0
+    assert "Take a good look at yourself, Ainsley." in result.output
+    assert "something great today: a=b." in result.output
+
+
+def test_missing_answers_print_nothing(proc_with_context: Procedure, runner):
+    result = runner.invoke(
+        app, ["do", proc_with_context.name, "-s", "current_user_name=Ainsley"]
+    )
+
+    assert result.exit_code == 1
+    assert "what_user_accomplished_today" in result.output
+    assert "Take a good look" not in result.output
+
+
+def test_answers_file_and_overrides(
+    proc_with_context: Procedure, runner, tmp_path: Path
+):
+    answers = tmp_path / "answers.yml"
+    answers.write_text(
+        "current_user_name: Ainsley\nwhat_user_accomplished_today: nothing\n"
+    )
+
+    result = runner.invoke(
+        app,
+        ["do", proc_with_context.name, "-a", str(answers), "-s", "current_user_name=A"],
+    )
+
+    assert result.exit_code == 0
+    assert "yourself, A." in result.output
+    assert "today: nothing." in result.output
+
+
+def test_json_lines_on_stdin(proc_with_context: Procedure, runner):
+    lines = [
+        {"current_user_name": name, "what_user_accomplished_today": "it"}
+        for name in ["one", "two", "three"]
+    ]
+
+    result = runner.invoke(
+        app,
+        ["do", proc_with_context.name, "--answers", "-"],
+        input="\n".join(map(json.dumps, lines)) + "\n",
+    )
+
+    assert result.exit_code == 0
+    assert [
+        line for line in result.output.splitlines() if line.startswith("Take")
+    ] == [f"Take a good look at yourself, {name}." for name in ["one", "two", "three"]]
+
+
+def test_bad_answers(proc_with_context: Procedure, runner):
+    result = runner.invoke(app, ["do", proc_with_context.name, "-s", "no-equals"])
+
+    assert result.exit_code != 0
+    assert "Take a good look" not in result.output
@@ -0,0 +1,90 @@
+# pylint: disable=missing-function-docstring,unused-argument
+# pylint: disable=invalid-name,redefined-outer-name
+"""Test suite for `not do` with steps that declare what they come after"""
+from typing import Callable
+
+import pytest
+
+from ...main import app
+from ...models import Procedure
+
+
+@pytest.fixture
+def release_proc(existing_proc_instance: Callable) -> Procedure:
+    return existing_proc_instance(
+        "release.yml",
+        """title: Release
+steps: |-
+  @build-api after:
+  Build the API
+  $ echo api built
+
+  @build-web after:
+  Build the web app
+  $ echo web built
+
+  @deploy after: build-api, build-web
+  Ship it""",
+    )
+
+
+def test_ready_steps_share_a_screen(release_proc: Procedure, runner):
+    result = runner.invoke(app, ["do", release_proc.name], input="\n\n")
+
+    assert result.exit_code == 0
+    assert "@build-api" not in result.output
+    assert "Ready now, in any order: steps 0, 1" in result.output
+    assert "Critical path: 0 → 2" in result.output
+    before_nag, after_nag = result.output.split("Press enter once", 1)
+    assert "Build the API" in before_nag
+    assert "Build the web app" in before_nag
+    assert "Ship it" in after_nag
+    assert "All done!" in after_nag
+
+
+def test_ready_commands_run_together(release_proc: Procedure, runner):
+    result = runner.invoke(app, ["do", release_proc.name, "--run"], input="\n\n")
+
+    assert result.exit_code == 0
+    assert "] api built" in result.output
+    assert "] web built" in result.output
+
+
+def test_declarations_stay_out_of_batch_output(release_proc: Procedure, runner):
+    result = runner.invoke(app, ["do", release_proc.name, "--batch"])
+
+    assert result.exit_code == 0
+    assert "@" not in result.output
+    assert result.output.startswith("Build the API\n")
+
+
+def test_bad_graph(existing_proc_instance: Callable, runner):
+    proc = existing_proc_instance(
+        "loop.yml",
+        "title: Loop\nsteps: |-\n  @a after: b\n  one\n\n  @b after: a\n  two",
+    )
+
+    result = runner.invoke(app, ["do", proc.name])
+
+    assert result.exit_code == 1
+    assert "wait on each other" in result.output
+
+
+def test_at_lines_without_after_are_just_text(existing_proc_instance: Callable, runner):
+    procedure = existing_proc_instance(
+        "oncall.yml",
+        """title: On call
+steps: |-
+  @oncall
+  Tell them you're on it
+
+  @here
+  Say so in the channel""",
+    )
+
+    result = runner.invoke(app, ["do", procedure.name], input="\n\n")
+
+    assert result.exit_code == 0
+    assert "Ready now" not in result.output
+    assert "@oncall\nTell them you're on it" in result.output
+    assert "@here\nSay so in the channel" in result.output
@@ -0,0 +1,83 @@
+# pylint: disable=missing-function-docstring,unused-argument
+# pylint: disable=invalid-name,redefined-outer-name
+"""Test suite for `not do --resume`"""
+from typing import Callable
+
+import pytest
+
+from ...main import app
+from ...models import Procedure
+
+
+@pytest.fixture
+def long_proc(existing_proc_instance: Callable) -> Procedure:
+    return existing_proc_instance(
+        "long.yml",
+        """title: Long
+context:
+  - host
+  - __version
+steps: |-
+  Log in to {host}
+
+  Install {__version}
+
+  Restart {host}""",
+    )
+
+
+def test_resume_where_it_died(long_proc: Procedure, runner):
+    # answers host, acknowledges step 0, answers __version, then stdin runs out
+    died = runner.invoke(app, ["do", long_proc.name], input="db1\n\n1.2\n")
+
+    assert died.exit_code != 0
+    assert "Install 1.2" in died.output
+
+    result = runner.invoke(app, ["do", long_proc.name, "--resume"], input="\n\n")
+
+    assert result.exit_code == 0
+    assert "Resuming at step 1, with 2 answers from last time" in result.output
+    assert "Log in to" not in result.output
+    assert "Install 1.2" in result.output
+    assert "Restart db1" in result.output
+    assert "All done!" in result.output
+
+
+def test_finished_runs_are_not_resumed(long_proc: Procedure, runner):
+    finished = runner.invoke(app, ["do", long_proc.name], input="db1\n\n1.2\n\n\n")
+    assert finished.exit_code == 0
+
+    result = runner.invoke(
+        app, ["do", long_proc.name, "--resume"], input="db2\n\n1.3\n\n\n"
+    )
+
+    assert result.exit_code == 0
+    assert "no unfinished run" in result.output
+    assert "Log in to db2" in result.output
+
+
+def test_resume_a_scheduled_walkthrough(existing_proc_instance: Callable, runner):
+    proc = existing_proc_instance(
+        "fanout.yml",
+        """title: Fanout
+steps: |-
+  @a after:
+  First
+
+  @b after:
+  Second
+
+  @c after: a, b
+  Third""",
+    )
+
+    died = runner.invoke(app, ["do", proc.name], input="")
+    assert died.exit_code != 0
+
+    runner.invoke(app, ["do", proc.name, "--resume"], input="\n")
+    result = runner.invoke(app, ["do", proc.name, "--resume"], input="\n")
+
+    assert result.exit_code == 0
+    assert "Resuming at step 2" in result.output
+    assert "First" not in result.output
+    assert "Third" in result.output
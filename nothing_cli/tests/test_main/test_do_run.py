@@ -0,0 +1,63 @@
+# pylint: disable=missing-function-docstring,unused-argument
+# pylint: disable=invalid-name,redefined-outer-name
+"""Test suite for `not do --run`"""
+from typing import Callable
+
+import pytest
+
+from ...main import app
+from ...models import Procedure
+
+
+@pytest.fixture
+def runnable_proc(existing_proc_instance: Callable) -> Procedure:
+    return existing_proc_instance(
+        "runnable.yml",
+        """title: Runnable
+knowns:
+  - greeting: hello
+steps: |-
+  Say it
+  $ echo {greeting} world
+
+  Read the docs
+
+  In the background
+  $ echo first &
+
+  Also in the background
+  $ echo second &
+
+  Now it gets risky
+  $ exit 4""",
+    )
+
+
+def test_commands_run_only_with_run(runnable_proc: Procedure, runner):
+    result = runner.invoke(app, ["do", runnable_proc.name], input="\n" * 5)
+
+    assert result.exit_code == 0
+    assert "\nhello world\n" not in result.output
+
+
+def test_run(runnable_proc: Procedure, runner):
+    # one enter per group of steps, the two independent ones are one group
+    result = runner.invoke(
+        app, ["do", runnable_proc.name, "--run"], input="\n\n\n" + "y\n" + "\n"
+    )
+
+    assert result.exit_code == 0
+    assert "\nhello world\n" in result.output
+    assert "] first" in result.output
+    assert "] second" in result.output
+    assert "exited with status 4" in result.output
+    assert "All done!" in result.output
+
+
+def test_failed_command_can_abort(runnable_proc: Procedure, runner):
+    result = runner.invoke(
+        app, ["do", runnable_proc.name, "--run"], input="\n\n\n" + "n\n"
+    )
+
+    assert result.exit_code == 1
+    assert "All done!" not in result.output
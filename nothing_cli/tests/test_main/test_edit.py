@@ -1,10 +1,16 @@
 # pylint: disable=missing-function-docstring,unused-argument
 # pylint: disable=invalid-name,redefined-outer-name
 """Test suite for `not edit`"""
+
+from pathlib import Path
+from unittest.mock import Mock
+
 import pytest
 
+from ...completion import completion_file_location
 from ...localization import polyglot as glot
 from ...main import app, typer
+from ...subcommand_shared import procedure_name_completions
 
 
 @pytest.fixture(autouse=True)
@@ -43,3 +49,39 @@ def test_rename(runner, files_in_home):
         glot["file_renamed"].format(old_name=files_in_home[1].stem, name="jacob")
         in result.output
     )
+
+
+def test_rename_keeps_extension_and_edits_renamed_file(
+    runner, files_in_home, monkeypatch
+):
+    edit = Mock()
+    monkeypatch.setattr(typer, "edit", edit)
+    renamed = files_in_home[1].with_name("jacob.yml")
+
+    runner.invoke(app, ["edit", files_in_home[1].stem, "--rename"], input="jacob\n")
+
+    assert renamed.exists()
+    assert not files_in_home[1].exists()
+    edit.assert_called_once_with(filename=str(renamed))
+
+    result = runner.invoke(app, ["info", "jacob"])
+
+    assert str(renamed) in result.output
+
+
+def test_edited_description_reaches_the_completion_file(
+    runner, files_in_home, monkeypatch
+):
+    list(procedure_name_completions(""))
+    edited = files_in_home[0]
+
+    def edit(filename=None):
+        Path(filename).write_text(
+            Path(filename).read_text() + "description: Freshly edited\n"
+        )
+
+    monkeypatch.setattr(typer, "edit", edit)
+    runner.invoke(app, ["edit", edited.stem])
+
+    completions = completion_file_location(edited.parent).read_text()
+    assert f"{edited.stem}\t'Freshly edited'" in completions.splitlines()
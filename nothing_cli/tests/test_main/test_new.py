@@ -126,6 +126,17 @@ def test_skeleton(existing_cwd_dot_nothing_dir, runner, flag_variant):
     assert created_file.exists()
 
 
+def test_skeleton_opens_in_editor(
+    existing_cwd_dot_nothing_dir, patched_typer_edit, runner
+):
+    result = runner.invoke(app, ["new", "-N", "how-to-sing", "-K"])
+
+    assert result.exit_code == 0
+    patched_typer_edit.assert_called_once_with(
+        filename=str(existing_cwd_dot_nothing_dir / "how-to-sing.yml")
+    )
+
+
 @pytest.mark.parametrize("flag_variant", ["--nothing", "-T"])
 def test_nothing(existing_cwd_dot_nothing_dir, runner, flag_variant):
     result = runner.invoke(app, ["new", "--no-edit", flag_variant])
@@ -0,0 +1,148 @@
+# pylint: disable=missing-function-docstring,unused-argument
+# pylint: disable=invalid-name,redefined-outer-name
+"""Test suite for `not render`"""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from ...batch import MissingVariables, render_rows
+from ...main import app
+from ...models import Procedure
+
+
+@pytest.fixture
+def names():
+    return [f"user {n}" for n in range(150)]
+
+
+@pytest.fixture
+def rows_csv(tmp_path: Path, names) -> Path:
+    rows = tmp_path / "rows.csv"
+    rows.write_text(
+        "current_user_name,what_user_accomplished_today\n"
+        + "".join(f"{name},stuff\n" for name in names)
+    )
+
+    return rows
+
+
+def greetings(output: str):
+    return [line for line in output.splitlines() if line.startswith("Take")]
+
+
+@pytest.mark.parametrize("jobs", ["1", "2"])
+def test_csv_to_stdout_in_order(
+    proc_with_context: Procedure, runner, rows_csv: Path, names, jobs
+):
+    result = runner.invoke(
+        app, ["render", proc_with_context.name, str(rows_csv), "-j", jobs]
+    )
+
+    assert result.exit_code == 0
+    assert greetings(result.output) == [
+        f"Take a good look at yourself, {name}." for name in names
+    ]
+
+
+def test_json_lines_on_stdin_to_a_directory(
+    proc_with_context: Procedure, runner, tmp_path: Path
+):
+    lines = [
+        {"current_user_name": name, "what_user_accomplished_today": "it"}
+        for name in ["Ainsley", "Someone Else"]
+    ]
+    output = tmp_path / "rendered"
+
+    result = runner.invoke(
+        app,
+        [
+            "render",
+            proc_with_context.name,
+            "-",
+            "-o",
+            str(output),
+            "-k",
+            "current_user_name",
+        ],
+        input="\n".join(map(json.dumps, lines)) + "\n",
+    )
+
+    assert result.exit_code == 0
+    assert sorted(path.name for path in output.iterdir()) == [
+        "ainsley.txt",
+        "someone-else.txt",
+    ]
+    assert "yourself, Ainsley." in (output / "ainsley.txt").read_text()
+
+
+def test_repeated_keys_keep_every_row(
+    proc_with_context: Procedure, runner, tmp_path: Path
+):
+    rows = tmp_path / "rows.csv"
+    rows.write_text(
+        "current_user_name,what_user_accomplished_today\n"
+        "Ainsley,this\nainsley,that\nAinsley,the other\n"
+    )
+    output = tmp_path / "rendered"
+
+    result = runner.invoke(
+        app,
+        [
+            "render",
+            proc_with_context.name,
+            str(rows),
+            "-o",
+            str(output),
+            "-k",
+            "current_user_name",
+        ],
+    )
+
+    assert result.exit_code == 0
+    assert sorted(path.name for path in output.iterdir()) == [
+        "ainsley-2.txt",
+        "ainsley-3.txt",
+        "ainsley.txt",
+    ]
+    assert "yourself, ainsley." in (output / "ainsley-2.txt").read_text()
+
+
+def test_missing_column_renders_nothing(
+    proc_with_context: Procedure, runner, tmp_path: Path
+):
+    rows = tmp_path / "rows.csv"
+    rows.write_text("current_user_name\nAinsley\n")
+
+    result = runner.invoke(app, ["render", proc_with_context.name, str(rows)])
+
+    assert result.exit_code == 1
+    assert "what_user_accomplished_today" in result.output
+    assert "Take a good look" not in result.output
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_missing_value_names_the_row(proc_with_context: Procedure, jobs):
+    rows = [{"current_user_name": "A", "what_user_accomplished_today": "B"}] * 100
+    rows[70] = {"current_user_name": "A"}
+
+    with pytest.raises(MissingVariables) as err:
+        list(render_rows(proc_with_context, rows, jobs=jobs, rows_per_chunk=8))
+
+    assert err.value.row == 71
+    assert err.value.names == ["what_user_accomplished_today"]
+
+
+def test_rows_are_read_as_needed(proc_with_context: Procedure):
+    read = []
+
+    def rows():
+        for n in range(1000):
+            read.append(n)
+            yield {"current_user_name": n, "what_user_accomplished_today": n}
+
+    rendered = render_rows(proc_with_context, rows(), rows_per_chunk=10)
+    next(rendered)
+
+    assert len(read) == 10
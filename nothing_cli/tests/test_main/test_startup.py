@@ -0,0 +1,132 @@
+# pylint: disable=missing-function-docstring,unused-argument
+# pylint: disable=invalid-name,redefined-outer-name
+"""Import-time budget for `not`.
+
+Each test runs `not` in a fresh interpreter, since pytest has long since imported
+everything under the sun, and checks what that interpreter had to pay for."""
+
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+HEAVY_MODULES = [
+    "nothing_cli.models",
+    "nothing_cli.theatrics",
+    "nothing_cli.writer",
+    "pydantic",
+    "ruamel.yaml",
+    "slugify",
+]
+
+REPO_ROOT = Path(__file__).resolve().parents[3]
+
+INVOKE_NOT = """
+import json, sys
+
+from nothing_cli import filesystem
+from nothing_cli.main import app
+
+try:
+    app({argv!r})
+except SystemExit:
+    pass
+
+print(json.dumps({{
+    "heavy": [m for m in {heavy!r} if m in sys.modules],
+    "globbed": isinstance(filesystem.state, filesystem.ProcedureState),
+}}), file=sys.stderr)
+"""
+
+
+COMPLETE = """
+import json, sys
+
+from nothing_cli.completion import main
+
+main({argv!r})
+
+print(json.dumps({{
+    "heavy": [m for m in {heavy!r} if m in sys.modules],
+}}), file=sys.stderr)
+"""
+
+# what `not-complete` must get by without, on top of HEAVY_MODULES
+NOT_COMPLETE_HEAVY_MODULES = [
+    *HEAVY_MODULES,
+    "click",
+    "typer",
+    "nothing_cli.filesystem",
+    "nothing_cli.localization",
+    "nothing_cli.main",
+]
+
+
+@pytest.fixture
+def huge_catalog(tmp_path) -> Path:
+    """Thousands of Procedures that would blow up if anything tried to parse them"""
+
+    home = tmp_path / "huge_home"
+    dot_nothing = home / ".nothing"
+    dot_nothing.mkdir(parents=True)
+
+    for i in range(3000):
+        (dot_nothing / f"proc-{i}.yml").write_text("title: [unclosed\nsteps: |-\n")
+
+    return home
+
+
+@pytest.fixture
+def small_catalog(tmp_path) -> Path:
+    home = tmp_path / "small_home"
+    dot_nothing = home / ".nothing"
+    dot_nothing.mkdir(parents=True)
+
+    for name in ("preflight", "deploy", "rollback"):
+        (dot_nothing / f"{name}.yml").write_text(
+            f"title: {name.title()}\ndescription: All about {name}\nsteps: |-\n  Go\n"
+        )
+
+    return home
+
+
+def run_python(template: str, argv, home: Path, heavy=HEAVY_MODULES):
+    env = {**os.environ, "HOME": str(home), "PYTHONPATH": str(REPO_ROOT)}
+    script = template.format(argv=argv, heavy=heavy)
+    completed = subprocess.run(
+        [sys.executable, "-c", script],
+        cwd=str(home),
+        env=env,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        check=True,
+    )
+    *_, report = completed.stderr.decode().strip().splitlines()
+
+    return completed.stdout.decode(), json.loads(report)
+
+
+def run_not(argv, home: Path) -> dict:
+    _, report = run_python(INVOKE_NOT, argv, home)
+
+    return report
+
+
+def test_version_stays_cheap(huge_catalog):
+    report = run_not(["--version"], huge_catalog)
+
+    assert report["heavy"] == [], "No heavy dependency is imported"
+    assert not report["globbed"], "The .nothing dirs are never even looked at"
+
+
+def test_not_complete_stays_cheap(small_catalog):
+    run_python(COMPLETE, [], small_catalog)  # cold, builds the index
+    output, report = run_python(
+        COMPLETE, ["de"], small_catalog, heavy=NOT_COMPLETE_HEAVY_MODULES
+    )
+
+    assert output.splitlines() == ["deploy\t'All about deploy'"]
+    assert report["heavy"] == [], "Nothing but discovery and the index"
@@ -0,0 +1,40 @@
+# pylint: disable=missing-function-docstring,unused-argument
+# pylint: disable=invalid-name,redefined-outer-name
+"""Tests for `not stats`"""
+from typing import Callable
+
+from ...main import app
+
+
+def test_stats_after_walkthroughs(existing_proc_instance: Callable, runner):
+    proc = existing_proc_instance(
+        "short.yml", "title: Short\nsteps: |-\n  one\n\n  two"
+    )
+
+    runner.invoke(app, ["do", proc.name], input="\n\n")
+    runner.invoke(app, ["do", proc.name], input="\n")
+
+    result = runner.invoke(app, ["stats", proc.name])
+
+    assert result.exit_code == 0
+    assert "2 runs, 1 finished" in result.output
+    header, first, second = result.output.splitlines()[2:5]
+    assert header.split() == ["Step", "Runs", "p50", "p95"]
+    assert first.split()[:2] == ["0", "2"]
+    assert second.split()[:2] == ["1", "1"]
+    assert "Given up at: step 1 (1)" in result.output
+
+
+def test_no_history(existing_proc_instance: Callable, runner):
+    proc = existing_proc_instance("unused.yml", "title: Unused\nsteps: one")
+
+    result = runner.invoke(app, ["stats", proc.name])
+
+    assert result.exit_code == 0
+    assert "hasn't been walked through yet" in result.output
+
+
+def test_missing_procedure(runner):
+    result = runner.invoke(app, ["stats", "nope"])
+
+    assert result.exit_code == 1
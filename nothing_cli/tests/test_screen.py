@@ -0,0 +1,53 @@
+# pylint: disable=missing-function-docstring,unused-argument
+# pylint: disable=invalid-name,redefined-outer-name
+"""Test suite for the buffered, styled output"""
+from typing import List
+
+import pytest
+import typer
+from typer.testing import CliRunner
+
+from .. import screen
+from ..main import app
+from ..screen import Screen, style
+
+
+@pytest.fixture(autouse=True)
+def colorful(monkeypatch):
+    monkeypatch.setattr(screen, "_plain", False)
+
+
+@pytest.fixture
+def echoes(monkeypatch) -> List[str]:
+    echoed: List[str] = []
+    monkeypatch.setattr(typer, "echo", lambda text, **kwargs: echoed.append(text))
+
+    return echoed
+
+
+def test_style_matches_typer():
+    assert style("hi", fg=typer.colors.YELLOW, bold=True) == typer.style(
+        "hi", fg=typer.colors.YELLOW, bold=True
+    )
+
+
+def test_plain():
+    screen.set_plain()
+
+    assert style("hi", fg=typer.colors.YELLOW) == "hi"
+
+
+def test_one_write_per_screen(echoes: List[str]):
+    with Screen() as s:
+        s.line("one", bold=True)
+        s.line()
+        s.add("two")
+
+    assert echoes == [typer.style("one", bold=True) + "\n\ntwo"]
+
+
+def test_plain_flag(files_in_cwd):
+    runner = CliRunner()
+
+    assert "\x1b[" in runner.invoke(app, ["ls"], color=True).output
+    assert "\x1b[" not in runner.invoke(app, ["--plain", "ls"], color=True).output
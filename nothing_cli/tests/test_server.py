@@ -0,0 +1,223 @@
+# pylint: disable=missing-function-docstring,unused-argument
+# pylint: disable=invalid-name,redefined-outer-name
+"""Test suite for `not serve` and the client that talks to it"""
+import io
+import os
+import threading
+import time
+from pathlib import Path
+from typing import List
+
+import pytest
+
+from .. import client, compiled, index, screen, server, trace
+from ..constants import SOCKET_VAR
+
+
+@pytest.fixture
+def location(tmp_path: Path, monkeypatch) -> Path:
+    location = tmp_path / "not.sock"
+    monkeypatch.setenv(SOCKET_VAR, str(location))
+
+    return location
+
+
+@pytest.fixture
+def daemon(files_in_cwd_and_home: List[Path], location: Path, monkeypatch):
+    monkeypatch.setattr(compiled, "_loaded", None)  # kept loaded, but only for now
+    daemon = server.start(location)
+    thread = threading.Thread(target=daemon.serve, daemon=True)
+    thread.start()
+
+    yield daemon
+
+    client.request({"stop": True})
+    thread.join(5)
+
+
+def test_commands(daemon):
+    response = client.request({"argv": ["ls"]})
+
+    assert response["code"] == 0
+    assert "preflight" in response["stdout"]
+
+
+def test_batch_rendering_and_failures(daemon, existing_proc_instance):
+    existing_proc_instance("hi.yml", "title: Hi\ncontext:\n  - name\nsteps: Hi {name}")
+
+    rendered = client.request({"argv": ["do", "hi", "--set", "name=you"]})
+    missing = client.request({"argv": ["do", "hi", "--batch"]})
+
+    assert rendered == {"code": 0, "stdout": "Hi you\n", "stderr": ""}
+    assert missing["code"] == 1
+    assert "name" in missing["stdout"] + missing["stderr"]
+
+
+def test_stdin_is_forwarded(daemon):
+    response = client.request(
+        {"argv": ["render", "simple", "-"], "stdin": '{"current_user_name": "Al"}\n'}
+    )
+
+    assert response["code"] == 1  # what_user_accomplished_today is missing
+    assert "what_user_accomplished_today" in response["stderr"]
+
+
+@pytest.mark.parametrize(
+    "answers", [["--answers=-"], ["--answers", "-"], ["-a-"], ["-a", "-"], ["-ba-"]]
+)
+def test_answers_piped_through_the_client(
+    daemon, existing_proc_instance, answers, monkeypatch, capsys
+):
+    existing_proc_instance(
+        "greet.yml", "title: Greet\ncontext:\n  - who\nsteps: Hi {who}"
+    )
+    monkeypatch.setattr("sys.stdin", io.StringIO('{"who": "bob"}\n'))
+    answered = []
+    answer = daemon.answer
+    monkeypatch.setattr(
+        daemon, "answer", lambda message: answered.append(message) or answer(message)
+    )
+
+    with pytest.raises(SystemExit) as exited:
+        client.main(["do", "greet", *answers])
+
+    assert exited.value.code == 0
+    assert capsys.readouterr().out == "Hi bob\n"
+    assert [message["stdin"] for message in answered] == ['{"who": "bob"}\n']
+
+
+def test_ls_and_info_come_from_memory(daemon, monkeypatch):
+    def explode(*args, **kwargs):
+        raise AssertionError("the index was read")
+
+    monkeypatch.setattr(index, "summaries", explode)
+    monkeypatch.setattr(index, "summary", explode)
+
+    listed = client.request({"argv": ["ls"]})
+    info = client.request({"argv": ["info", "basic"]})
+
+    assert listed["code"] == 0 and "preflight" in listed["stdout"]
+    assert info["code"] == 0, info["stderr"]
+    assert "Set yourself up to be the automation whiz" in info["stdout"]
+
+
+def test_options_only_last_one_request(daemon):
+    plain = screen.is_plain()
+
+    traced = client.request({"argv": ["--trace", "--plain", "ls"]})
+
+    assert '"phases"' in traced["stderr"]
+    assert not trace.enabled()
+    assert screen.is_plain() is plain
+    assert '"phases"' not in client.request({"argv": ["ls"]})["stderr"]
+
+
+def test_files_changed_on_disk(daemon, files_in_cwd_and_home: List[Path]):
+    assert client.request({"locate": "later"})["code"] == 1
+
+    later = files_in_cwd_and_home[0].with_name("later.yml")
+    later.write_text("title: Later\nsteps: one")
+
+    assert client.request({"locate": "later"})["stdout"] == str(later)
+    assert "later\t" in client.request({"complete": "la"})["stdout"]
+
+    later.write_text("title: Later\nsteps: two")
+
+    assert client.request({"argv": ["do", "later", "-b"]})["stdout"] == "two\n"
+
+
+def test_other_directories_run_locally(daemon, monkeypatch, capsys):
+    monkeypatch.setattr(daemon, "cwd", "/somewhere/else")
+
+    assert client.request({"argv": ["ls"]}) is None
+    with pytest.raises(SystemExit):
+        client.main(["info", "basic"])
+    assert "Set yourself up to be the automation whiz" in capsys.readouterr().out
+
+
+def test_stuck_daemon(daemon, monkeypatch):
+    answer = daemon.answer
+    monkeypatch.setattr(
+        daemon, "answer", lambda message: time.sleep(0.5) or answer(message)
+    )
+
+    with monkeypatch.context() as patched:
+        patched.setattr(client, "ANSWER_TIMEOUT", 0.1)
+        started = time.perf_counter()
+
+        assert client.request({"argv": ["ls"]}) is None
+        assert time.perf_counter() - started < 0.5
+
+
+def test_one_daemon_per_socket(daemon, location: Path):
+    with pytest.raises(FileExistsError):
+        server.start(location)
+
+
+def test_no_daemon(location: Path):
+    assert client.request({"argv": ["ls"]}) is None
+
+
+def test_sockets_of_other_users(daemon, location: Path, monkeypatch):
+    uid = os.getuid()
+
+    with monkeypatch.context() as stranger:
+        stranger.setattr(os, "getuid", lambda: uid + 1)
+
+        assert client.request({"argv": ["ls"]}) is None, "Not talking to a stranger"
+        with pytest.raises(PermissionError):
+            server.start(location)
+
+    assert location.exists(), "Somebody else's socket is left alone"
+
+
+def test_socket_directory_is_private(
+    files_in_cwd_and_home: List[Path], tmp_path: Path, monkeypatch
+):
+    monkeypatch.delenv(SOCKET_VAR, raising=False)
+    monkeypatch.setenv("XDG_RUNTIME_DIR", str(tmp_path))
+    monkeypatch.setattr(compiled, "_loaded", None)
+    directory = client.socket_directory()
+    directory.mkdir(mode=0o755)
+    directory.chmod(0o755)
+
+    daemon = server.start()
+    daemon.close()
+
+    assert daemon.location.parent == directory
+    assert directory.stat().st_mode & 0o777 == 0o700
+
+
+@pytest.mark.parametrize(
+    "argv, expected",
+    [
+        (["ls"], True),
+        (["render", "x", "rows.csv"], True),
+        (["do", "x", "--set=a=1"], True),
+        (["do", "x", "-b"], True),
+        (["do", "x", "-rs", "a=1"], True),
+        (["do", "x", "-t", "-b"], False),
+        (["do", "x"], False),
+        (["new"], False),
+        ([], False),
+    ],
+)
+def test_served(argv, expected):
+    assert client.served(argv) is expected
+
+
+@pytest.mark.parametrize(
+    "argv, expected",
+    [
+        (["do", "x", "--answers=-"], True),
+        (["do", "x", "-a", "-"], True),
+        (["do", "x", "-ra-"], True),
+        (["do", "x", "--answers", "answers.json"], False),
+        (["do", "x", "-s", "a=-"], False),
+        (["do", "x", "--", "-a-"], False),
+        (["render", "x", "-"], True),
+        (["render", "x", "rows.csv"], False),
+    ],
+)
+def test_reads_stdin(argv, expected):
+    assert client.reads_stdin(argv) is expected
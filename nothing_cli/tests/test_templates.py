@@ -0,0 +1,53 @@
+# pylint: disable=missing-function-docstring,unused-argument
+# pylint: disable=invalid-name,redefined-outer-name
+"""Test suite for compiled step templates"""
+import pytest
+
+from ..templates import StepTemplate, compile_steps
+
+VALUES = {"name": "Ainsley", "count": 3, "__lazy": "later", "width": 6}
+
+
+@pytest.mark.parametrize(
+    "step",
+    [
+        "no fields at all",
+        "hi {name}",
+        "{name}{name} {count}",
+        "{{escaped}} but {name} isn't",
+        "{count:>4} and {name!r} and {name!s:^11}",
+        "{name:{width}}",
+        "{__lazy}",
+        "",
+    ],
+)
+def test_render_matches_str_format(step):
+    template = StepTemplate(step, {})
+
+    assert template.render(VALUES) == step.format(**VALUES)
+
+
+def test_names_and_where_they_come_from():
+    context = {"name": {"name": "Who are you?"}, "__lazy": "__lazy"}
+    template = StepTemplate("{name} {__lazy} {count} {nope}", context, ["count"])
+
+    assert template.names == {"name", "__lazy", "count", "nope"}
+    assert template.undefined == {"nope"}
+    assert template.context_items == context
+
+
+def test_broken_step_only_fails_when_rendered():
+    template = StepTemplate("an { unbalanced brace", {})
+
+    with pytest.raises(ValueError):
+        template.render(VALUES)
+
+
+def test_compile_steps(procedure_with_knowns, existing_proc_instance):
+    name, content = procedure_with_knowns
+    procedure = existing_proc_instance(name, content)
+    templates = compile_steps(procedure)
+
+    assert [t.source for t in templates] == procedure.steps
+    assert templates[1].names == {"what_to_grab"}
+    assert not any(t.undefined for t in templates)
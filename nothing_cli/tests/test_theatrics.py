@@ -91,3 +91,8 @@ class TestInterpolationStore:
             "After calling get_interpolations, the store sets the"
             "lazy contex variable value to the value provided to stdin"
         )
+
+    def test_render(self, procedure_with_context_only):
+        store = InterpolationStore(procedure_with_context_only)
+
+        assert store.render(0) == "Check your ticket. Make sure it says sure."
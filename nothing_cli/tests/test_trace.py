@@ -0,0 +1,56 @@
+# pylint: disable=missing-function-docstring,unused-argument
+# pylint: disable=invalid-name,redefined-outer-name,protected-access
+"""Test suite for NOT_TRACE"""
+import json
+import tracemalloc
+from pathlib import Path
+
+import pytest
+
+from .. import trace
+
+
+@pytest.fixture
+def tracer(monkeypatch, tmp_path: Path):
+    """Tracing on, without the report at exit that enable() would set up"""
+
+    tracer = trace._Tracer(str(tmp_path / "trace.json"), memory=True)
+    monkeypatch.setattr(trace, "_tracer", tracer)
+
+    yield tracer
+
+    tracemalloc.stop()
+
+
+@trace.traced("allocate")
+def allocate(n: int):
+    return [0] * n
+
+
+def test_off_by_default():
+    assert trace.span("anything") is trace._NO_SPAN
+    assert allocate(3) == [0, 0, 0]
+
+
+def test_phases(tracer: trace._Tracer, tmp_path: Path):
+    with trace.span("outer"):
+        allocate(100_000)
+        allocate(10)
+
+    tracer.write()
+    phases = json.loads((tmp_path / "trace.json").read_text())["phases"]
+
+    assert phases["allocate"]["calls"] == 2
+    assert phases["outer"]["calls"] == 1
+    assert phases["outer"]["seconds"] >= phases["allocate"]["seconds"]
+    assert phases["allocate"]["peak_bytes"] >= 100_000 * 8
+    assert phases["outer"]["peak_bytes"] >= phases["allocate"]["peak_bytes"]
+
+
+def test_span_survives_exceptions(tracer: trace._Tracer):
+    with pytest.raises(ZeroDivisionError):
+        with trace.span("broken"):
+            1 / 0  # pylint: disable=pointless-statement
+
+    assert tracer.phases["broken"].calls == 1
+    assert not tracer.open
@@ -1,27 +1,54 @@
 """pretty printing utilities for not"""
 from pathlib import Path
-from string import Formatter
 from textwrap import indent
-from typing import Any, Dict, Iterator, List, Set, Tuple, Union
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Collection,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
 
 import typer
 from click import Choice
-from slugify import slugify
 
 from .constants import LAZY_CONTEXT_PREFIX, MISSING_INFO_PALCEHOLDER
 from .filesystem import (
     collect_fancy_list_input,
-    deserialize_procedure_file,
     procedure_file_metadata,
     procedure_location,
     procedure_object_metadata,
+    shadowed_procedure_locations,
 )
 from .localization import polyglot as glot
-from .models import Procedure, context_var_name
+from .screen import Screen, style
+from .trace import span, traced
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .execution import Command
+    from .graph import StepGraph
+    from .history import Recorder
+    from .journal import Journal, Progress
+    from .models import Procedure
+    from .templates import StepTemplate
 
 WARNING_STYLE = {"fg": typer.colors.YELLOW}
+TITLE_STYLE = {"bold": True, "fg": typer.colors.MAGENTA}
+STEP_HEADER_STYLE = {"bg": typer.colors.WHITE, "fg": typer.colors.BLACK}
+STEP_STYLE = {"bold": True, "fg": typer.colors.BLUE}
+LAST_LINE_STYLE = {"bold": True, "fg": typer.colors.MAGENTA}
+FINALE_STYLE = {"fg": typer.colors.GREEN, "bold": True}
+DOSSIER_KEY_STYLE = {"fg": typer.colors.BRIGHT_BLUE}
+COMMAND_PREFIX_STYLE = {"fg": typer.colors.BRIGHT_BLACK}
+CRITICAL_STYLE = {"fg": typer.colors.RED}
 
 
+@traced("theatrics.marquis")
 def marquis(title, description):
     """A display of the title + description that
 
@@ -34,19 +61,16 @@ def marquis(title, description):
 
     border_length = max(len(title), len(description or "")) + 8
     border = "~" * border_length
-    styled_title = typer.style(f" {title} ", bold=True, fg=typer.colors.MAGENTA)
 
-    typer.echo(border)
-    typer.echo()
-    typer.echo(styled_title)
-    if description:
-        typer.echo(f"    '{description}' ")
-    typer.echo()
-    typer.echo(border)
-    typer.echo()
+    with Screen() as screen:
+        screen.line(border).line()
+        screen.line(f" {title} ", **TITLE_STYLE)
+        if description:
+            screen.line(f"    '{description}' ")
+        screen.line().line(border).line()
 
 
-# pylint: disable=no-self-use
+# pylint: disable=no-self-use,import-outside-toplevel
 class InterpolationStore:
     """Eventually provides access to the value of each variable provided
     in the `context` and `knowns` fields of a Procedure.
@@ -56,15 +80,35 @@ class InterpolationStore:
     Any keyname beginning with a __ is 'lazy'. The user is prompted for that before
     the first time it is referenced, then it's stored.
     The user is prompted for values of keys with regular during __init__.
-    Values from `knowns` are stored immediately."""
-
-    def __init__(self, procedure: Procedure):
-
-        self.procedure: Procedure = procedure
+    Values from `knowns` are stored immediately, as are `answers` already given in
+    an earlier run. Every new answer is recorded in the `journal`, if there is one,
+    and how long each step is on screen is recorded in the `history`."""
+
+    @traced("theatrics.InterpolationStore")
+    def __init__(
+        self,
+        procedure: "Procedure",
+        answers: Optional[Dict[str, str]] = None,
+        journal: Optional["Journal"] = None,
+        history: Optional["Recorder"] = None,
+    ):
+        from .models import context_var_name
+        from .templates import compile_steps
+
+        self.procedure: "Procedure" = procedure
         self.store: Dict[str, str] = {}
+        self.journal: Optional["Journal"] = journal
+        self.history: Optional["Recorder"] = history
+        self.context_by_name: Dict[str, Union[str, Dict]] = {
+            context_var_name(c): c for c in procedure.context
+        }
         self.requisite_names: Set = {
             *(next(iter(p.keys())) for p in procedure.knowns),
-            *(context_var_name(c) for c in procedure.context),
+            *self.context_by_name,
+        }
+        self.templates: List["StepTemplate"] = compile_steps(procedure)
+        self._templates_by_step: Dict[str, "StepTemplate"] = {
+            template.source: template for template in self.templates
         }
 
         if not self.requisite_names:
@@ -75,14 +119,16 @@ class InterpolationStore:
                 k, v = next(iter(known.items()))
                 self.store[k] = v
 
+        self.store.update(answers or {})
+
         eager_context_items = (
             item
-            for item in procedure.context
-            if not context_var_name(item).startswith(LAZY_CONTEXT_PREFIX)
+            for name, item in self.context_by_name.items()
+            if not name.startswith(LAZY_CONTEXT_PREFIX) and name not in self.store
         )
 
         for item in eager_context_items:
-            self.store[context_var_name(item)] = self.prompt_for_value(item)
+            self.remember(context_var_name(item), self.prompt_for_value(item))
 
     def prompt_for_value(self, item: Union[str, Dict]) -> str:
         """Either use the provided prompt to ask for a variables value, or ask
@@ -96,80 +142,342 @@ class InterpolationStore:
 
         return value
 
+    def remember(self, name: str, value: str) -> None:
+        """Store the answer for a variable, and journal it"""
+
+        self.store[name] = value
+        if self.journal is not None:
+            self.journal.answered(name, value)
+
+    def template_for(self, step: str) -> "StepTemplate":
+        """The compiled form of a step, compiling it now if it isn't one of the
+        Procedure's own"""
+
+        from .templates import StepTemplate
+
+        template = self._templates_by_step.get(step)
+
+        if template is None:
+            template = StepTemplate(step, self.context_by_name, self.requisite_names)
+
+        return template
+
     def get_interpolations(self, step: str, index: int) -> Dict:
         """Returns the dictionary of kwargs the step needs for .format()"""
 
-        key_names = self.get_format_names(step)
+        return self._interpolations(self.template_for(step), index)
+
+    def render(self, index: int) -> str:
+        """The step at `index`, with every variable filled in"""
+
+        template = self.templates[index]
+
+        return template.render(self._interpolations(template, index))
 
-        if not key_names.issubset(self.requisite_names):
-            warning = typer.style(
+    def _interpolations(self, template: "StepTemplate", index: int) -> Dict:
+        if template.undefined:
+            warning = style(
                 glot.localized("undefined_variable_warn", {"step_number": index + 1}),
                 **WARNING_STYLE,
             )
             typer.echo(warning)
             raise typer.Abort()
 
-        for key in key_names:
+        for key, context in template.context_items.items():
             if key not in self.store:
-                context: Union[str, Dict] = next(
-                    c for c in self.procedure.context if context_var_name(c) == key
-                )
-                self.store[key] = self.prompt_for_value(context)
+                self.remember(key, self.prompt_for_value(context))
 
-        return {k: v for k, v in self.store.items() if k in key_names}
+        return {key: self.store[key] for key in template.names}
 
     def get_format_names(self, text: str) -> Set[str]:
         """Return the names of any variables mentioned in the templates of `text`"""
 
-        formatter = Formatter()
+        from .templates import format_names
+
+        return format_names(text)
 
-        return set(
-            template_name
-            for _, template_name, _, _ in formatter.parse(text)
-            if template_name is not None
-        )
 
+def interactive_walkthrough(
+    procedure: "Procedure",
+    run: bool = False,
+    timeout: Optional[float] = None,
+    jobs: Optional[int] = None,
+    resume: bool = False,
+) -> None:
+    """Interactively walk through a Procedure. With `run`, commands at the end of
+    steps are run too, see execution.py. Every answer and every step done goes in
+    the run's journal, and with `resume` the last run that didn't finish picks up
+    where it left off, see journal.py. How long each step took goes in the history
+    for `not stats`, see history.py"""
 
-def interactive_walkthrough(procedure: Procedure) -> None:
-    """Interactively walk through a Procedure"""
+    from .graph import StepGraph
+    from .history import Recorder
+    from .journal import Journal
+
+    graph = StepGraph(procedure.steps)
 
     marquis(procedure.title, procedure.description)
 
-    store = InterpolationStore(procedure)
+    journal, progress = _open_journal(procedure, resume)
+    if journal is None:
+        if resume:
+            typer.echo(style(glot["nothing_to_resume_warn"], **WARNING_STYLE))
+        if procedure.path is not None:
+            journal = Journal.start(procedure.path)
+
+    history = (
+        Recorder.open(procedure.path, progress.steps)
+        if procedure.path is not None
+        else None
+    )
+
+    try:
+        store = InterpolationStore(procedure, progress.answers, journal, history)
+
+        if graph.declared:
+            scheduled_walkthrough(store, graph, run, timeout, jobs, progress.steps)
+        else:
+            sequential_walkthrough(store, run, timeout, jobs, progress.steps)
+
+        for record in (journal, history):
+            if record is not None:
+                record.finish()
+    finally:
+        for record in (journal, history):
+            if record is not None:
+                record.close()
 
-    typer.echo()
-    for i, step in enumerate(procedure.steps):
-        step_header = typer.style(
-            f"{glot['step_prefix']} {i}:", bg=typer.colors.WHITE, fg=typer.colors.BLACK
-        )
-        typer.echo(step_header)
 
-        interpolations = store.get_interpolations(step, i)
-        step_body = styled_step(step.format(**interpolations))
+def _open_journal(
+    procedure: "Procedure", resume: bool
+) -> Tuple[Optional["Journal"], "Progress"]:
+    """The journal of the run to resume and how far it got, if there's one"""
 
-        typer.echo(step_body)
+    from .journal import Journal, Progress, latest_unfinished, read_progress
+
+    fresh = None, Progress({}, set(), False)
+
+    if not resume or procedure.path is None:
+        return fresh
+
+    location = latest_unfinished(procedure.path)
+    if location is None:
+        return fresh
+
+    progress = read_progress(location)
+    remaining = [i for i in range(len(procedure.steps)) if i not in progress.steps]
+
+    with Screen() as screen:
+        screen.line(
+            glot.localized(
+                "resuming",
+                {
+                    "step": remaining[0] if remaining else len(procedure.steps),
+                    "answers": len(progress.answers),
+                },
+            ),
+            **WARNING_STYLE,
+        )
+
+    return Journal.reopen(location), progress
+
+
+def sequential_walkthrough(
+    store: InterpolationStore,
+    run: bool,
+    timeout: Optional[float],
+    jobs: Optional[int],
+    done: Collection[int] = (),
+) -> None:
+    """Walk through the steps of a Procedure one after the other, starting at the
+    first one that isn't `done` already"""
+
+    steps = store.procedure.steps
+    step_count = len(steps)
+    i = next((i for i in range(step_count) if i not in done), step_count)
+
+    while i < step_count:
+        # a run of independent steps is shown, and run, all at once
+        group = [i]
+        while (
+            run
+            and group[-1] + 1 < step_count
+            and is_independent(steps[i])
+            and is_independent(steps[group[-1] + 1])
+        ):
+            group.append(group[-1] + 1)
+
+        commands = []
+        for step in group:
+            rendered = show_step(store, step)
+            if run:
+                from .execution import command_for
+
+                command = command_for(step, rendered)
+                if command is not None:
+                    commands.append(command)
+
+        if commands:
+            run_step_commands(commands, timeout, jobs)
 
         input(glot["nag"])
-        typer.echo()
+        _acknowledge(store, group)
+        i += len(group)
+
+    with Screen() as screen:
+        screen.line().line(glot["completion_message"], **FINALE_STYLE)
+
+
+def scheduled_walkthrough(
+    store: InterpolationStore,
+    graph: "StepGraph",
+    run: bool,
+    timeout: Optional[float],
+    jobs: Optional[int],
+    done: Collection[int] = (),
+) -> None:
+    """Walk through a Procedure whose steps declare what they come after. Every step
+    that's ready goes on screen at once, as a checklist, and with `run` all their
+    commands run at once too. Steps on the critical path are starred. Steps that
+    are `done` already are skipped."""
+
+    critical_path = graph.critical_path()
+    on_critical_path = set(critical_path)
+    graph.finish(sorted(done))
+
+    with Screen() as screen:
+        screen.line().line(
+            glot.localized(
+                "critical_path",
+                {
+                    "path": " → ".join(map(str, critical_path)),
+                    "length": len(critical_path),
+                    "count": len(graph.dependencies),
+                },
+            ),
+            **CRITICAL_STYLE,
+        )
+
+    while not graph.done:
+        ready = graph.ready()
+        commands = []
+
+        if len(ready) > 1:
+            with Screen() as screen:
+                screen.line().line(
+                    glot.localized(
+                        "ready_steps", {"steps": ", ".join(map(str, ready))}
+                    ),
+                    bold=True,
+                )
+
+        for step in ready:
+            rendered = show_step(store, step, critical=step in on_critical_path)
+            if run:
+                from .execution import command_for
+
+                command = command_for(step, rendered)
+                if command is not None:
+                    commands.append(command)
+
+        if commands:
+            run_step_commands(commands, timeout, jobs)
+
+        input(glot["nag"] if len(ready) == 1 else glot["checklist_nag"])
+        _acknowledge(store, ready)
+        graph.finish(ready)
+
+    with Screen() as screen:
+        screen.line().line(glot["completion_message"], **FINALE_STYLE)
+
+
+def _acknowledge(store: InterpolationStore, steps: List[int]) -> None:
+    for record in (store.journal, store.history):
+        if record is not None:
+            record.acknowledged(steps)
+
+
+def show_step(store: InterpolationStore, index: int, critical: bool = False) -> str:
+    """Show a step with its header, returning the step as rendered"""
+
+    with Screen() as screen:
+        # the blank line that follows the marquis, or the last step's nag
+        screen.line().add(f"{glot['step_prefix']} {index}:", **STEP_HEADER_STYLE)
+        if critical:
+            screen.add(" *", **CRITICAL_STYLE)
+        screen.line()
+
+    # rendering can prompt for lazy context, which goes under the header
+    with span("theatrics.render_step"):
+        rendered = store.render(index)
+        step_body = styled_step(rendered)
+
+    with span("theatrics.echo"), Screen() as screen:
+        screen.line(step_body)
+
+    if store.history is not None:
+        store.history.shown(index)
+
+    return rendered
+
 
-    finale = typer.style(glot["completion_message"], fg=typer.colors.GREEN, bold=True)
-    typer.echo(finale)
+def is_independent(step: str) -> bool:
+    """Whether a step's command is marked as safe to run alongside its neighbours.
+    Variables can't add or take away the markers, so the raw step will do."""
+
+    from .execution import command_for
+
+    command = command_for(0, step)
+
+    return command is not None and command.independent
+
+
+def run_step_commands(
+    commands: List["Command"], timeout: Optional[float], jobs: Optional[int]
+) -> None:
+    """Run the commands, streaming their output, and ask whether to go on if any of
+    them didn't work out"""
+
+    from .execution import run_commands
+
+    concurrent = len(commands) > 1
+
+    def on_line(step: int, line: str, err: bool) -> None:
+        prefix = style(f"[{glot['step_prefix']} {step}] ", **COMMAND_PREFIX_STYLE)
+        typer.echo(prefix + line if concurrent else line, err=err)
+
+    with span("execution.run_commands"):
+        results = run_commands(commands, on_line, timeout, jobs)
+
+    for result in results:
+        if result.ok:
+            continue
+
+        warning = (
+            glot.localized(
+                "command_timed_out_warn", {"step": result.step, "timeout": timeout}
+            )
+            if result.timed_out
+            else glot.localized(
+                "command_failed_warn",
+                {"step": result.step, "code": result.returncode},
+            )
+        )
+        typer.confirm(style(warning, **WARNING_STYLE), abort=True)
 
 
 def styled_step(step_body: str) -> str:
     """Bold the incoming text and color the last line if there are more than 1 lines"""
 
     lines = step_body.split("\n")
-    regular_line_style = {"bold": True, "fg": typer.colors.BLUE}
-    last_line_style = {"bold": True, "fg": typer.colors.MAGENTA}
 
     if len(lines) > 1:
-        last_line = typer.style(lines.pop(), **last_line_style)
-        styled_lines = [typer.style(line, **regular_line_style) for line in lines]
+        last_line = style(lines.pop(), **LAST_LINE_STYLE)
+        styled_lines = [style(line, **STEP_STYLE) for line in lines]
 
         return "\n".join([*styled_lines, last_line]) + "\n"
 
-    return typer.style(step_body, **regular_line_style) + "\n"
+    return style(step_body, **STEP_STYLE) + "\n"
 
 
 def multiprompt(*prompts: Tuple[str, Dict]) -> Iterator[Any]:
@@ -188,6 +496,8 @@ def prompt_for_new_args(
 ) -> Iterator[Any]:
     """Prompt for all arguments needed to perform `not do`"""
 
+    from slugify import slugify
+
     title = ask(glot["new_title_prompt"])
     name = slugify(title) if name is None else name
 
@@ -208,34 +518,33 @@ def prompt_for_new_args(
     return (title, *multiprompt(*prompts))
 
 
+@traced("theatrics.show_fancy_list")
 def show_fancy_list():
     """Show a pretty output of the Procedure files contained in the specified dir."""
 
     procedure_names_by_directory: Dict = collect_fancy_list_input()
 
-    typer.echo()
-    for base_dir, procedure_names in procedure_names_by_directory.items():
-        header = typer.style(
-            f"[ {glot['GLOBAL'] if base_dir == 'global' else glot['LOCAL']} ]\n",
-            typer.colors.BRIGHT_BLUE,
-        )
-        typer.echo(header)
-
-        names_count = len(procedure_names)
+    with Screen() as screen:
+        screen.line()
+        for base_dir, procedure_names in procedure_names_by_directory.items():
+            screen.line(
+                f"[ {glot['GLOBAL'] if base_dir == 'global' else glot['LOCAL']} ]\n",
+                fg=typer.colors.BRIGHT_BLUE,
+            )
 
-        for i, name in enumerate(procedure_names):
-            typer.echo(indent(name, " " * 4))
+            for name in procedure_names:
+                screen.line(indent(name, " " * 4))
 
-            if i == names_count - 1:
+            if procedure_names:
                 # newline after the last item
-                typer.echo()
+                screen.line()
 
 
 def confirm_overwrite(procedure_name) -> bool:
     """Prompt y/n when user is attempting to create a Procedure with the same
     name as an existing one"""
 
-    existence_warning = typer.style(
+    existence_warning = style(
         glot.localized("overwrite_warn", {"name": procedure_name}), **WARNING_STYLE
     )
 
@@ -245,7 +554,7 @@ def confirm_overwrite(procedure_name) -> bool:
 def confirm_drop(procedure_name) -> bool:
     """Prompt y/n when user is about to delete a Procedure file"""
 
-    drop_is_destructive_warning = typer.style(
+    drop_is_destructive_warning = style(
         glot.localized("drop_warn", {"name": procedure_name}), **WARNING_STYLE
     )
 
@@ -255,17 +564,15 @@ def confirm_drop(procedure_name) -> bool:
 def success(message) -> None:
     """Echo the message with a stylish interjection above it"""
 
-    stylish_interjection = typer.style(
-        glot["stylish_interjection"], fg=typer.colors.GREEN
-    )
-    typer.echo(stylish_interjection)
-    typer.echo(message)
+    with Screen() as screen:
+        screen.line(glot["stylish_interjection"], fg=typer.colors.GREEN)
+        screen.line(message)
 
 
 def ask(question, **prompt_kwargs) -> Any:
     """Prompt the user with a question"""
 
-    styled_question = typer.style(question, fg=typer.colors.BRIGHT_BLACK)
+    styled_question = style(question, fg=typer.colors.BRIGHT_BLACK)
     answer = typer.prompt(styled_question, **prompt_kwargs)
 
     return answer
@@ -275,15 +582,15 @@ def config_exists_warn(warning):
     """Inform user that the file exists.
     Suggest they delete it if they want a new one"""
 
-    message = typer.style(warning, **WARNING_STYLE)
-    typer.echo("⚠️  " + message)
-    typer.echo(glot["delete_suggestion"])
+    with Screen() as screen:
+        screen.add("⚠️  ").line(warning, **WARNING_STYLE)
+        screen.line(glot["delete_suggestion"])
 
 
 def warn_missing_file(name):
     """A generic warning when a Procedure with the specified name does not exist"""
 
-    message = typer.style(
+    message = style(
         glot.localized("missing_file_warn", {"name": name}), **WARNING_STYLE
     )
     typer.echo(message)
@@ -301,6 +608,7 @@ def justified_with_colons(*strings) -> List[str]:
     return [string.ljust(width, " ") + ": " for string in strings]
 
 
+@traced("theatrics.show_dossier")
 def show_dossier(procedure_name):
     """A pretty-printed overview of some Procedure metadata"""
 
@@ -310,15 +618,13 @@ def show_dossier(procedure_name):
         warn_missing_file(procedure_name)
         return
 
-    procedure: Procedure = deserialize_procedure_file(file_location)
-
     file_meta = procedure_file_metadata(file_location)
-    obj_meta = procedure_object_metadata(procedure)
+    obj_meta = procedure_object_metadata(file_location)
 
-    title = typer.style(obj_meta["title"], bold=True)
+    title = style(obj_meta["title"], bold=True)
 
     colored_keys = (
-        typer.style(field, fg=typer.colors.BRIGHT_BLUE)
+        style(field, **DOSSIER_KEY_STYLE)
         for field in justified_with_colons(
             glot["title_descriptor"],
             glot["description_descriptor"],
@@ -338,12 +644,94 @@ def show_dossier(procedure_name):
         obj_meta["step_count"],
         obj_meta["context_vars"] or MISSING_INFO_PALCEHOLDER,
         # knowns will look like [ name=value, other_name=other_value ] etc
-        ["=".join(k.popitem()) for k in obj_meta["knowns"]] or MISSING_INFO_PALCEHOLDER,
+        ["=".join(map(str, *k.items())) for k in obj_meta["knowns"]]
+        or MISSING_INFO_PALCEHOLDER,
         file_meta["last_accessed"],
         file_meta["last_modified"],
     )
 
-    for field, _value in zip(colored_keys, meta_values):
-        # strip the quotes off any list items for human-ness
-        value = f'[ {", ".join(_value)} ]' if isinstance(_value, list) else _value
-        typer.echo(f"{field} {value}")
+    with Screen() as screen:
+        for field, _value in zip(colored_keys, meta_values):
+            # strip the quotes off any list items for human-ness
+            value = f'[ {", ".join(_value)} ]' if isinstance(_value, list) else _value
+            screen.line(f"{field} {value}")
+
+        for shadowed in shadowed_procedure_locations(procedure_name):
+            screen.line(
+                glot.localized("shadowed_warn", {"location": shadowed}),
+                **WARNING_STYLE,
+            )
+
+
+def show_stats(procedure_name):
+    """How long each step of a Procedure takes, and where runs of it get given up,
+    from every walkthrough of it so far"""
+
+    from .history import procedure_stats
+
+    file_location: Path = procedure_location(procedure_name)
+
+    if file_location is None:
+        warn_missing_file(procedure_name)
+        raise typer.Abort()
+
+    stats = procedure_stats(file_location)
+
+    if stats is None:
+        typer.echo(
+            style(
+                glot.localized("no_history_warn", {"name": procedure_name}),
+                **WARNING_STYLE,
+            )
+        )
+        return
+
+    rows = [
+        (glot["stats_step_column"], glot["stats_runs_column"], "p50", "p95"),
+        *(
+            (str(s.step), str(s.count), duration(s.p50), duration(s.p95))
+            for s in stats.steps
+        ),
+    ]
+    widths = [max(len(row[column]) for row in rows) for column in range(4)]
+
+    with Screen() as screen:
+        screen.line(
+            glot.localized(
+                "stats_runs", {"runs": stats.runs, "completed": stats.completed}
+            ),
+            bold=True,
+        ).line()
+
+        for i, row in enumerate(rows):
+            line = "  ".join(cell.ljust(width) for cell, width in zip(row, widths))
+            screen.line(line.rstrip(), **(DOSSIER_KEY_STYLE if not i else {}))
+
+        if stats.abandoned:
+            points = ", ".join(
+                glot.localized("stats_abandoned_point", {"step": step, "count": count})
+                for step, count in sorted(
+                    stats.abandoned.items(), key=lambda item: -item[1]
+                )
+            )
+            screen.line().line(
+                glot.localized("stats_abandoned", {"points": points}),
+                **WARNING_STYLE,
+            )
+
+
+def duration(seconds: float) -> str:
+    """A length of time, about as precisely as a person cares about"""
+
+    if seconds < 10:
+        return f"{seconds:.1f}s"
+    if seconds < 60:
+        return f"{seconds:.0f}s"
+
+    minutes, seconds = divmod(round(seconds), 60)
+    if minutes < 60:
+        return f"{minutes}m {seconds:02d}s"
+
+    hours, minutes = divmod(minutes, 60)
+
+    return f"{hours}h {minutes:02d}m"
@@ -0,0 +1,216 @@
+"""Where the time (and memory) of a run of `not` goes.
+
+Set NOT_TRACE to turn it on: `1` or `-` prints a JSON report to stderr when `not`
+exits, anything else is taken as a file to write it to. NOT_TRACE_MEMORY=1 adds
+the peak memory of each phase, by way of tracemalloc, which slows everything down.
+`not --trace` does the same as NOT_TRACE=1.
+
+Phases are marked with span() or @traced. For each one the report has how many
+times it ran and the wall time it took, nested phases counting toward their
+parents too. Turned off, a span is one global lookup and a shared no-op context
+manager, so they can go anywhere."""
+import atexit
+import json
+import os
+import sys
+from functools import wraps
+from time import perf_counter, process_time
+from typing import Callable, Dict, List, Optional, TypeVar
+
+TRACE_VAR = "NOT_TRACE"
+TRACE_MEMORY_VAR = "NOT_TRACE_MEMORY"
+
+F = TypeVar("F", bound=Callable)
+
+
+class _Phase:
+    __slots__ = ("calls", "seconds", "peak")
+
+    def __init__(self):
+        self.calls: int = 0
+        self.seconds: float = 0.0
+        self.peak: Optional[int] = None  # bytes, over whatever was allocated already
+
+
+class _Tracer:
+    """What gets recorded while tracing is on"""
+
+    def __init__(self, destination: str, memory: bool):
+        self.destination: str = destination
+        self.memory: bool = memory
+        self.started: float = perf_counter()
+        # CPU time already spent by the time tracing started, mostly importing
+        self.startup: float = process_time()
+        self.phases: Dict[str, _Phase] = {}
+        self.open: List["_Span"] = []
+
+        if memory:
+            import tracemalloc  # pylint: disable=import-outside-toplevel
+
+            tracemalloc.start()
+
+    def fold_peak(self) -> None:
+        """Credit the memory peak since the last call to every open span"""
+
+        if not self.memory:
+            return
+
+        import tracemalloc  # pylint: disable=import-outside-toplevel
+
+        peak = tracemalloc.get_traced_memory()[1]
+        for span_ in self.open:
+            span_.peak = max(span_.peak, peak - span_.base)
+
+        if hasattr(tracemalloc, "reset_peak"):  # 3.9+. before that peaks only grow
+            tracemalloc.reset_peak()
+
+    def report(self) -> Dict:
+        """Everything recorded so far, ready for json.dumps"""
+
+        return {
+            "seconds": perf_counter() - self.started,
+            "startup_cpu_seconds": self.startup,
+            "argv": sys.argv,
+            "phases": {
+                name: {
+                    "calls": phase.calls,
+                    "seconds": phase.seconds,
+                    **({} if phase.peak is None else {"peak_bytes": phase.peak}),
+                }
+                for name, phase in sorted(
+                    self.phases.items(), key=lambda item: -item[1].seconds
+                )
+            },
+        }
+
+    def write(self) -> None:
+        """Hand the report over to stderr or the file it was asked for in"""
+
+        report = json.dumps(self.report(), indent=2)
+
+        if self.destination in ("1", "-"):
+            print(report, file=sys.stderr)
+            return
+
+        try:
+            with open(self.destination, "w") as file:
+                file.write(report + "\n")
+        except OSError as err:
+            message = f"{TRACE_VAR}: couldn't write {self.destination}: {err}"
+            print(message, file=sys.stderr)
+
+
+class _Span:
+    __slots__ = ("name", "started", "base", "peak")
+
+    def __init__(self, name: str):
+        self.name: str = name
+
+    def __enter__(self) -> "_Span":
+        tracer = _tracer
+        if tracer.memory:
+            import tracemalloc  # pylint: disable=import-outside-toplevel
+
+            tracer.fold_peak()
+            self.base = tracemalloc.get_traced_memory()[0]
+            self.peak = 0
+        tracer.open.append(self)
+        self.started = perf_counter()
+
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        seconds = perf_counter() - self.started
+        tracer = _tracer
+        tracer.fold_peak()
+        tracer.open.remove(self)
+
+        phase = tracer.phases.get(self.name)
+        if phase is None:
+            phase = tracer.phases[self.name] = _Phase()
+        phase.calls += 1
+        phase.seconds += seconds
+        if tracer.memory:
+            phase.peak = max(phase.peak or 0, self.peak)
+
+
+class _NoSpan:
+    """What span() hands out while tracing is off"""
+
+    __slots__ = ()
+
+    def __enter__(self) -> "_NoSpan":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        pass
+
+
+_NO_SPAN = _NoSpan()
+_tracer: Optional[_Tracer] = None
+
+
+def enabled() -> bool:
+    """Whether anything is being recorded"""
+
+    return _tracer is not None
+
+
+def enable(destination: str = "-", memory: Optional[bool] = None) -> None:
+    """Start recording, and write the report when the process exits.
+    `memory` defaults to whatever NOT_TRACE_MEMORY says"""
+
+    global _tracer  # pylint: disable=global-statement
+
+    if _tracer is not None:
+        return
+
+    if memory is None:
+        memory = os.environ.get(TRACE_MEMORY_VAR) == "1"
+
+    _tracer = _Tracer(destination, memory)
+    atexit.register(_tracer.write)
+
+
+def finish() -> None:
+    """Write the report now rather than at exit, and stop recording. For a process
+    that outlives what was traced, like `not serve`"""
+
+    global _tracer  # pylint: disable=global-statement
+
+    if _tracer is None:
+        return
+
+    atexit.unregister(_tracer.write)
+    _tracer.write()
+    _tracer = None
+
+
+def span(name: str):
+    """A context manager timing whatever happens inside it as the phase `name`"""
+
+    if _tracer is None:
+        return _NO_SPAN
+
+    return _Span(name)
+
+
+def traced(name: str) -> Callable[[F], F]:
+    """Decorate a function so every call to it is a span"""
+
+    def decorate(func: F) -> F:
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            if _tracer is None:
+                return func(*args, **kwargs)
+
+            with _Span(name):
+                return func(*args, **kwargs)
+
+        return wrapper  # type: ignore
+
+    return decorate
+
+
+if os.environ.get(TRACE_VAR):
+    enable(os.environ[TRACE_VAR])
@@ -0,0 +1,248 @@
+"""Noticing when Procedure files change, for processes that stick around.
+
+On Linux the kernel says what changed, by way of inotify, so finding out costs
+nothing until something actually does change. Everywhere else, or when inotify
+isn't available (or NOT_WATCH_POLLING is set), the directories are listed and
+every file is stat'ed each time changes are asked for. That's still no parsing,
+just a stat per file.
+
+Either way a watcher hands back the paths that changed: created, written, moved
+or deleted. Whether a path still exists is for whoever asked to check.
+
+A directory that doesn't exist yet, or goes away, is still followed: inotify
+watches its parent until it's (re)created, then the directory itself again."""
+import ctypes
+import os
+import select
+import struct
+import sys
+from pathlib import Path
+from typing import Dict, Iterable, List, NamedTuple, Optional, Set, Tuple
+
+from .constants import WATCH_POLLING_VAR
+
+# from <sys/inotify.h>
+IN_ATTRIB = 0x00000004
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_MOVE_SELF = 0x00000800
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ONLYDIR = 0x01000000
+IN_NONBLOCK = os.O_NONBLOCK
+IN_CLOEXEC = 0o2000000
+
+WATCH_MASK = (
+    IN_CLOSE_WRITE
+    | IN_ATTRIB
+    | IN_MOVED_FROM
+    | IN_MOVED_TO
+    | IN_CREATE
+    | IN_DELETE
+    | IN_DELETE_SELF
+    | IN_MOVE_SELF
+    | IN_ONLYDIR
+)
+# the directory itself went away or moved. everything in it has to be looked at
+LOST_DIRECTORY = IN_DELETE_SELF | IN_MOVE_SELF | IN_IGNORED
+# what happens in the parent of a directory that's missing, for it to turn up
+PARENT_MASK = IN_CREATE | IN_MOVED_TO | IN_ONLYDIR
+
+EVENT_HEADER = struct.Struct("iIII")  # wd, mask, cookie, len. then the name
+READ_SIZE = 64 * 1024
+
+
+class Changes(NamedTuple):
+    paths: Set[Path]
+    rescan: bool = False  # too much happened to say what. look at everything again
+
+
+class PollingWatcher:
+    """Finds changes by comparing a stat of every file with the last one"""
+
+    def __init__(self, directories: Iterable[Path]):
+        self.directories: Tuple[Path, ...] = tuple(directories)
+        self.seen: Dict[Path, Tuple[int, int, int]] = self._look()
+
+    def _look(self) -> Dict[Path, Tuple[int, int, int]]:
+        seen = {}
+
+        for directory in self.directories:
+            try:
+                entries = list(os.scandir(str(directory)))
+            except OSError:
+                continue
+
+            for entry in entries:
+                try:
+                    stat = entry.stat()
+                except OSError:  # gone already
+                    continue
+                if entry.is_file():
+                    seen[directory / entry.name] = (
+                        stat.st_mtime_ns,
+                        stat.st_size,
+                        stat.st_ino,
+                    )
+
+        return seen
+
+    def changes(self, timeout: float = 0.0) -> Changes:
+        """What changed since the last call. Doesn't wait on anything, `timeout`
+        is only there to look like InotifyWatcher"""
+
+        seen, self.seen = self.seen, self._look()
+
+        return Changes(
+            {
+                path
+                for path in seen.keys() | self.seen.keys()
+                if seen.get(path) != self.seen.get(path)
+            }
+        )
+
+    def close(self) -> None:
+        """Nothing to let go of"""
+
+
+class InotifyWatcher:
+    """Has the kernel say what changed, Linux only"""
+
+    def __init__(self, directories: Iterable[Path]):
+        self.libc = _libc()
+        self.fd: int = self.libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+
+        self.directories: Dict[int, Path] = {}
+        # the parents of missing directories: the directories waiting in each
+        self.parents: Dict[int, List[Path]] = {}
+        for directory in directories:
+            self._watch(directory)
+
+    def _add_watch(self, path: Path, mask: int) -> int:
+        return self.libc.inotify_add_watch(self.fd, os.fsencode(str(path)), mask)
+
+    def _watch(self, directory: Path) -> bool:
+        """Watch a directory, or its parent for it to turn up if it's missing.
+        Returns whether the directory itself is watched"""
+
+        descriptor = self._add_watch(directory, WATCH_MASK)
+        if descriptor >= 0:
+            self.directories[descriptor] = directory
+            return True
+
+        # a missing parent too is more than anybody is asking to follow
+        descriptor = self._add_watch(directory.parent, PARENT_MASK)
+        if descriptor < 0:
+            return False
+
+        self.parents.setdefault(descriptor, []).append(directory)
+        # in case it turned up before its parent was watched
+        return directory.is_dir() and self._appeared(descriptor, directory.name)
+
+    def changes(self, timeout: float = 0.0) -> Changes:
+        """What changed since the last call, waiting up to `timeout` seconds for
+        anything at all to happen"""
+
+        if timeout and not select.select([self.fd], [], [], timeout)[0]:
+            return Changes(set())
+
+        paths: Set[Path] = set()
+        lost: List[Path] = []
+        rescan = False
+
+        for descriptor, mask, name in self._events():
+            if mask & IN_Q_OVERFLOW:
+                rescan = True
+            elif descriptor in self.directories:
+                if mask & LOST_DIRECTORY:
+                    # a moved directory is still watched where it went, unless
+                    # told otherwise. a deleted one isn't, so this just fails
+                    self.libc.inotify_rm_watch(self.fd, descriptor)
+                    lost.append(self.directories.pop(descriptor))
+                    rescan = True
+                elif name:
+                    paths.add(self.directories[descriptor] / name)
+            elif descriptor in self.parents:
+                rescan = self._appeared(descriptor, name) or rescan
+
+        for directory in lost:
+            self._watch(directory)
+
+        return Changes(paths, rescan)
+
+    def _appeared(self, parent: int, name: str) -> bool:
+        """Start watching the missing directory called `name` that just turned up
+        in a parent, returning whether there was one. The parent stops being
+        watched once nothing in it is missing"""
+
+        waiting = self.parents[parent]
+        appeared = False
+
+        for directory in [d for d in waiting if d.name == name]:
+            descriptor = self._add_watch(directory, WATCH_MASK)
+            if descriptor >= 0:  # it might be gone again already
+                self.directories[descriptor] = directory
+                waiting.remove(directory)
+                appeared = True
+
+        if not waiting:
+            del self.parents[parent]
+            self.libc.inotify_rm_watch(self.fd, parent)
+
+        return appeared
+
+    def _events(self) -> List[Tuple[int, int, str]]:
+        events = []
+
+        while True:
+            try:
+                buffer = os.read(self.fd, READ_SIZE)
+            except BlockingIOError:
+                return events
+
+            offset = 0
+            while offset < len(buffer):
+                descriptor, mask, _, length = EVENT_HEADER.unpack_from(buffer, offset)
+                offset += EVENT_HEADER.size
+                name = buffer[offset : offset + length].rstrip(b"\0")  # noqa: E203
+                offset += length
+                events.append((descriptor, mask, os.fsdecode(name)))
+
+    def close(self) -> None:
+        """Stop watching"""
+
+        if self.fd >= 0:
+            os.close(self.fd)
+            self.fd = -1
+
+
+def _libc():
+    libc = ctypes.CDLL(None, use_errno=True)  # whatever libc python itself uses
+    if not hasattr(libc, "inotify_init1"):
+        raise OSError("no inotify")
+
+    return libc
+
+
+def watcher_for(directories: Iterable[Path], polling: Optional[bool] = None):
+    """An InotifyWatcher if that works here, a PollingWatcher if not. `polling`
+    defaults to whatever NOT_WATCH_POLLING says"""
+
+    directories = tuple(directories)
+
+    if polling is None:
+        polling = bool(os.environ.get(WATCH_POLLING_VAR))
+
+    if not polling and sys.platform.startswith("linux"):
+        try:
+            return InotifyWatcher(directories)
+        except OSError:
+            pass
+
+    return PollingWatcher(directories)
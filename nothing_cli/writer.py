@@ -1,28 +1,27 @@
 """Create Procedure Files from Procedure objects"""
 from typing import Dict
 
-from ruamel.yaml import YAML
-from ruamel.yaml.scalarstring import LiteralScalarString
-
+from . import backends, filesystem
 from .constants import STEP_SEPARATOR
 from .localization import polyglot as glot
 from .models import Procedure
-
-yaml = YAML()
-yaml.indent(mapping=2, sequence=4, offset=2)
+from .trace import traced
 
 
+@traced("writer.write")
 def write(procedure: Procedure, force: bool = False):
-    """Output the YAML representation of a Procedure object
-    to a file in destination_dir"""
+    """Output a Procedure object to its path, in whichever format
+    the extension of the path calls for, and add it to the catalog"""
 
+    backend = backends.for_path(procedure.path)
     procedure.path.touch(exist_ok=force)
 
     writable_procedure: Dict = procedure.dict(exclude={"path"}, exclude_defaults=True)
-    writable_procedure["steps"] = LiteralScalarString(
-        STEP_SEPARATOR.join(step for step in procedure.steps).rstrip()
-    )
-    yaml.dump(writable_procedure, procedure.path)
+    writable_procedure["steps"] = STEP_SEPARATOR.join(
+        step for step in procedure.steps
+    ).rstrip()
+    procedure.path.write_bytes(backend.dump(writable_procedure))
+    filesystem.catalog().add(procedure.path)
 
 
 def write_easter(destination):